@@ -2,7 +2,6 @@
 User model and authentication classes.
 """
 
-import hashlib
 import secrets
 import uuid
 from datetime import datetime, timedelta
@@ -10,6 +9,7 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 
 from .base import BaseModel
+from ..utils.crypto import hash_password, verify_password
 
 class UserRole(Enum):
     """User roles for access control."""
@@ -52,11 +52,8 @@ class User(BaseModel):
         self.password_reset_expires = None
     
     def _hash_password(self, password: str) -> str:
-        """Hash password using PBKDF2 with salt."""
-        salt = secrets.token_hex(16)
-        pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), 
-                                      salt.encode('utf-8'), 100000)
-        return f"{salt}:{pwd_hash.hex()}"
+        """Hash password with argon2 when available, otherwise PBKDF2 with salt."""
+        return hash_password(password)
     
     def _generate_token(self) -> str:
         """Generate a secure random token."""
@@ -64,16 +61,7 @@ class User(BaseModel):
     
     def verify_password(self, password: str) -> bool:
         """Verify password against hash."""
-        if not self.password_hash:
-            return False
-        
-        try:
-            salt, stored_hash = self.password_hash.split(':')
-            pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'),
-                                          salt.encode('utf-8'), 100000)
-            return pwd_hash.hex() == stored_hash
-        except ValueError:
-            return False
+        return verify_password(self.password_hash, password)
     
     def set_password(self, password: str):
         """Set new password."""
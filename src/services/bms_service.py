@@ -3,19 +3,39 @@ Business Management System service layer.
 Contains business logic and orchestrates data operations.
 """
 
-from typing import List, Dict, Any, Optional
+import time
+from functools import wraps
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from ..models import Handover, Requirement, Issue, TestSuite
 from .database import DatabaseManager
 from ..config import StatusOptions, PriorityOptions, IssueTypes
 
+# How long a fetch_all result is reused; writes made through this service clear it sooner
+_FETCH_CACHE_TTL_SECONDS = 30.0
+# Distinct filter combinations kept before the cache is emptied
+_FETCH_CACHE_MAX_ENTRIES = 32
+
+def _invalidates_cache(method):
+    """Clear the service's fetch_all cache once a write method has run."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._fetch_cache.clear()
+    return wrapper
+
 class BMSService:
     """Main service class for BMS business logic."""
     
     def __init__(self, db_manager: DatabaseManager = None):
         self.db = db_manager or DatabaseManager()
+        # DatabaseManager.fetch_all results by active filters: (read time, data)
+        self._fetch_cache: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
     
     # Handover operations
+    @_invalidates_cache
     def create_handover(self, from_team: str, to_team: str, date: str, 
                        description: str = "", documents: List[str] = None, 
                        status: str = StatusOptions.HandoverStatus.PENDING.value) -> str:
@@ -30,6 +50,7 @@ class BMSService:
         )
         return self.db.add_handover(handover)
     
+    @_invalidates_cache
     def update_handover(self, handover_id: str, **kwargs) -> bool:
         """Update an existing handover."""
         try:
@@ -54,11 +75,13 @@ class BMSService:
         """Get handovers with optional filtering."""
         return self.db.get_handovers(status_filter)
     
+    @_invalidates_cache
     def delete_handover(self, handover_id: str) -> bool:
         """Delete a handover."""
         return self.db.delete_handover(handover_id)
     
     # Requirement operations
+    @_invalidates_cache
     def create_requirement(self, title: str, description: str = "", change_date: str = "",
                           priority: str = PriorityOptions.RequirementPriority.MEDIUM.value,
                           status: str = StatusOptions.RequirementStatus.NEW.value) -> str:
@@ -72,6 +95,7 @@ class BMSService:
         )
         return self.db.add_requirement(requirement)
     
+    @_invalidates_cache
     def update_requirement(self, requirement_id: str, **kwargs) -> bool:
         """Update an existing requirement."""
         try:
@@ -97,11 +121,13 @@ class BMSService:
         """Get requirements with optional filtering."""
         return self.db.get_requirements(status_filter, priority_filter)
     
+    @_invalidates_cache
     def delete_requirement(self, requirement_id: str) -> bool:
         """Delete a requirement."""
         return self.db.delete_requirement(requirement_id)
     
     # Issue operations
+    @_invalidates_cache
     def create_issue(self, title: str, description: str = "", 
                     issue_type: str = IssueTypes.INFRASTRUCTURE.value,
                     priority: str = PriorityOptions.IssuePriority.MEDIUM.value,
@@ -118,6 +144,7 @@ class BMSService:
         )
         return self.db.add_issue(issue)
     
+    @_invalidates_cache
     def update_issue(self, issue_id: str, **kwargs) -> bool:
         """Update an existing issue."""
         try:
@@ -144,11 +171,13 @@ class BMSService:
         """Get issues with optional filtering."""
         return self.db.get_issues(type_filter, status_filter, priority_filter)
     
+    @_invalidates_cache
     def delete_issue(self, issue_id: str) -> bool:
         """Delete an issue."""
         return self.db.delete_issue(issue_id)
     
     # Test Suite operations
+    @_invalidates_cache
     def create_test_suite(self, name: str, last_run: str = "",
                          status: str = StatusOptions.TestSuiteStatus.NOT_RUN.value,
                          failures: int = 0, fix_notes: str = "") -> str:
@@ -162,6 +191,7 @@ class BMSService:
         )
         return self.db.add_test_suite(test_suite)
     
+    @_invalidates_cache
     def update_test_suite(self, test_suite_id: str, **kwargs) -> bool:
         """Update an existing test suite."""
         try:
@@ -186,6 +216,7 @@ class BMSService:
         """Get test suites with optional filtering."""
         return self.db.get_test_suites(status_filter)
     
+    @_invalidates_cache
     def delete_test_suite(self, test_suite_id: str) -> bool:
         """Delete a test suite."""
         return self.db.delete_test_suite(test_suite_id)
@@ -201,16 +232,60 @@ class BMSService:
     # Dashboard operations
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Get dashboard statistics and recent activities."""
-        all_handovers = self.db.get_handovers()
-        all_requirements = self.db.get_requirements()
-        all_issues = self.db.get_issues()
-        all_test_suites = self.db.get_test_suites()
-        recent_activities = self.db.get_recent_activities(5)
+        data = self._cached_fetch_all()
+        return self._dashboard_data(data)
+    
+    def fetch_all(self, filters: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Get the filtered list for every tab and the dashboard data in one database read.
+        
+        Args:
+            filters: Filter values keyed like get_filter_options; missing or "All" means unfiltered
+            
+        Returns:
+            Dict with 'handovers', 'requirements', 'issues' and 'test_suites' as lists of
+            dicts, and 'dashboard' as returned by get_dashboard_data
+        """
+        data = self._cached_fetch_all(filters)
+        return {
+            'handovers': data['handovers'],
+            'requirements': data['requirements'],
+            'issues': data['issues'],
+            'test_suites': data['test_suites'],
+            'dashboard': self._dashboard_data(data),
+        }
+    
+    def invalidate_cache(self):
+        """Forget cached reads, e.g. after the database was changed outside this service."""
+        self._fetch_cache.clear()
+    
+    def _cached_fetch_all(self, filters: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Get DatabaseManager.fetch_all results, reusing a read of the same filters from the last TTL."""
+        # "All" and missing filters read the same rows, so they share an entry
+        key = tuple(sorted((name, value) for name, value in (filters or {}).items()
+                           if value and value != "All"))
+        now = time.monotonic()
+        cached = self._fetch_cache.get(key)
+        if cached is not None and now - cached[0] < _FETCH_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        data = self.db.fetch_all(filters)
+        if len(self._fetch_cache) >= _FETCH_CACHE_MAX_ENTRIES:
+            self._fetch_cache.clear()
+        self._fetch_cache[key] = (now, data)
+        return data
+    
+    def _dashboard_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the dashboard statistics from DatabaseManager.fetch_all rows."""
+        all_handovers = data['all_handovers']
+        all_requirements = data['all_requirements']
+        all_issues = data['all_issues']
+        all_test_suites = data['all_test_suites']
         
         # Calculate statistics
-        pending_handovers = len([h for h in all_handovers if h.status == StatusOptions.HandoverStatus.PENDING.value])
-        open_issues = len([i for i in all_issues if i.status == StatusOptions.IssueStatus.OPEN.value])
-        failed_suites = len([ts for ts in all_test_suites if ts.status == StatusOptions.TestSuiteStatus.FAILED.value])
+        pending_handovers = sum(1 for h in all_handovers if h['status'] == StatusOptions.HandoverStatus.PENDING.value)
+        open_issues = sum(1 for i in all_issues if i['status'] == StatusOptions.IssueStatus.OPEN.value)
+        failed_suites = sum(1 for ts in all_test_suites if ts['status'] == StatusOptions.TestSuiteStatus.FAILED.value)
         total_requirements = len(all_requirements)
         
         return {
@@ -220,11 +295,11 @@ class BMSService:
                 'failed_suites': failed_suites,
                 'total_requirements': total_requirements
             },
-            'recent_activities': recent_activities,
-            'all_handovers': [h.to_dict() for h in all_handovers],
-            'all_requirements': [r.to_dict() for r in all_requirements],
-            'all_issues': [i.to_dict() for i in all_issues],
-            'all_test_suites': [ts.to_dict() for ts in all_test_suites]
+            'recent_activities': data['recent_activities'],
+            'all_handovers': all_handovers,
+            'all_requirements': all_requirements,
+            'all_issues': all_issues,
+            'all_test_suites': all_test_suites
         }
     
     def get_filter_options(self) -> Dict[str, List[str]]:
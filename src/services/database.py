@@ -2,24 +2,93 @@
 Database service for managing SQLite operations.
 """
 
+import atexit
 import sqlite3
+import threading
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
 from ..config import DatabaseConfig
 from ..models import Handover, Requirement, Issue, TestSuite
 
+# Column order of SELECT * for each table, used to turn rows into dicts
+_COLUMNS = {
+    'handovers': ('id', 'from_team', 'to_team', 'date', 'description', 'documents',
+                  'status', 'created_at', 'updated_at'),
+    'requirements': ('id', 'title', 'description', 'change_date', 'priority', 'status',
+                     'created_at', 'updated_at'),
+    'issues': ('id', 'title', 'description', 'type', 'priority', 'status', 'assigned_to',
+               'created_at', 'updated_at'),
+    'test_suites': ('id', 'name', 'last_run', 'status', 'failures', 'fix_notes',
+                    'created_at', 'updated_at'),
+}
+
+# Filterable columns per table, with the fetch_all filter key for each
+_FILTERS = {
+    'handovers': (('status', 'handover_status'),),
+    'requirements': (('status', 'requirement_status'), ('priority', 'requirement_priority')),
+    'issues': (('type', 'issue_type'), ('status', 'issue_status'), ('priority', 'issue_priority')),
+    'test_suites': (('status', 'test_suite_status'),),
+}
+
+# Per-connection settings; WAL lets readers on other threads run alongside a writer
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
 class DatabaseManager:
     """Database manager for SQLite operations."""
     
     def __init__(self, db_name: str = DatabaseConfig.DB_NAME):
         self.db_name = db_name
+        
+        # One pooled connection per thread, closed at exit
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close)
+        
+        self._enable_wal()
         self._create_tables()
         self._insert_sample_data()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        return sqlite3.connect(self.db_name)
+        """
+        Get this thread's database connection, opening it on first use.
+        
+        Connections stay open until close() is called, so callers commit but don't close them.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_name, check_same_thread=False, cached_statements=256)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        elif conn.in_transaction:
+            # A write that raised before its commit left its transaction open
+            conn.rollback()
+        return conn
+    
+    def close(self):
+        """Close every pooled connection."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+    
+    def _enable_wal(self):
+        """Switch the database to write-ahead logging (persistent, so done once)."""
+        conn = sqlite3.connect(self.db_name)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.close()
     
     def _create_tables(self):
         """Create database tables if they don't exist."""
@@ -85,7 +154,6 @@ class DatabaseManager:
         ''')
         
         conn.commit()
-        conn.close()
     
     def _insert_sample_data(self):
         """Insert sample data if tables are empty."""
@@ -133,8 +201,6 @@ class DatabaseManager:
             cursor.executemany('INSERT INTO test_suites VALUES (?,?,?,?,?,?,?,?)', sample_test_suites)
             
             conn.commit()
-        
-        conn.close()
     
     # Handover operations
     def add_handover(self, handover: Handover) -> str:
@@ -161,7 +227,6 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
         return handover.id
     
     def update_handover(self, handover_id: str, handover: Handover):
@@ -189,42 +254,13 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
     
     def get_handovers(self, status_filter: Optional[str] = None) -> List[Handover]:
         """Get handovers with optional status filter."""
         conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        query = 'SELECT * FROM handovers'
-        params = []
-        
-        if status_filter and status_filter != "All":
-            query += ' WHERE status = ?'
-            params.append(status_filter)
-            
-        query += ' ORDER BY updated_at DESC'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._select(conn.cursor(), 'handovers', status_filter)
         
-        handovers = []
-        for row in rows:
-            handover_data = {
-                'id': row[0],
-                'from_team': row[1],
-                'to_team': row[2],
-                'date': row[3],
-                'description': row[4],
-                'documents': row[5].split(',') if row[5] else [],
-                'status': row[6],
-                'created_at': row[7],
-                'updated_at': row[8]
-            }
-            handovers.append(Handover.from_dict(handover_data))
-        
-        return handovers
+        return [Handover.from_dict(row) for row in rows]
     
     def delete_handover(self, handover_id: str) -> bool:
         """Delete a handover by ID."""
@@ -235,7 +271,6 @@ class DatabaseManager:
         deleted = cursor.rowcount > 0
         
         conn.commit()
-        conn.close()
         return deleted
     
     # Requirement operations
@@ -262,7 +297,6 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
         return requirement.id
     
     def update_requirement(self, requirement_id: str, requirement: Requirement):
@@ -289,50 +323,14 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
     
     def get_requirements(self, status_filter: Optional[str] = None, 
                         priority_filter: Optional[str] = None) -> List[Requirement]:
         """Get requirements with optional filters."""
         conn = self._get_connection()
-        cursor = conn.cursor()
+        rows = self._select(conn.cursor(), 'requirements', status_filter, priority_filter)
         
-        query = 'SELECT * FROM requirements'
-        params = []
-        conditions = []
-        
-        if status_filter and status_filter != "All":
-            conditions.append('status = ?')
-            params.append(status_filter)
-            
-        if priority_filter and priority_filter != "All":
-            conditions.append('priority = ?')
-            params.append(priority_filter)
-            
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
-            
-        query += ' ORDER BY updated_at DESC'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        
-        requirements = []
-        for row in rows:
-            requirement_data = {
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'change_date': row[3],
-                'priority': row[4],
-                'status': row[5],
-                'created_at': row[6],
-                'updated_at': row[7]
-            }
-            requirements.append(Requirement.from_dict(requirement_data))
-        
-        return requirements
+        return [Requirement.from_dict(row) for row in rows]
     
     def delete_requirement(self, requirement_id: str) -> bool:
         """Delete a requirement by ID."""
@@ -343,7 +341,6 @@ class DatabaseManager:
         deleted = cursor.rowcount > 0
         
         conn.commit()
-        conn.close()
         return deleted
     
     # Issue operations
@@ -371,7 +368,6 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
         return issue.id
     
     def update_issue(self, issue_id: str, issue: Issue):
@@ -399,56 +395,15 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
     
     def get_issues(self, type_filter: Optional[str] = None, 
                    status_filter: Optional[str] = None, 
                    priority_filter: Optional[str] = None) -> List[Issue]:
         """Get issues with optional filters."""
         conn = self._get_connection()
-        cursor = conn.cursor()
+        rows = self._select(conn.cursor(), 'issues', type_filter, status_filter, priority_filter)
         
-        query = 'SELECT * FROM issues'
-        params = []
-        conditions = []
-        
-        if type_filter and type_filter != "All":
-            conditions.append('type = ?')
-            params.append(type_filter)
-            
-        if status_filter and status_filter != "All":
-            conditions.append('status = ?')
-            params.append(status_filter)
-            
-        if priority_filter and priority_filter != "All":
-            conditions.append('priority = ?')
-            params.append(priority_filter)
-            
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
-            
-        query += ' ORDER BY updated_at DESC'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        
-        issues = []
-        for row in rows:
-            issue_data = {
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'type': row[3],
-                'priority': row[4],
-                'status': row[5],
-                'assigned_to': row[6],
-                'created_at': row[7],
-                'updated_at': row[8]
-            }
-            issues.append(Issue.from_dict(issue_data))
-        
-        return issues
+        return [Issue.from_dict(row) for row in rows]
     
     def delete_issue(self, issue_id: str) -> bool:
         """Delete an issue by ID."""
@@ -459,7 +414,6 @@ class DatabaseManager:
         deleted = cursor.rowcount > 0
         
         conn.commit()
-        conn.close()
         return deleted
     
     # Test Suite operations
@@ -486,7 +440,6 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
         return test_suite.id
     
     def update_test_suite(self, test_suite_id: str, test_suite: TestSuite):
@@ -513,41 +466,13 @@ class DatabaseManager:
         ))
         
         conn.commit()
-        conn.close()
     
     def get_test_suites(self, status_filter: Optional[str] = None) -> List[TestSuite]:
         """Get test suites with optional status filter."""
         conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        query = 'SELECT * FROM test_suites'
-        params = []
-        
-        if status_filter and status_filter != "All":
-            query += ' WHERE status = ?'
-            params.append(status_filter)
-            
-        query += ' ORDER BY updated_at DESC'
+        rows = self._select(conn.cursor(), 'test_suites', status_filter)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        
-        test_suites = []
-        for row in rows:
-            test_suite_data = {
-                'id': row[0],
-                'name': row[1],
-                'last_run': row[2],
-                'status': row[3],
-                'failures': row[4],
-                'fix_notes': row[5],
-                'created_at': row[6],
-                'updated_at': row[7]
-            }
-            test_suites.append(TestSuite.from_dict(test_suite_data))
-        
-        return test_suites
+        return [TestSuite.from_dict(row) for row in rows]
     
     def delete_test_suite(self, test_suite_id: str) -> bool:
         """Delete a test suite by ID."""
@@ -558,14 +483,84 @@ class DatabaseManager:
         deleted = cursor.rowcount > 0
         
         conn.commit()
-        conn.close()
         return deleted
     
     def get_recent_activities(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent activities from all tables combined."""
         conn = self._get_connection()
+        activities = self._recent_activities(conn.cursor(), limit)
+        return activities
+    
+    def fetch_all(self, filters: Optional[Dict[str, str]] = None,
+                  recent_limit: int = 5) -> Dict[str, Any]:
+        """
+        Read every table in one connection and read transaction.
+        
+        Args:
+            filters: Filter values keyed like BMSService.get_filter_options; missing or "All" means unfiltered
+            recent_limit: Number of recent activities to include
+            
+        Returns:
+            Dict with the filtered rows of each table as dicts (e.g. 'handovers'), every row
+            of each table under 'all_<table>', and 'recent_activities'
+        """
+        filters = filters or {}
+        conn = self._get_connection()
         cursor = conn.cursor()
         
+        data = {}
+        try:
+            # One snapshot for all lists, taken under a single read lock
+            cursor.execute('BEGIN')
+            for table, table_filters in _FILTERS.items():
+                values = [filters.get(key) for _, key in table_filters]
+                data[table] = self._select(cursor, table, *values)
+                # Unfiltered tables already hold every row
+                filtered = any(value and value != "All" for value in values)
+                data[f'all_{table}'] = self._select(cursor, table) if filtered else data[table]
+            data['recent_activities'] = self._recent_activities(cursor, recent_limit)
+            cursor.execute('COMMIT')
+        except Exception:
+            conn.rollback()
+            raise
+        
+        return data
+    
+    def _select(self, cursor: sqlite3.Cursor, table: str, *filters: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Get a table's rows as dicts, most recently updated first.
+        
+        Args:
+            cursor: Cursor to run the query on
+            table: Table name, a key of _COLUMNS
+            *filters: Values for the table's _FILTERS columns, in order; None or "All" skips one
+            
+        Returns:
+            List of row dicts keyed by column name
+        """
+        query = f'SELECT * FROM {table}'
+        params = []
+        conditions = []
+        
+        for (column, _), value in zip(_FILTERS[table], filters):
+            if value and value != "All":
+                conditions.append(f'{column} = ?')
+                params.append(value)
+            
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+            
+        query += ' ORDER BY updated_at DESC'
+        
+        columns = _COLUMNS[table]
+        rows = [dict(zip(columns, row)) for row in cursor.execute(query, params)]
+        if table == 'handovers':
+            for row in rows:
+                row['documents'] = row['documents'].split(',') if row['documents'] else []
+        return rows
+    
+    def _recent_activities(self, cursor: sqlite3.Cursor, limit: int) -> List[Dict[str, Any]]:
+        """Get recent activities from all tables combined, using an open cursor."""
         # Get recent handovers
         cursor.execute('''
             SELECT 'handover' as type, id, from_team || ' → ' || to_team as title, description, 
@@ -606,8 +601,6 @@ class DatabaseManager:
         ''', (limit,))
         test_suites = cursor.fetchall()
         
-        conn.close()
-        
         # Combine all activities
         all_activities = []
         for activity in handovers + requirements + issues + test_suites:
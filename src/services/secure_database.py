@@ -7,15 +7,32 @@ import base64
 import os
 import time
 import sqlite3
-from typing import Dict, List, Any, Optional
+import shutil
+import tempfile
+from typing import Dict, List, Any, Optional, Tuple, BinaryIO
 from datetime import datetime
 from contextlib import contextmanager
 
 from .database import DatabaseManager
 from ..utils.encryption import EncryptionManager, DataIntegrityManager
 from ..utils.compression import CompressionManager, CompressionType
+from ..utils.parallel import parallel_map
+from ..utils import serialization
 from ..config import SecurityConfig
 
+# Header flags stored in the first byte of every value written by _secure_data
+_FLAG_ENCRYPTED = 0x01
+_FLAG_COMPRESSED = 0x02
+_KNOWN_FLAGS = frozenset({0, _FLAG_ENCRYPTED, _FLAG_COMPRESSED, _FLAG_ENCRYPTED | _FLAG_COMPRESSED})
+
+# Bumped whenever _ensure_schema creates new tables
+_SCHEMA_VERSION = 1
+
+# Backup files start with a magic marker, a format version and the same flag bits
+_BACKUP_MAGIC = b"BMSB"
+_BACKUP_VERSION_JSON = 1      # Payload is the JSON-encoded app data
+_BACKUP_VERSION_SQLITE = 2    # Payload is a page-level copy of the database file
+_BACKUP_VERSION_STREAM = 3    # Same copy, compressed and encrypted as streams in constant memory
 
 class SecureDatabaseManager:
     """
@@ -44,120 +61,147 @@ class SecureDatabaseManager:
         self.compression_level = SecurityConfig.COMPRESSION_LEVEL
         self.enable_checksums = SecurityConfig.ENABLE_CHECKSUMS
         
-        # Create metadata table for security info
-        self._create_security_metadata_table()
-    
-    def _create_security_metadata_table(self):
-        """Create table for storing security metadata."""
-        conn = self.db_manager._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS security_metadata (
-                table_name TEXT PRIMARY KEY,
-                encryption_enabled BOOLEAN,
-                compression_enabled BOOLEAN,
-                compression_type TEXT,
-                checksum TEXT,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        ''')
+        # Checksums from security_metadata, loaded lazily by _get_checksums
+        self._checksums: Optional[Dict[str, str]] = None
         
-        conn.commit()
-        conn.close()
+        # Create security tables on first run only
+        self._ensure_schema()
     
-    def _update_security_metadata(self, table_name: str, data: Dict[str, Any]):
-        """Update security metadata for a table."""
-        if not self.enable_checksums:
-            return
+    def _ensure_schema(self):
+        """Create the security tables once, tracked by the database's user_version."""
+        with self._get_connection_with_retry() as conn:
+            user_version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if user_version >= _SCHEMA_VERSION:
+                return
             
-        conn = self.db_manager._get_connection()
-        cursor = conn.cursor()
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS security_metadata (
+                    table_name TEXT PRIMARY KEY,
+                    encryption_enabled BOOLEAN,
+                    compression_enabled BOOLEAN,
+                    compression_type TEXT,
+                    checksum TEXT,
+                    created_at INTEGER,
+                    updated_at INTEGER
+                )
+            ''')
+            
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS app_data (
+                    key TEXT PRIMARY KEY,
+                    value BLOB,
+                    created_at INTEGER,
+                    updated_at INTEGER
+                )
+            ''')
+            
+            conn.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+    
+    def _update_security_metadata(self, cursor: sqlite3.Cursor, checksums: Dict[str, str]):
+        """
+        Update security metadata for several tables in one statement.
+        
+        Args:
+            cursor: Cursor of the transaction that wrote the data
+            checksums: Mapping of metadata table name to checksum
+        """
+        if not self.enable_checksums or not checksums:
+            return
         
-        # Calculate checksum of the data
-        checksum = DataIntegrityManager.create_checksum(data) if data else ""
-        current_time = datetime.now().isoformat()
+        current_time = time.time_ns()
+        compression_type = self.compression_manager.compression_type.value
         
-        cursor.execute('''
+        cursor.executemany('''
             INSERT OR REPLACE INTO security_metadata 
             (table_name, encryption_enabled, compression_enabled, compression_type, checksum, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            table_name,
-            self.enable_encryption,
-            self.enable_compression,
-            self.compression_manager.compression_type.value,
-            checksum,
-            current_time,
-            current_time
-        ))
-        
-        conn.commit()
-        conn.close()
+        ''', [
+            (
+                table_name,
+                self.enable_encryption,
+                self.enable_compression,
+                compression_type,
+                checksum,
+                current_time,
+                current_time
+            )
+            for table_name, checksum in checksums.items()
+        ])
+        
+        # Keep the in-memory copy in step once it has been loaded
+        if self._checksums is not None:
+            self._checksums.update(checksums)
+    
+    def _get_checksums(self) -> Dict[str, str]:
+        """Load all stored checksums on first use and keep them in memory."""
+        if self._checksums is None:
+            with self._get_connection_with_retry() as conn:
+                self._checksums = dict(conn.execute('SELECT table_name, checksum FROM security_metadata'))
+        return self._checksums
     
-    def _verify_data_integrity(self, table_name: str, data: Dict[str, Any]) -> bool:
-        """Verify data integrity using checksums."""
-        if not self.enable_checksums or not data:
+    def _verify_data_integrity(self, table_name: str, secured_data: bytes) -> bool:
+        """Verify data integrity by comparing the checksum of the stored bytes."""
+        if not self.enable_checksums or not secured_data:
             return True
-            
-        conn = self.db_manager._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT checksum FROM security_metadata WHERE table_name = ?', (table_name,))
-        result = cursor.fetchone()
-        conn.close()
         
-        if not result:
+        expected_checksum = self._get_checksums().get(table_name)
+        if not expected_checksum:
             return True  # No checksum available, assume valid
-            
-        stored_checksum = result[0]
-        calculated_checksum = DataIntegrityManager.create_checksum(data)
         
-        return DataIntegrityManager.verify_checksum(data, stored_checksum)
+        return DataIntegrityManager.verify_hash(secured_data, expected_checksum)
     
-    def _secure_data(self, data: Any) -> str:
+    def _secure_data(self, data: Any) -> Tuple[bytes, str]:
         """
         Apply compression and encryption to data.
         
+        The first byte of the result is a header describing which steps were
+        applied, so reads can dispatch directly instead of guessing.
+        
         Args:
             data: Data to secure (dict, list, or string)
             
         Returns:
-            Base64 encoded secured data
+            Tuple of (header byte followed by the secured payload, checksum of those bytes)
         """
         if data is None:
-            return ""
+            return b"", ""
         
-        # Convert to JSON string if not already
+        # Convert to JSON bytes if not already; this is the only str -> bytes step
         if isinstance(data, (dict, list)):
-            json_data = json.dumps(data, ensure_ascii=False)
+            payload = serialization.dumps(data)
         else:
-            json_data = str(data)
+            payload = str(data).encode('utf-8')
+        
+        flags = 0
         
         # Apply compression if enabled
         if self.enable_compression:
-            compressed_data = self.compression_manager.compress_string(
-                json_data, self.compression_level
-            )
-            # Convert bytes to base64 for storage
-            processed_data = base64.b64encode(compressed_data).decode('utf-8')
-        else:
-            processed_data = json_data
+            payload = self.compression_manager.compress_bytes(payload, self.compression_level)
+            flags |= _FLAG_COMPRESSED
         
         # Apply encryption if enabled
         if self.enable_encryption:
-            encrypted_data = self.encryption_manager.encrypt_string(processed_data)
-            return encrypted_data
+            payload = self.encryption_manager.encrypt_bytes(payload)
+            flags |= _FLAG_ENCRYPTED
+        
+        secured_data = bytes([flags]) + payload
         
-        return processed_data
+        # Checksum the stored bytes, which are smaller than the original structure
+        checksum = DataIntegrityManager.calculate_hash(secured_data) if self.enable_checksums else ""
+        
+        return secured_data, checksum
+    
+    @staticmethod
+    def _is_legacy_value(secured_data: Any) -> bool:
+        """Check whether a stored value predates the header byte format."""
+        return isinstance(secured_data, str) or secured_data[0] not in _KNOWN_FLAGS
     
-    def _unsecure_data(self, secured_data: str) -> Any:
+    def _unsecure_data(self, secured_data: Any) -> Any:
         """
-        Decrypt and decompress data with fallback for mixed security states.
+        Decrypt and decompress data according to its header byte.
         
         Args:
-            secured_data: Base64 encoded secured data
+            secured_data: Value produced by _secure_data, or a legacy text value
             
         Returns:
             Original data
@@ -165,6 +209,38 @@ class SecureDatabaseManager:
         if not secured_data:
             return None
         
+        if self._is_legacy_value(secured_data):
+            if isinstance(secured_data, bytes):
+                secured_data = secured_data.decode('utf-8')
+            return self._unsecure_legacy_data(secured_data)
+        
+        flags = secured_data[0]
+        payload = secured_data[1:]
+        
+        if flags & _FLAG_ENCRYPTED:
+            payload = self.encryption_manager.decrypt_bytes(payload)
+        
+        if flags & _FLAG_COMPRESSED:
+            payload = self.compression_manager.decompress_bytes(payload)
+        
+        try:
+            # The serializer accepts UTF-8 bytes directly
+            return serialization.loads(payload)
+        except json.JSONDecodeError:
+            # Return as string if it's not JSON
+            return payload.decode('utf-8')
+    
+    def _unsecure_legacy_data(self, secured_data: str) -> Any:
+        """
+        Decrypt and decompress a value written before the header byte format,
+        with fallback for mixed security states.
+        
+        Args:
+            secured_data: Base64 encoded secured data
+            
+        Returns:
+            Original data
+        """
         # Try multiple approaches to handle different security configurations
         attempts = [
             # Current configuration
@@ -201,7 +277,7 @@ class SecureDatabaseManager:
                 
                 # Parse JSON back to original structure
                 try:
-                    return json.loads(json_data)
+                    return serialization.loads(json_data)
                 except json.JSONDecodeError:
                     # Return as string if it's not JSON
                     return json_data
@@ -211,7 +287,7 @@ class SecureDatabaseManager:
         
         # If all attempts failed, try to return as plain text
         try:
-            return json.loads(secured_data)
+            return serialization.loads(secured_data)
         except:
             return secured_data
     
@@ -263,42 +339,38 @@ class SecureDatabaseManager:
             Success status
         """
         try:
+            keys = list(app_data.keys())
+            values = [
+                # Save theme_mode as string, not as object
+                (value.value if hasattr(value, 'value') else str(value)) if key == "theme_mode" else value
+                for key, value in app_data.items()
+            ]
+            
+            # Compress and encrypt all sections in parallel before taking the write lock
+            secured = parallel_map(self._secure_data, values)
+            
+            checksums = {
+                f"app_data_{key}": checksum
+                for key, value, (_, checksum) in zip(keys, values, secured)
+                if isinstance(value, (dict, list))
+            }
+            
             with self._get_connection_with_retry() as conn:
                 cursor = conn.cursor()
                 
-                # Create app_data table if it doesn't exist
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS app_data (
-                        key TEXT PRIMARY KEY,
-                        value TEXT,
-                        created_at TEXT,
-                        updated_at TEXT
-                    )
-                ''')
-                
-                current_time = datetime.now().isoformat()
+                current_time = time.time_ns()
                 
                 # Save each section of app_data in a single transaction
-                for key, value in app_data.items():
-                    if key == "theme_mode":
-                        # Save theme_mode as string, not as object
-                        secured_value = self._secure_data(value.value if hasattr(value, 'value') else str(value))
-                    else:
-                        secured_value = self._secure_data(value)
-                    
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO app_data (key, value, created_at, updated_at)
-                        VALUES (?, ?, ?, ?)
-                    ''', (key, secured_value, current_time, current_time))
-            
-            # Update security metadata after successful save
-            try:
-                for key, value in app_data.items():
-                    if isinstance(value, (dict, list)):
-                        self._update_security_metadata(f"app_data_{key}", 
-                                                     value if isinstance(value, dict) else {"data": value})
-            except Exception as meta_error:
-                print(f"Error updating metadata (non-critical): {meta_error}")
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO app_data (key, value, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                ''', [
+                    (key, secured_value, current_time, current_time)
+                    for key, (secured_value, _) in zip(keys, secured)
+                ])
+                
+                # Record checksums in the same transaction
+                self._update_security_metadata(cursor, checksums)
             
             return True
             
@@ -329,15 +401,32 @@ class SecureDatabaseManager:
                 cursor.execute('SELECT key, value FROM app_data')
                 rows = cursor.fetchall()
             
-            app_data = {}
-            for key, secured_value in rows:
+            def unsecure_row(row):
+                key, secured_value = row
                 try:
-                    unsecured_value = self._unsecure_data(secured_value)
-                    app_data[key] = unsecured_value
+                    return self._unsecure_data(secured_value), None
                 except Exception as e:
-                    print(f"Error loading data for key '{key}': {e}")
+                    return None, e
+            
+            # Decrypt and decompress all rows in parallel
+            results = parallel_map(unsecure_row, rows)
+            
+            app_data = {}
+            legacy_rows = []
+            for (key, secured_value), (unsecured_value, error) in zip(rows, results):
+                if error is not None:
+                    print(f"Error loading data for key '{key}': {error}")
                     # Skip corrupted data entries
                     continue
+                
+                app_data[key] = unsecured_value
+                
+                # Re-write legacy values with a header byte so later reads dispatch directly
+                if self._is_legacy_value(secured_value):
+                    legacy_rows.append((self._secure_data(unsecured_value)[0], key))
+            
+            if legacy_rows:
+                self._rewrite_legacy_values(legacy_rows)
             
             return app_data
             
@@ -345,6 +434,14 @@ class SecureDatabaseManager:
             print(f"Error loading app data: {e}")
             return {}
     
+    def _rewrite_legacy_values(self, rows: List[tuple]):
+        """Persist re-secured legacy values (non-critical)."""
+        try:
+            with self._get_connection_with_retry() as conn:
+                conn.executemany('UPDATE app_data SET value = ? WHERE key = ?', rows)
+        except Exception as e:
+            print(f"Error upgrading legacy app data (non-critical): {e}")
+    
     def get_storage_stats(self) -> Dict[str, Any]:
         """
         Get statistics about storage usage and compression benefits.
@@ -368,29 +465,21 @@ class SecureDatabaseManager:
                 
                 table_stats = {}
                 total_records = 0
+                table_sizes = self._get_table_sizes(cursor)
                 
-                for (table_name,) in tables:
-                    try:
-                        cursor.execute(f'SELECT COUNT(*) FROM {table_name}')
-                        record_count = cursor.fetchone()[0]
+                if tables:
+                    # Count every table in a single statement
+                    count_query = ' UNION ALL '.join(
+                        f'SELECT ?, COUNT(*) FROM "{table_name}"' for (table_name,) in tables
+                    )
+                    cursor.execute(count_query, [table_name for (table_name,) in tables])
+                    
+                    for table_name, record_count in cursor.fetchall():
                         total_records += record_count
-                        
-                        # Calculate approximate data size (rough estimate)
-                        cursor.execute(f'SELECT * FROM {table_name} LIMIT 1')
-                        sample_row = cursor.fetchone()
-                        if sample_row:
-                            estimated_row_size = sum(len(str(col)) for col in sample_row)
-                            estimated_table_size = estimated_row_size * record_count
-                        else:
-                            estimated_table_size = 0
-                        
                         table_stats[table_name] = {
                             'records': record_count,
-                            'estimated_size_bytes': estimated_table_size
+                            'estimated_size_bytes': table_sizes.get(table_name, 0)
                         }
-                    except Exception as table_error:
-                        print(f"Error getting stats for table {table_name}: {table_error}")
-                        table_stats[table_name] = {'records': 0, 'estimated_size_bytes': 0}
             
             return {
                 'database_file_size_bytes': db_size,
@@ -410,6 +499,32 @@ class SecureDatabaseManager:
             print(f"Error getting storage stats: {e}")
             return {}
     
+    def _get_table_sizes(self, cursor: sqlite3.Cursor) -> Dict[str, int]:
+        """
+        Get the on-disk size of each table in bytes.
+        
+        Uses the dbstat virtual table when SQLite is compiled with it, otherwise
+        falls back to the payload size of the app_data values.
+        
+        Args:
+            cursor: Open database cursor
+            
+        Returns:
+            Dictionary mapping table name to size in bytes
+        """
+        try:
+            cursor.execute('SELECT name, SUM(pgsize) FROM dbstat GROUP BY name')
+            return {name: size or 0 for name, size in cursor.fetchall()}
+        except sqlite3.OperationalError:
+            pass
+        
+        # dbstat is not available in this SQLite build
+        try:
+            cursor.execute('SELECT COALESCE(SUM(LENGTH(value)), 0) FROM app_data')
+            return {'app_data': cursor.fetchone()[0]}
+        except sqlite3.OperationalError:
+            return {}
+    
     def backup_database(self, backup_path: Optional[str] = None) -> str:
         """
         Create an encrypted and compressed backup of the entire database.
@@ -422,7 +537,6 @@ class SecureDatabaseManager:
         """
         if not backup_path:
             # Use existing backups folder
-            import os
             backup_dir = "backups"
             if not os.path.exists(backup_dir):
                 os.makedirs(backup_dir)
@@ -431,32 +545,36 @@ class SecureDatabaseManager:
             backup_path = os.path.join(backup_dir, f"backup_{timestamp}.bms")
         
         try:
-            # Load all app data
-            app_data = self.load_app_data()
-            
-            # Create backup data structure
-            backup_data = {
-                'timestamp': datetime.now().isoformat(),
-                'version': '1.0',
-                'app_data': app_data,
-                'security_metadata': self.get_storage_stats()
-            }
-            
-            # Compress and encrypt the backup
-            if SecurityConfig.BACKUP_COMPRESSION:
-                compressed_data = self.compression_manager.compress_dict(
-                    backup_data, self.compression_level
-                )
-                backup_content = base64.b64encode(compressed_data).decode('utf-8')
-            else:
-                backup_content = json.dumps(backup_data, ensure_ascii=False)
+            flags = ((_FLAG_COMPRESSED if SecurityConfig.BACKUP_COMPRESSION else 0) |
+                     (_FLAG_ENCRYPTED if SecurityConfig.BACKUP_ENCRYPTION else 0))
             
-            if SecurityConfig.BACKUP_ENCRYPTION:
-                backup_content = self.encryption_manager.encrypt_string(backup_content)
-            
-            # Write backup file
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(backup_content)
+            # Take an online page-level copy of the database, no decoding required
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                snapshot_path = os.path.join(tmp_dir, "snapshot.sqlite")
+                snapshot = sqlite3.connect(snapshot_path)
+                try:
+                    with self._get_connection_with_retry() as conn:
+                        conn.backup(snapshot, pages=1024)
+                finally:
+                    snapshot.close()
+                
+                # Each stage streams file to file, so memory use doesn't grow with the database
+                payload_path = snapshot_path
+                if flags & _FLAG_COMPRESSED and flags & _FLAG_ENCRYPTED:
+                    payload_path = os.path.join(tmp_dir, "snapshot.compressed")
+                    with open(snapshot_path, 'rb') as source, open(payload_path, 'wb') as sink:
+                        self.compression_manager.compress_stream(source, sink, self.compression_level)
+                
+                # Write backup file
+                with open(payload_path, 'rb') as source, open(backup_path, 'wb') as sink:
+                    sink.write(_BACKUP_MAGIC)
+                    sink.write(bytes([_BACKUP_VERSION_STREAM, flags]))
+                    if flags & _FLAG_ENCRYPTED:
+                        self.encryption_manager.encrypt_stream(source, sink)
+                    elif flags & _FLAG_COMPRESSED:
+                        self.compression_manager.compress_stream(source, sink, self.compression_level)
+                    else:
+                        shutil.copyfileobj(source, sink)
             
             return backup_path
             
@@ -477,21 +595,28 @@ class SecureDatabaseManager:
             if not os.path.exists(backup_path):
                 raise FileNotFoundError(f"Backup file not found: {backup_path}")
             
-            # Read backup file
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                backup_content = f.read()
+            # Read backup file; streamed backups are decoded without loading them whole
+            with open(backup_path, 'rb') as f:
+                header = f.read(len(_BACKUP_MAGIC) + 2)
+                if header[:len(_BACKUP_MAGIC)] == _BACKUP_MAGIC and header[-2] == _BACKUP_VERSION_STREAM:
+                    self._restore_streamed_backup(f, header[-1])
+                    return True
+                backup_bytes = header + f.read()
             
-            # Decrypt if needed
-            if SecurityConfig.BACKUP_ENCRYPTION:
-                backup_content = self.encryption_manager.decrypt_string(backup_content)
-            
-            # Decompress if needed
-            if SecurityConfig.BACKUP_COMPRESSION:
-                compressed_bytes = base64.b64decode(backup_content.encode('utf-8'))
-                json_content = self.compression_manager.decompress_string(compressed_bytes)
-                backup_data = json.loads(json_content)
+            if not backup_bytes.startswith(_BACKUP_MAGIC):
+                backup_data = self._read_legacy_backup(backup_bytes.decode('utf-8'))
             else:
-                backup_data = json.loads(backup_content)
+                version, payload = self._read_binary_backup(backup_bytes)
+                
+                if version == _BACKUP_VERSION_SQLITE:
+                    with tempfile.TemporaryDirectory() as tmp_dir:
+                        snapshot_path = os.path.join(tmp_dir, "snapshot.sqlite")
+                        with open(snapshot_path, 'wb') as f:
+                            f.write(payload)
+                        self._restore_database_snapshot(snapshot_path)
+                    return True
+                
+                backup_data = serialization.loads(payload)
             
             # Validate backup structure
             if 'app_data' not in backup_data:
@@ -506,9 +631,105 @@ class SecureDatabaseManager:
             print(f"Restore failed: {str(e)}")
             return False
     
+    def _read_binary_backup(self, backup_bytes: bytes) -> Tuple[int, bytes]:
+        """
+        Decode a backup written with the binary header format.
+        
+        Args:
+            backup_bytes: Raw backup file contents
+            
+        Returns:
+            Tuple of (format version, decrypted and decompressed payload)
+        """
+        header_size = len(_BACKUP_MAGIC)
+        version, flags = backup_bytes[header_size], backup_bytes[header_size + 1]
+        if version not in (_BACKUP_VERSION_JSON, _BACKUP_VERSION_SQLITE):
+            raise ValueError(f"Unsupported backup version: {version}")
+        
+        payload = backup_bytes[header_size + 2:]
+        
+        if flags & _FLAG_ENCRYPTED:
+            payload = self.encryption_manager.decrypt_bytes(payload)
+        
+        if flags & _FLAG_COMPRESSED:
+            payload = self.compression_manager.decompress_bytes(payload)
+        
+        return version, payload
+    
+    def _restore_streamed_backup(self, source: BinaryIO, flags: int):
+        """
+        Decode a streamed backup to a temp file and restore the database from it.
+        
+        Args:
+            source: Backup file positioned after its header
+            flags: Flag bits from the header
+        """
+        if flags not in _KNOWN_FLAGS:
+            raise ValueError(f"Unsupported backup flags: {flags}")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_path = os.path.join(tmp_dir, "snapshot.sqlite")
+            
+            if flags & _FLAG_ENCRYPTED and flags & _FLAG_COMPRESSED:
+                compressed_path = os.path.join(tmp_dir, "snapshot.compressed")
+                with open(compressed_path, 'wb') as sink:
+                    self.encryption_manager.decrypt_stream(source, sink)
+                with open(compressed_path, 'rb') as compressed, open(snapshot_path, 'wb') as sink:
+                    self.compression_manager.decompress_stream(compressed, sink)
+            else:
+                with open(snapshot_path, 'wb') as sink:
+                    if flags & _FLAG_ENCRYPTED:
+                        self.encryption_manager.decrypt_stream(source, sink)
+                    elif flags & _FLAG_COMPRESSED:
+                        self.compression_manager.decompress_stream(source, sink)
+                    else:
+                        shutil.copyfileobj(source, sink)
+            
+            self._restore_database_snapshot(snapshot_path)
+    
+    def _restore_database_snapshot(self, snapshot_path: str):
+        """
+        Copy a database snapshot over the live database page by page.
+        
+        Args:
+            snapshot_path: Database file taken by backup_database
+        """
+        snapshot = sqlite3.connect(snapshot_path)
+        try:
+            with self._get_connection_with_retry() as conn:
+                snapshot.backup(conn, pages=1024)
+        finally:
+            snapshot.close()
+        
+        # The snapshot may predate the current schema, and carries its own checksums
+        self._ensure_schema()
+        self._checksums = None
+    
+    def _read_legacy_backup(self, backup_content: str) -> Dict[str, Any]:
+        """
+        Decode a base64 text backup written before the binary format.
+        
+        Args:
+            backup_content: Backup file contents
+            
+        Returns:
+            Backup data structure
+        """
+        # Decrypt if needed
+        if SecurityConfig.BACKUP_ENCRYPTION:
+            backup_content = self.encryption_manager.decrypt_string(backup_content)
+        
+        # Decompress if needed
+        if SecurityConfig.BACKUP_COMPRESSION:
+            compressed_bytes = base64.b64decode(backup_content.encode('utf-8'))
+            json_content = self.compression_manager.decompress_string(compressed_bytes)
+            return serialization.loads(json_content)
+        
+        return serialization.loads(backup_content)
+    
     def update_security_settings(self, encryption: bool = None, compression: bool = None, checksums: bool = None) -> bool:
         """
-        Update security settings and re-save data with new configuration.
+        Update security settings and re-secure only the data whose format changed.
         
         Args:
             encryption: Enable/disable encryption
@@ -519,8 +740,7 @@ class SecureDatabaseManager:
             Success status
         """
         try:
-            # Load current data with old settings
-            current_data = self.load_app_data()
+            checksums_turned_on = bool(checksums) and not self.enable_checksums
             
             # Update settings
             if encryption is not None:
@@ -530,10 +750,51 @@ class SecureDatabaseManager:
             if checksums is not None:
                 self.enable_checksums = checksums
             
-            # If we have data, re-save it with new security settings
-            if current_data:
-                success = self.save_app_data(current_data)
-                return success
+            desired_flags = (
+                (_FLAG_ENCRYPTED if self.enable_encryption else 0) |
+                (_FLAG_COMPRESSED if self.enable_compression else 0)
+            )
+            
+            new_checksums = {}
+            with self._get_connection_with_retry() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT name FROM sqlite_master 
+                    WHERE type='table' AND name='app_data'
+                ''')
+                if not cursor.fetchone():
+                    return True  # Nothing stored yet
+                
+                cursor.execute('SELECT key, value FROM app_data')
+                rows = [(key, value) for key, value in cursor.fetchall() if value]
+                
+                # Only rows whose header doesn't match the new settings need re-securing
+                stale_rows = [
+                    (key, value) for key, value in rows
+                    if self._is_legacy_value(value) or value[0] != desired_flags
+                ]
+                
+                if stale_rows:
+                    resecured = parallel_map(
+                        lambda value: self._secure_data(self._unsecure_data(value)),
+                        [value for _, value in stale_rows]
+                    )
+                    cursor.executemany(
+                        'UPDATE app_data SET value = ? WHERE key = ?',
+                        [(secured_value, key) for (key, _), (secured_value, _) in zip(stale_rows, resecured)]
+                    )
+                    new_checksums.update(
+                        (f"app_data_{key}", checksum) for (key, _), (_, checksum) in zip(stale_rows, resecured)
+                    )
+                
+                if checksums_turned_on:
+                    # Stored bytes are unchanged, so their checksums can be computed directly
+                    for key, value in rows:
+                        new_checksums.setdefault(f"app_data_{key}", DataIntegrityManager.calculate_hash(value))
+                
+                # Update security metadata for rewritten rows in the same transaction
+                self._update_security_metadata(cursor, new_checksums)
             
             return True
             
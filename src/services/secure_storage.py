@@ -3,22 +3,164 @@ Secure data storage service with encryption and compression.
 """
 
 import os
-import json
+import hashlib
+import secrets
 import sqlite3
+import tempfile
+import atexit
+import threading
+import time
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 import base64
 
 from ..utils.encryption import EncryptionManager, DataIntegrityManager
-from ..utils.compression import CompressionManager, CompressionType
+from ..utils.compression import CompressionManager, CompressionType, FAST_COMPRESSION_TYPE
+from ..utils import serialization
+from ..utils.parallel import parallel_map
 from ..config import DatabaseConfig
 
+# Per-connection tuning; journal_mode=WAL is persistent and set once in __init__
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Secure tables that accept records, with the prefix used for generated IDs
+_ID_PREFIXES = {
+    'handovers': 'handover',
+    'requirements': 'req',
+    'issues': 'issue',
+    'test_suites': 'test_suite',
+}
+
+# Plaintext columns copied out of the encrypted record so filters run in SQL
+_FILTER_COLUMNS = {
+    'handovers': ('status', 'priority'),
+    'requirements': ('status', 'priority'),
+}
+
+# Serialized records smaller than this are stored uncompressed
+_MIN_COMPRESSION_SIZE = 256
+
+# Narrow column layout scanned on every read; filter columns are appended per table
+_RECORD_COLUMNS = (
+    ('id', 'TEXT PRIMARY KEY'),
+    ('encrypted_data', 'BLOB'),
+    ('compression_type', 'INTEGER'),
+)
+
+# Cold per-record metadata kept in a sibling {table}_meta table
+_META_COLUMNS = (
+    ('id', 'TEXT PRIMARY KEY'),
+    ('encryption_checksum', 'TEXT'),
+    ('created_at', 'INTEGER'),
+    ('updated_at', 'INTEGER'),
+    # Digest of the canonical plaintext, compared to skip no-op handover updates
+    ('plaintext_hash', 'BLOB'),
+)
+
+# Compression codecs stored as one-byte integers in the compression_type column
+_CODEC_IDS = {
+    CompressionType.NONE: 0,
+    CompressionType.GZIP: 1,
+    CompressionType.LZ4: 2,
+    CompressionType.BZIP2: 3,
+    CompressionType.LZMA: 4,
+    CompressionType.ZLIB: 5,
+    CompressionType.ZSTD: 6,
+}
+_CODECS_BY_ID = {codec_id: codec for codec, codec_id in _CODEC_IDS.items()}
+
+# SQL expressions that convert a column from an older declared type during a table rebuild
+_COLUMN_CONVERSIONS: Dict[str, str] = {
+    # Local-time ISO-8601 text to UNIX microseconds
+    'created_at': "CAST(ROUND((julianday(created_at, 'utc') - 2440587.5) * 86400000000) AS INTEGER)",
+    'updated_at': "CAST(ROUND((julianday(updated_at, 'utc') - 2440587.5) * 86400000000) AS INTEGER)",
+    # Codec names to their integer ids
+    'compression_type': "CASE compression_type {} ELSE 0 END".format(' '.join(
+        f"WHEN '{codec.value}' THEN {codec_id}" for codec, codec_id in _CODEC_IDS.items()
+    )),
+}
+
+def _now_us() -> int:
+    """Current UNIX time in microseconds, as stored in the timestamp columns."""
+    return time.time_ns() // 1000
+
+def _format_timestamp(value: Any) -> Any:
+    """Format a stored microsecond timestamp as ISO-8601; older ISO text passes through."""
+    if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+        return datetime.fromtimestamp(int(value) / 1_000_000).isoformat()
+    return value
+
+def _table_columns(table: str) -> tuple:
+    """Get the (name, declaration) pairs for a secure table."""
+    return _RECORD_COLUMNS + tuple((column, 'TEXT') for column in _FILTER_COLUMNS.get(table, ()))
+
+def _columns_ddl(name: str, columns: tuple) -> str:
+    """Build a CREATE TABLE statement from (name, declaration) pairs."""
+    body = ',\n    '.join(f'{column} {declaration}' for column, declaration in columns)
+    # Small text key next to a large blob: WITHOUT ROWID saves a B-tree lookup per row
+    return f'CREATE TABLE IF NOT EXISTS {name} (\n    {body}\n) WITHOUT ROWID'
+
+def _table_ddl(table: str, name: Optional[str] = None) -> str:
+    """Build the CREATE TABLE statement for a secure table, optionally under another name."""
+    return _columns_ddl(name or table, _table_columns(table))
+
+def _meta_ddl(table: str) -> str:
+    """Build the CREATE TABLE statement for a secure table's metadata table."""
+    return _columns_ddl(f'{table}_meta', _META_COLUMNS)
+
+# Hot-path SQL kept as module constants so the pooled connections' statement cache is reused.
+# AES-GCM authenticates encrypted records, so their reads skip the metadata table;
+# unencrypted records join it for the checksum.
+_SQL_SELECT_RECORD = "SELECT id, encrypted_data, compression_type, '' FROM {table}"
+_SQL_SELECT_RECORD_WITH_CHECKSUM = (
+    'SELECT id, encrypted_data, compression_type, encryption_checksum '
+    'FROM {table} LEFT JOIN {table}_meta USING (id)'
+)
+_SQL_INSERT = {
+    table: 'INSERT INTO {table} ({columns}) VALUES ({placeholders})'.format(
+        table=table,
+        columns=', '.join(('id', 'encrypted_data', 'compression_type') + _FILTER_COLUMNS.get(table, ())),
+        placeholders=', '.join('?' * (3 + len(_FILTER_COLUMNS.get(table, ())))),
+    )
+    for table in _ID_PREFIXES
+}
+_SQL_INSERT_META = {
+    table: f'INSERT OR REPLACE INTO {table}_meta (id, encryption_checksum, created_at, updated_at, plaintext_hash) '
+           'VALUES (?, ?, ?, ?, ?)'
+    for table in _ID_PREFIXES
+}
+_SQL_UPDATE_HANDOVER = '''
+    UPDATE handovers
+    SET encrypted_data = ?, compression_type = ?, status = ?, priority = ?
+    WHERE id = ?
+'''
+_SQL_UPDATE_HANDOVER_META = (
+    'UPDATE handovers_meta SET encryption_checksum = ?, updated_at = ?, plaintext_hash = ? WHERE id = ?'
+)
+_SQL_SELECT_HANDOVER_HASH = 'SELECT plaintext_hash FROM handovers_meta WHERE id = ?'
+_SQL_TOUCH_HANDOVER = 'UPDATE handovers_meta SET updated_at = ? WHERE id = ?'
+_SQL_DELETE_HANDOVER = 'DELETE FROM handovers WHERE id = ?'
+_SQL_DELETE_HANDOVER_META = 'DELETE FROM handovers_meta WHERE id = ?'
+
+def _canonical_json(record: Dict[str, Any], record_id: str) -> bytes:
+    """Serialize a record with its id and sorted keys, so equal contents give equal bytes."""
+    return serialization.dumps({**record, 'id': record_id}, sort_keys=True)
+
+def _plaintext_hash(json_data: bytes) -> bytes:
+    """Short digest of a record's canonical JSON, compared to detect unchanged updates."""
+    return hashlib.blake2b(json_data, digest_size=16).digest()
+
 class SecureStorageManager:
     """Secure storage manager with encryption and compression."""
     
     def __init__(self, db_name: str = DatabaseConfig.DB_NAME, 
                  password: Optional[str] = None,
-                 compression_type: CompressionType = CompressionType.GZIP,
+                 compression_type: CompressionType = FAST_COMPRESSION_TYPE,
                  enable_compression: bool = True,
                  enable_encryption: bool = True):
         """
@@ -27,84 +169,86 @@ class SecureStorageManager:
         Args:
             db_name: Database file name
             password: Encryption password
-            compression_type: Type of compression to use
+            compression_type: Type of compression to use (LZ4 when installed, else GZIP)
             enable_compression: Whether to enable compression
             enable_encryption: Whether to enable encryption
         """
         self.db_name = db_name
-        self.enable_compression = enable_compression
-        self.enable_encryption = enable_encryption
         
         # Initialize encryption and compression managers
-        if self.enable_encryption:
+        if enable_encryption:
             self.encryption_manager = EncryptionManager(password)
         else:
             self.encryption_manager = None
             
-        if self.enable_compression:
+        if enable_compression:
             self.compression_manager = CompressionManager(compression_type)
         else:
             self.compression_manager = None
         
+        # Setting these binds the per-record transform for the combination in use
+        self._enable_compression = enable_compression
+        self.enable_encryption = enable_encryption
+        
+        # Compression managers keyed by codec, for records written with another codec
+        self._decompressors: Dict[int, CompressionManager] = {}
+        if self.compression_manager:
+            self._decompressors[_CODEC_IDS[compression_type]] = self.compression_manager
+        
+        # One pooled connection per thread, closed at exit
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close)
+        
+        self._enable_wal()
         self._create_secure_tables()
         self._insert_sample_data()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        return sqlite3.connect(self.db_name)
+        """
+        Get this thread's database connection, opening it on first use.
+        
+        Connections run in autocommit mode (isolation_level=None); multi-statement
+        writes open their own BEGIN/COMMIT. They stay open until close() is called.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_name, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """Close every pooled connection."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+    
+    def _enable_wal(self):
+        """Switch the database to write-ahead logging (persistent, so done once)."""
+        conn = sqlite3.connect(self.db_name)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.close()
     
     def _create_secure_tables(self):
         """Create secure database tables with metadata."""
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        # Handovers table with encryption metadata
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS handovers (
-                id TEXT PRIMARY KEY,
-                encrypted_data BLOB,
-                compression_type TEXT,
-                encryption_checksum TEXT,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        ''')
-        
-        # Requirements table with encryption metadata
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS requirements (
-                id TEXT PRIMARY KEY,
-                encrypted_data BLOB,
-                compression_type TEXT,
-                encryption_checksum TEXT,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        ''')
-        
-        # Issues table with encryption metadata
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS issues (
-                id TEXT PRIMARY KEY,
-                encrypted_data BLOB,
-                compression_type TEXT,
-                encryption_checksum TEXT,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        ''')
-        
-        # Test suites table with encryption metadata
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS test_suites (
-                id TEXT PRIMARY KEY,
-                encrypted_data BLOB,
-                compression_type TEXT,
-                encryption_checksum TEXT,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        ''')
+        # Handovers, requirements, issues and test suites tables with encryption metadata
+        for table in _ID_PREFIXES:
+            cursor.execute(_table_ddl(table))
+            cursor.execute(_meta_ddl(table))
         
         # Security settings table
         cursor.execute('''
@@ -113,13 +257,13 @@ class SecureStorageManager:
                 encryption_enabled BOOLEAN,
                 compression_enabled BOOLEAN,
                 compression_type TEXT,
-                last_password_change TEXT,
-                created_at TEXT
+                last_password_change INTEGER,
+                created_at INTEGER
             )
         ''')
         
         # Store security settings
-        current_time = datetime.now().isoformat()
+        current_time = _now_us()
         cursor.execute('''
             INSERT OR REPLACE INTO security_settings 
             (id, encryption_enabled, compression_enabled, compression_type, last_password_change, created_at)
@@ -133,72 +277,227 @@ class SecureStorageManager:
         ))
         
         conn.commit()
-        conn.close()
+        
+        self._migrate_secure_tables()
+    
+    def _migrate_secure_tables(self):
+        """Rebuild secure tables whose columns or storage layout differ from the current schema."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        for table in _ID_PREFIXES:
+            # Metadata tables hold no blobs, so new columns are added in place
+            meta_existing = {row[1] for row in cursor.execute(f'PRAGMA table_info({table}_meta)')}
+            for column, declaration in _META_COLUMNS:
+                if column not in meta_existing:
+                    cursor.execute(f'ALTER TABLE {table}_meta ADD COLUMN {column} {declaration}')
+            
+            existing = {row[1]: row[2].upper() for row in cursor.execute(f'PRAGMA table_info({table})')}
+            
+            # Skip tables created by DatabaseManager with the plaintext schema
+            if 'encrypted_data' not in existing:
+                continue
+            
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+            without_rowid = 'WITHOUT ROWID' in cursor.fetchone()[0].upper()
+            
+            desired = {column: declaration.split()[0] for column, declaration in _table_columns(table)}
+            if not without_rowid or existing != desired:
+                self._rebuild_table(cursor, table, existing, desired)
+            
+            # Only secure tables are indexed; the plaintext schema may lack the filter columns
+            for column in _FILTER_COLUMNS.get(table, ()):
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table}({column})')
+    
+    def _rebuild_table(self, cursor: sqlite3.Cursor, table: str,
+                       existing: Dict[str, str], desired: Dict[str, str]):
+        """
+        Copy a secure table into the current layout and swap it in, in one transaction.
+        
+        Args:
+            cursor: Cursor on the pooled connection
+            table: Table to rebuild
+            existing: Current column names mapped to declared types
+            desired: Target column names mapped to declared types
+        """
+        rebuild_table = f'{table}_rebuild'
+        copied = [column for column in desired if column in existing]
+        expressions = [
+            _COLUMN_CONVERSIONS.get(column, column) if existing[column] != desired[column] else column
+            for column in copied
+        ]
+        # Metadata still stored inline moves to the metadata table
+        meta_copied = [column for column, _ in _META_COLUMNS if column in existing]
+        meta_expressions = [
+            _COLUMN_CONVERSIONS.get(column, column) if existing[column] != declaration.split()[0] else column
+            for column, declaration in _META_COLUMNS if column in existing
+        ]
+        added_filters = [column for column in _FILTER_COLUMNS.get(table, ()) if column not in existing]
+        
+        cursor.execute('BEGIN')
+        try:
+            cursor.execute(f'DROP TABLE IF EXISTS {rebuild_table}')
+            cursor.execute(_table_ddl(table, rebuild_table))
+            cursor.execute(f'''
+                INSERT INTO {rebuild_table} ({', '.join(copied)})
+                SELECT {', '.join(expressions)} FROM {table} WHERE id IS NOT NULL
+            ''')
+            if len(meta_copied) > 1:
+                cursor.execute(f'''
+                    INSERT OR REPLACE INTO {table}_meta ({', '.join(meta_copied)})
+                    SELECT {', '.join(meta_expressions)} FROM {table} WHERE id IS NOT NULL
+                ''')
+            cursor.execute(f'DROP TABLE {table}')
+            cursor.execute(f'ALTER TABLE {rebuild_table} RENAME TO {table}')
+            
+            if added_filters:
+                # Backfill new filter columns from the encrypted records
+                cursor.execute(_SQL_SELECT_RECORD_WITH_CHECKSUM.format(table=table))
+                updates = []
+                for row in cursor.fetchall():
+                    try:
+                        data = self._decrypt_and_decompress_data(row[1], row[2], row[3])
+                    except Exception as e:
+                        print(f"Error decrypting {table} {row[0]} for migration: {str(e)}")
+                        continue
+                    updates.append((*(data.get(column) for column in added_filters), row[0]))
+                
+                assignments = ', '.join(f'{column} = ?' for column in added_filters)
+                cursor.executemany(f'UPDATE {table} SET {assignments} WHERE id = ?', updates)
+            
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+    
+    @property
+    def enable_compression(self) -> bool:
+        """Whether new records are compressed."""
+        return self._enable_compression
+    
+    @enable_compression.setter
+    def enable_compression(self, value: bool):
+        self._enable_compression = value
+        self._select_transform()
+    
+    @property
+    def enable_encryption(self) -> bool:
+        """Whether new records are encrypted."""
+        return self._enable_encryption
+    
+    @enable_encryption.setter
+    def enable_encryption(self, value: bool):
+        self._enable_encryption = value
+        self._select_transform()
+    
+    def _select_transform(self):
+        """Bind the record transforms for the current settings so the hot path doesn't branch."""
+        compress = self.compression_manager.compress_bytes if self.enable_compression and self.compression_manager else None
+        encrypt = self.encryption_manager.encrypt_bytes if self.enable_encryption and self.encryption_manager else None
+        none_id = _CODEC_IDS[CompressionType.NONE]
+        codec_id = _CODEC_IDS[self.compression_manager.compression_type] if compress else none_id
+        calculate_hash = DataIntegrityManager.calculate_hash
+        
+        def compress_if_worthwhile(json_data):
+            # Codec setup costs more than it saves on small records, which may even grow
+            if len(json_data) < _MIN_COMPRESSION_SIZE:
+                return json_data, none_id
+            return compress(json_data), codec_id
+        
+        # AES-GCM authenticates encrypted records, so only unencrypted ones carry a checksum
+        if compress and encrypt:
+            def compress_and_encrypt(json_data):
+                compressed_data, record_codec = compress_if_worthwhile(json_data)
+                return encrypt(compressed_data), record_codec, ''
+            self._transform = compress_and_encrypt
+        elif encrypt:
+            self._transform = lambda json_data: (encrypt(json_data), none_id, '')
+        elif compress:
+            def compress_and_hash(json_data):
+                compressed_data, record_codec = compress_if_worthwhile(json_data)
+                return compressed_data, record_codec, calculate_hash(compressed_data)
+            self._transform = compress_and_hash
+        else:
+            self._transform = lambda json_data: (json_data, none_id, calculate_hash(json_data))
+        
+        self._decrypt = (
+            self.encryption_manager.decrypt_bytes if self.enable_encryption and self.encryption_manager
+            else (lambda encrypted_data: encrypted_data)
+        )
+        self._select_records = _SQL_SELECT_RECORD if encrypt else _SQL_SELECT_RECORD_WITH_CHECKSUM
     
-    def _encrypt_and_compress_data(self, data: Dict[str, Any]) -> tuple:
+    def _encrypt_and_compress_data(self, data: Dict[str, Any], json_data: Optional[bytes] = None) -> tuple:
         """
         Encrypt and compress data.
         
         Args:
             data: Data dictionary to process
+            json_data: Data already serialized by the caller (optional)
             
         Returns:
-            Tuple of (processed_data, compression_type, checksum)
+            Tuple of (processed_data, compression codec id, checksum)
         """
-        # Convert to JSON string
-        json_data = json.dumps(data, ensure_ascii=False)
+        # Serialize straight to JSON bytes
+        if json_data is None:
+            json_data = serialization.dumps(data)
         
-        # Compress if enabled
-        if self.enable_compression and self.compression_manager:
-            compressed_data = self.compression_manager.compress_string(json_data)
-            compression_type = self.compression_manager.compression_type.value
-        else:
-            compressed_data = json_data.encode('utf-8')
-            compression_type = 'none'
-        
-        # Encrypt if enabled
-        if self.enable_encryption and self.encryption_manager:
-            encrypted_data = self.encryption_manager.cipher.encrypt(compressed_data)
-        else:
-            encrypted_data = compressed_data
-        
-        # Calculate checksum for integrity verification
-        checksum = DataIntegrityManager.calculate_hash(encrypted_data)
-        
-        return encrypted_data, compression_type, checksum
+        return self._transform(json_data)
     
-    def _decrypt_and_decompress_data(self, encrypted_data: bytes, compression_type: str, 
+    def _decrypt_and_decompress_data(self, encrypted_data: bytes, compression_type: int, 
                                    checksum: str) -> Dict[str, Any]:
         """
         Decrypt and decompress data.
         
         Args:
             encrypted_data: Encrypted data bytes
-            compression_type: Type of compression used
-            checksum: Expected checksum for verification
+            compression_type: Id of the compression codec used
+            checksum: Expected checksum for verification (empty for authenticated encryption)
             
         Returns:
             Decrypted and decompressed data dictionary
         """
-        # Verify data integrity
-        if not DataIntegrityManager.verify_hash(encrypted_data, checksum):
+        # Verify data integrity; authenticated records carry no checksum
+        if checksum and not DataIntegrityManager.verify_hash(encrypted_data, checksum):
             raise ValueError("Data integrity check failed - data may be corrupted")
         
-        # Decrypt if enabled
-        if self.enable_encryption and self.encryption_manager:
-            decrypted_data = self.encryption_manager.cipher.decrypt(encrypted_data)
-        else:
-            decrypted_data = encrypted_data
+        # Decrypt if enabled (also accepts records written with Fernet)
+        decrypted_data = self._decrypt(encrypted_data)
         
-        # Decompress if enabled
-        if compression_type != 'none' and self.compression_manager:
-            decompressed_data = self.compression_manager.decompress_bytes(decrypted_data)
+        # Decompress with the codec the record was written with
+        if compression_type != _CODEC_IDS[CompressionType.NONE]:
+            decompressed_data = self._get_decompressor(compression_type).decompress_bytes(decrypted_data)
         else:
             decompressed_data = decrypted_data
         
         # Convert back to dictionary
-        json_string = decompressed_data.decode('utf-8')
-        return json.loads(json_string)
+        return serialization.loads(decompressed_data)
+    
+    def _decrypt_row(self, row: tuple, record_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Decrypt one (id, encrypted_data, compression_type, checksum) row.
+        
+        Args:
+            row: Row selected from a secure table
+            record_type: Record name used in error messages
+            
+        Returns:
+            Record dictionary with its id, or None if it could not be decrypted
+        """
+        try:
+            record = self._decrypt_and_decompress_data(row[1], row[2], row[3])
+            record['id'] = row[0]
+            return record
+        except Exception as e:
+            print(f"Error decrypting {record_type} {row[0]}: {str(e)}")
+            return None
+    
+    def _get_decompressor(self, compression_type: int) -> CompressionManager:
+        """Get a compression manager for a stored codec id, creating it once."""
+        manager = self._decompressors.get(compression_type)
+        if manager is None:
+            manager = CompressionManager(_CODECS_BY_ID[compression_type])
+            self._decompressors[compression_type] = manager
+        return manager
     
     def _insert_sample_data(self):
         """Insert sample data if tables are empty."""
@@ -208,10 +507,9 @@ class SecureStorageManager:
         # Check if we already have data
         cursor.execute("SELECT COUNT(*) FROM handovers")
         if cursor.fetchone()[0] == 0:
-            current_time = datetime.now().isoformat()
-            
             # Sample handover data
             sample_handover = {
+                'id': '1',
                 'from_team': 'Coverage',
                 'to_team': 'Analysis',
                 'date': '2024-01-15',
@@ -220,89 +518,123 @@ class SecureStorageManager:
                 'status': 'Completed'
             }
             
-            encrypted_data, compression_type, checksum = self._encrypt_and_compress_data(sample_handover)
-            
-            cursor.execute('''
-                INSERT INTO handovers (id, encrypted_data, compression_type, encryption_checksum, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', ('1', encrypted_data, compression_type, checksum, current_time, current_time))
-            
-            conn.commit()
-        
-        conn.close()
+            self.bulk_add('handovers', [sample_handover])
     
-    # Handover operations
-    def add_handover(self, handover_data: Dict[str, Any]) -> str:
-        """Add a new handover with encryption and compression."""
-        handover_id = handover_data.get('id', f"handover_{datetime.now().timestamp()}")
-        current_time = datetime.now().isoformat()
+    def bulk_add(self, table: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert many records into a secure table in a single transaction.
         
-        encrypted_data, compression_type, checksum = self._encrypt_and_compress_data(handover_data)
+        Args:
+            table: One of the secure tables (handovers, requirements, issues, test_suites)
+            rows: Records to encrypt and insert
+            
+        Returns:
+            List of inserted record IDs
+        """
+        if table not in _ID_PREFIXES:
+            raise ValueError(f"Unknown secure table: {table}")
+        
+        current_time = _now_us()
+        
+        # Random fixed-width suffixes can't collide between rows written in the same instant
+        prefix = _ID_PREFIXES[table]
+        ids = [row.get('id') or f"{prefix}_{secrets.token_hex(8)}" for row in rows]
+        filter_columns = _FILTER_COLUMNS.get(table, ())
+        prepared_rows = []
+        meta_rows = []
+        for record_id, row in zip(ids, rows):
+            json_data = plaintext_hash = None
+            if table == 'handovers':
+                # Handovers are stored in canonical form so later updates can be compared by hash
+                json_data = _canonical_json(row, record_id)
+                plaintext_hash = _plaintext_hash(json_data)
+            encrypted_data, compression_type, checksum = self._encrypt_and_compress_data(row, json_data)
+            prepared_rows.append((record_id, encrypted_data, compression_type,
+                                  *(row.get(column) for column in filter_columns)))
+            meta_rows.append((record_id, checksum, current_time, current_time, plaintext_hash))
         
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO handovers (id, encrypted_data, compression_type, encryption_checksum, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (handover_id, encrypted_data, compression_type, checksum, current_time, current_time))
-        
-        conn.commit()
-        conn.close()
-        return handover_id
+        cursor.execute('BEGIN')
+        try:
+            cursor.executemany(_SQL_INSERT[table], prepared_rows)
+            cursor.executemany(_SQL_INSERT_META[table], meta_rows)
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        
+        return ids
+    
+    # Handover operations
+    def add_handover(self, handover_data: Dict[str, Any]) -> str:
+        """Add a new handover with encryption and compression."""
+        return self.bulk_add('handovers', [handover_data])[0]
     
     def get_handovers(self, status_filter: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get handovers with optional filtering."""
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT id, encrypted_data, compression_type, encryption_checksum FROM handovers')
+        # Filter in SQL so only matching rows are decrypted
+        query = self._select_records.format(table='handovers')
+        if status_filter and status_filter != "All":
+            cursor.execute(query + ' WHERE status = ?', (status_filter,))
+        else:
+            cursor.execute(query)
         rows = cursor.fetchall()
-        conn.close()
-        
-        handovers = []
-        for row in rows:
-            try:
-                handover_data = self._decrypt_and_decompress_data(row[1], row[2], row[3])
-                handover_data['id'] = row[0]
-                
-                # Apply status filter if specified
-                if not status_filter or status_filter == "All" or handover_data.get('status') == status_filter:
-                    handovers.append(handover_data)
-            except Exception as e:
-                print(f"Error decrypting handover {row[0]}: {str(e)}")
-                continue
         
-        return handovers
+        # Decrypt in parallel; rows that fail to decrypt come back as None
+        results = parallel_map(lambda row: self._decrypt_row(row, 'handover'), rows)
+        return [handover for handover in results if handover is not None]
     
     def update_handover(self, handover_id: str, handover_data: Dict[str, Any]):
-        """Update an existing handover."""
-        current_time = datetime.now().isoformat()
+        """Update an existing handover, skipping re-encryption when nothing changed."""
+        current_time = _now_us()
         
-        encrypted_data, compression_type, checksum = self._encrypt_and_compress_data(handover_data)
+        json_data = _canonical_json(handover_data, handover_id)
+        plaintext_hash = _plaintext_hash(json_data)
         
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            UPDATE handovers 
-            SET encrypted_data = ?, compression_type = ?, encryption_checksum = ?, updated_at = ?
-            WHERE id = ?
-        ''', (encrypted_data, compression_type, checksum, current_time, handover_id))
+        # The hash written with the row reflects every writer; rows from before it was stored have none
+        cursor.execute(_SQL_SELECT_HANDOVER_HASH, (handover_id,))
+        stored = cursor.fetchone()
+        if stored is not None and stored[0] == plaintext_hash:
+            cursor.execute(_SQL_TOUCH_HANDOVER, (current_time, handover_id))
+            return
         
-        conn.commit()
-        conn.close()
+        encrypted_data, compression_type, checksum = self._encrypt_and_compress_data(handover_data, json_data)
+        
+        cursor.execute('BEGIN')
+        try:
+            cursor.execute(_SQL_UPDATE_HANDOVER, (
+                encrypted_data, compression_type,
+                handover_data.get('status'), handover_data.get('priority'), handover_id
+            ))
+            cursor.execute(_SQL_UPDATE_HANDOVER_META, (checksum, current_time, plaintext_hash, handover_id))
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
     
     def delete_handover(self, handover_id: str) -> bool:
         """Delete a handover."""
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('DELETE FROM handovers WHERE id = ?', (handover_id,))
-        deleted = cursor.rowcount > 0
+        cursor.execute('BEGIN')
+        try:
+            cursor.execute(_SQL_DELETE_HANDOVER, (handover_id,))
+            deleted = cursor.rowcount > 0
+            cursor.execute(_SQL_DELETE_HANDOVER_META, (handover_id,))
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
         
-        conn.commit()
-        conn.close()
         return deleted
     
     # Similar methods for other entities (requirements, issues, test_suites)
@@ -310,22 +642,7 @@ class SecureStorageManager:
     
     def add_requirement(self, requirement_data: Dict[str, Any]) -> str:
         """Add a new requirement with encryption and compression."""
-        requirement_id = requirement_data.get('id', f"req_{datetime.now().timestamp()}")
-        current_time = datetime.now().isoformat()
-        
-        encrypted_data, compression_type, checksum = self._encrypt_and_compress_data(requirement_data)
-        
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO requirements (id, encrypted_data, compression_type, encryption_checksum, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (requirement_id, encrypted_data, compression_type, checksum, current_time, current_time))
-        
-        conn.commit()
-        conn.close()
-        return requirement_id
+        return self.bulk_add('requirements', [requirement_data])[0]
     
     def get_requirements(self, status_filter: Optional[str] = None, 
                         priority_filter: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -333,28 +650,25 @@ class SecureStorageManager:
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT id, encrypted_data, compression_type, encryption_checksum FROM requirements')
+        # Filter in SQL so only matching rows are decrypted
+        conditions = []
+        params = []
+        if status_filter and status_filter != "All":
+            conditions.append('status = ?')
+            params.append(status_filter)
+        if priority_filter and priority_filter != "All":
+            conditions.append('priority = ?')
+            params.append(priority_filter)
+        
+        query = self._select_records.format(table='requirements')
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
-        
-        requirements = []
-        for row in rows:
-            try:
-                requirement_data = self._decrypt_and_decompress_data(row[1], row[2], row[3])
-                requirement_data['id'] = row[0]
-                
-                # Apply filters
-                if status_filter and status_filter != "All" and requirement_data.get('status') != status_filter:
-                    continue
-                if priority_filter and priority_filter != "All" and requirement_data.get('priority') != priority_filter:
-                    continue
-                
-                requirements.append(requirement_data)
-            except Exception as e:
-                print(f"Error decrypting requirement {row[0]}: {str(e)}")
-                continue
         
-        return requirements
+        # Decrypt in parallel; rows that fail to decrypt come back as None
+        results = parallel_map(lambda row: self._decrypt_row(row, 'requirement'), rows)
+        return [requirement for requirement in results if requirement is not None]
     
     def get_security_status(self) -> Dict[str, Any]:
         """Get current security settings."""
@@ -363,15 +677,14 @@ class SecureStorageManager:
         
         cursor.execute('SELECT * FROM security_settings WHERE id = 1')
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
                 'encryption_enabled': bool(row[1]),
                 'compression_enabled': bool(row[2]),
                 'compression_type': row[3],
-                'last_password_change': row[4],
-                'created_at': row[5]
+                'last_password_change': _format_timestamp(row[4]),
+                'created_at': _format_timestamp(row[5])
             }
         return {}
     
@@ -388,36 +701,64 @@ class SecureStorageManager:
                 UPDATE security_settings 
                 SET last_password_change = ?
                 WHERE id = 1
-            ''', (datetime.now().isoformat(),))
+            ''', (_now_us(),))
             
             conn.commit()
-            conn.close()
     
     def create_backup(self, backup_path: str) -> str:
         """Create encrypted backup of the database."""
-        # Copy database file
-        import shutil
-        shutil.copy2(self.db_name, backup_path)
-        
-        # Encrypt the backup if encryption is enabled
-        if self.enable_encryption and self.encryption_manager:
-            encrypted_backup = self.encryption_manager.encrypt_file(backup_path)
-            os.remove(backup_path)  # Remove unencrypted backup
-            return encrypted_backup
+        if not (self.enable_encryption and self.encryption_manager):
+            self._snapshot_database(backup_path)
+            return backup_path
+        
+        # Snapshot next to the backup, then encrypt it one chunk at a time
+        encrypted_backup = f"{backup_path}.enc"
+        fd, snapshot_path = tempfile.mkstemp(suffix='.db', dir=os.path.dirname(os.path.abspath(backup_path)))
+        os.close(fd)
+        try:
+            self._snapshot_database(snapshot_path)
+            with open(snapshot_path, 'rb') as source, open(encrypted_backup, 'wb') as sink:
+                self.encryption_manager.encrypt_stream(source, sink)
+        finally:
+            os.remove(snapshot_path)
+        return encrypted_backup
+    
+    def _snapshot_database(self, path: str):
+        """Copy a consistent snapshot of the database to path using SQLite's online backup API."""
+        destination = sqlite3.connect(path)
+        try:
+            # Safe while other connections write; pages committed mid-copy restart the step
+            self._get_connection().backup(destination)
+        finally:
+            destination.close()
+    
+    def _restore_snapshot(self, path: str):
+        """Copy the database at path over the live one page by page using SQLite's online backup API."""
+        snapshot = sqlite3.connect(path)
+        try:
+            # Goes through the WAL, so other open connections see the restored pages
+            # instead of replaying their frames over a file copied underneath them
+            snapshot.backup(self._get_connection(), pages=1024)
+        finally:
+            snapshot.close()
         
-        return backup_path
+        # The backup may predate the current schema
+        self._create_secure_tables()
     
     def restore_backup(self, backup_path: str, password: Optional[str] = None) -> bool:
         """Restore from encrypted backup."""
         try:
-            # Decrypt backup if it's encrypted
+            # Decrypt backup if it's encrypted, streaming it to a temp file next to the backup
             if password and self.encryption_manager:
-                temp_manager = EncryptionManager(password)
-                decrypted_backup = temp_manager.decrypt_file(backup_path)
-                shutil.copy2(decrypted_backup, self.db_name)
-                os.remove(decrypted_backup)  # Clean up temp file
+                fd, snapshot_path = tempfile.mkstemp(suffix='.db', dir=os.path.dirname(os.path.abspath(backup_path)))
+                os.close(fd)
+                try:
+                    EncryptionManager(password).decrypt_file(backup_path, snapshot_path)
+                    self._restore_snapshot(snapshot_path)
+                finally:
+                    os.remove(snapshot_path)  # Clean up temp file
             else:
-                shutil.copy2(backup_path, self.db_name)
+                self._restore_snapshot(backup_path)
             
             return True
         except Exception as e:
@@ -2,6 +2,7 @@
 Authentication UI components for login, registration, and password management.
 """
 
+import re
 import flet as ft
 from typing import Callable, Optional, Dict, Any, List
 from datetime import datetime
@@ -10,6 +11,21 @@ from ...models.user import User, UserRole, UserStatus
 from ...utils.validators import Validators
 from ...config import ThemeConfig
 
+# Compiled once at import; validation runs on every submit
+_EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$")
+
+# Recipient count label in the notification dialog
+_RECIPIENTS_FMT = "Recipients: {} users selected"
+_RECIPIENTS_ONE = "Recipients: 1 user selected"
+
+# Registration rules: (field, min length, error if shorter, pattern, error if no match)
+_REG_RULES = (
+    ('username', 3, "Username must be at least 3 characters", None, None),
+    ('email', 1, "Please enter a valid email address",
+     _EMAIL_RE, "Please enter a valid email address"),
+    ('password', 8, "Password must be at least 8 characters", None, None),
+)
+
 class AuthManager:
     """Manager for authentication UI components."""
     
@@ -18,9 +34,57 @@ class AuthManager:
         self.show_snackbar = show_snackbar
         self.current_user = None
         self.session_token = None
+        
+        # Component colors per theme, resolved once instead of on every event
+        self._theme_colors = {
+            ft.ThemeMode.DARK: ThemeConfig.COMPONENT_COLORS.get('dark', {}),
+            ft.ThemeMode.LIGHT: ThemeConfig.COMPONENT_COLORS.get('light', {}),
+        }
+        self._muted_cache = {
+            mode: colors.get('muted_text', '#90A4AE') for mode, colors in self._theme_colors.items()
+        }
+        self._flet_muted_cache = {
+            ft.ThemeMode.DARK: ft.colors.WHITE70,
+            ft.ThemeMode.LIGHT: ft.colors.GREY_600,
+        }
+        
+        # The last notification dialog, keyed by theme and users; its buttons call self._notif_callback
+        self._notif_cache: Dict[tuple, ft.AlertDialog] = {}
+        self._notif_callback: Optional[Callable[[Dict[str, str]], None]] = None
+        
+        # App bar user displays keyed by user ID, cleared on logout
+        self._user_info_cache: Dict[str, ft.Container] = {}
+        
+        # Dialogs built on first use and reused; their buttons call the current callbacks
+        self._login_dialog: Optional[ft.AlertDialog] = None
+        self._login_callback: Optional[Callable[[str, str], None]] = None
+        self._forgot_dialog: Optional[ft.AlertDialog] = None
+        self._forgot_callback: Optional[Callable[[str], None]] = None
+        self._change_pwd_dialog: Optional[ft.AlertDialog] = None
+        self._change_pwd_callback: Optional[Callable[[str, str], None]] = None
+    
+    def _theme_key(self) -> ft.ThemeMode:
+        """Get the color cache key for the current theme; anything but dark renders as light."""
+        if self.page and self.page.theme_mode == ft.ThemeMode.DARK:
+            return ft.ThemeMode.DARK
+        return ft.ThemeMode.LIGHT
+    
+    def _reset_dialog_fields(self, dialog: ft.AlertDialog):
+        """Clear the input controls a cached dialog keeps in its data."""
+        for control in dialog.data:
+            control.value = False if isinstance(control, ft.Checkbox) else ""
     
     def show_login_dialog(self, on_login: Callable[[str, str], None] = None):
         """Show login dialog."""
+        self._login_callback = on_login
+        if self._login_dialog is None:
+            self._login_dialog = self._build_login_dialog()
+        else:
+            self._reset_dialog_fields(self._login_dialog)
+        self.show_dialog(self._login_dialog)
+    
+    def _build_login_dialog(self) -> ft.AlertDialog:
+        """Build the login dialog; it calls the current self._login_callback."""
         
         username_field = ft.TextField(
             label="Username or Email",
@@ -48,8 +112,8 @@ class AuthManager:
                 self.show_snackbar("Please enter username and password")
                 return
             
-            if on_login:
-                on_login(username, password)
+            if self._login_callback:
+                self._login_callback(username, password)
         
         def show_register_dialog(e):
             self.close_dialog(dialog)
@@ -76,9 +140,10 @@ class AuthManager:
                 ft.ElevatedButton("Login", on_click=login_clicked),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data=[username_field, password_field, remember_checkbox],
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
     def show_register_dialog(self, on_register: Callable[[Dict[str, str]], None] = None):
         """Show registration dialog."""
@@ -171,6 +236,15 @@ class AuthManager:
     
     def show_forgot_password_dialog(self, on_reset: Callable[[str], None] = None):
         """Show forgot password dialog."""
+        self._forgot_callback = on_reset
+        if self._forgot_dialog is None:
+            self._forgot_dialog = self._build_forgot_password_dialog()
+        else:
+            self._reset_dialog_fields(self._forgot_dialog)
+        self.show_dialog(self._forgot_dialog)
+    
+    def _build_forgot_password_dialog(self) -> ft.AlertDialog:
+        """Build the forgot password dialog; it calls the current self._forgot_callback."""
         
         email_field = ft.TextField(
             label="Email Address",
@@ -185,12 +259,12 @@ class AuthManager:
                 self.show_snackbar("Please enter your email address")
                 return
             
-            if '@' not in email:
+            if _EMAIL_RE.match(email) is None:
                 self.show_snackbar("Please enter a valid email address")
                 return
             
-            if on_reset:
-                on_reset(email)
+            if self._forgot_callback:
+                self._forgot_callback(email)
         
         def show_login_dialog(e):
             self.close_dialog(dialog)
@@ -209,12 +283,24 @@ class AuthManager:
                 ft.ElevatedButton("Send Reset Link", on_click=reset_clicked),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data=[email_field],
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
     def show_change_password_dialog(self, on_change: Callable[[str, str], None] = None):
         """Show change password dialog."""
+        self._change_pwd_callback = on_change
+        if self._change_pwd_dialog is None:
+            self._change_pwd_dialog = self._build_change_password_dialog()
+        else:
+            self._reset_dialog_fields(self._change_pwd_dialog)
+        # The hint follows the theme, which may have changed since the dialog was built
+        self._change_pwd_hint.color = self._muted_cache[self._theme_key()]
+        self.show_dialog(self._change_pwd_dialog)
+    
+    def _build_change_password_dialog(self) -> ft.AlertDialog:
+        """Build the change password dialog; it calls the current self._change_pwd_callback."""
         
         current_password_field = ft.TextField(
             label="Current Password",
@@ -255,13 +341,11 @@ class AuthManager:
                 self.show_snackbar("Password must be at least 8 characters long")
                 return
             
-            if on_change:
-                on_change(current_password, new_password)
+            if self._change_pwd_callback:
+                self._change_pwd_callback(current_password, new_password)
+        
+        self._change_pwd_hint = ft.Text("Password must be at least 8 characters long", size=12)
         
-        def _muted_text_color() -> str:
-            theme = 'dark' if (self.page and self.page.theme_mode == ft.ThemeMode.DARK) else 'light'
-            return ThemeConfig.COMPONENT_COLORS.get(theme, {}).get('muted_text', '#90A4AE')
-
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Change Password"),
@@ -269,16 +353,17 @@ class AuthManager:
                 current_password_field,
                 new_password_field,
                 confirm_password_field,
-                ft.Text("Password must be at least 8 characters long", size=12, color=_muted_text_color())
+                self._change_pwd_hint
             ], height=250),
             actions=[
                 ft.TextButton("Cancel", on_click=lambda e: self.close_dialog(dialog)),
                 ft.ElevatedButton("Change Password", on_click=change_clicked),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data=[current_password_field, new_password_field, confirm_password_field],
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
     def show_user_profile_dialog(self, user: User, on_update: Callable[[Dict[str, str]], None] = None):
         """Show user profile dialog."""
@@ -368,6 +453,25 @@ class AuthManager:
     def show_notification_dialog(self, on_send: Callable[[Dict[str, str]], None] = None, 
                                 users_list: List[User] = None):
         """Show notification sending dialog with user selection."""
+        self._notif_callback = on_send
+        theme_key = self._theme_key()
+        
+        # Reuse the dialog built for the same users so its controls never leave the page
+        cache_key = (theme_key, tuple(
+            (user.id, user.email_verified, user.email, user.get_full_name()) for user in users_list or []
+        ))
+        dialog = self._notif_cache.get(cache_key)
+        if dialog is None:
+            dialog = self._build_notification_dialog(users_list or [], theme_key)
+            # Only the latest dialog is worth keeping; older ones list users that changed
+            self._notif_cache = {cache_key: dialog}
+        
+        # The dialog's data clears the form and selects every verified user again
+        dialog.data()
+        self.show_dialog(dialog)
+    
+    def _build_notification_dialog(self, users_list: List[User], theme_key: ft.ThemeMode) -> ft.AlertDialog:
+        """Build the notification dialog; it calls the current self._notif_callback."""
         
         subject_field = ft.TextField(
             label="Subject",
@@ -394,8 +498,24 @@ class AuthManager:
             value="info"
         )
         
-        # User selection components
+        # Local aliases for the Flet namespaces used throughout the dialog
+        colors = ft.colors
+        icons = ft.icons
+        
+        # The dialog is cached per theme, so its colors are resolved once
+        is_dark = theme_key == ft.ThemeMode.DARK
+        muted_color = self._flet_muted_cache[theme_key]
+        
+        # Partition users in one pass; only verified users can receive emails
+        verified_users, unverified_users = [], []
+        for user in users_list:
+            (verified_users if user.email_verified else unverified_users).append(user)
+        # Fixed for the dialog's lifetime; Select All copies it in one C-level update
+        verified_ids = frozenset(user.id for user in verified_users)
+        
+        # User selection components; all verified users are selected on every show
         selected_users = set()  # Track selected user IDs
+        total_available = len(verified_ids)
         
         def select_all_users(e):
             """Select or deselect all users."""
@@ -403,99 +523,61 @@ class AuthManager:
             selected_users.clear()
             
             if select_all:
-                for user in users_list or []:
-                    if user.email_verified:  # Only verified users
-                        selected_users.add(user.id)
+                selected_users.update(verified_ids)
             
-            # Update all checkboxes
-            for control in user_checkboxes:
-                if isinstance(control, ft.Checkbox):
-                    control.value = select_all and control.data in selected_users
+            # Update all user checkboxes
+            for checkbox in checkbox_by_id.values():
+                checkbox.value = select_all
             
             update_recipient_count()
-            self.page.update()
+            # One update for the whole list instead of one per checkbox
+            user_selection_column.update()
         
-        def on_user_checkbox_change(e, user_id: str):
-            """Handle individual user checkbox change."""
+        def on_user_checkbox_change(e):
+            """Handle individual user checkbox change; the user ID is the checkbox's data."""
             if e.control.value:
-                selected_users.add(user_id)
+                selected_users.add(e.control.data)
             else:
-                selected_users.discard(user_id)
+                selected_users.discard(e.control.data)
             
             # Update select all checkbox
-            total_available = len([u for u in users_list or [] if u.email_verified])
             select_all_checkbox.value = len(selected_users) == total_available
             
             update_recipient_count()
-            self.page.update()
+            # Only the controls that changed; the clicked checkbox already shows its value
+            select_all_checkbox.update()
+            recipient_count.update()
         
         def update_recipient_count():
             """Update the recipient count display."""
             count = len(selected_users)
-            recipient_count.value = f"Recipients: {count} user{'s' if count != 1 else ''} selected"
-            recipient_count.color = ft.colors.WHITE70 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_600
-        
-        # Create user selection UI
-        user_selection_content = []
-        user_checkboxes = []
-        
-        if users_list:
-            # Select all checkbox
-            select_all_checkbox = ft.Checkbox(
-                label="Select All Users",
-                value=False,
-                on_change=select_all_users
-            )
-            user_selection_content.append(select_all_checkbox)
-            user_checkboxes.append(select_all_checkbox)
-            
-            # Recipient count with dynamic color
-            def _get_muted_color():
-                return ft.colors.WHITE70 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_600
-            
-            recipient_count = ft.Text("Recipients: 0 users selected", size=12, color=_get_muted_color())
-            user_selection_content.append(recipient_count)
-            
-            user_selection_content.append(ft.Divider())
-            
-            # Individual user checkboxes
-            verified_users = [u for u in users_list if u.email_verified]
-            unverified_users = [u for u in users_list if not u.email_verified]
-            
-            if verified_users:
-                user_selection_content.append(
-                    ft.Text("Verified Users:", size=14, weight=ft.FontWeight.BOLD, color=ft.colors.GREEN_700)
-                )
-                
-                for user in verified_users:
-                    checkbox = ft.Checkbox(
-                        label=f"{user.get_full_name()} ({user.email})",
-                        value=False,
-                        data=user.id,  # Store user ID in data property
-                        on_change=lambda e, uid=user.id: on_user_checkbox_change(e, uid)
-                    )
-                    user_selection_content.append(checkbox)
-                    user_checkboxes.append(checkbox)
+            recipient_count.value = _RECIPIENTS_ONE if count == 1 else _RECIPIENTS_FMT.format(count)
+            recipient_count.color = muted_color
+        
+        selection = self._build_user_selection(verified_users, unverified_users, muted_color, is_dark)
+        user_selection_content = selection['content']
+        checkbox_by_id = selection['checkboxes']
+        select_all_checkbox = selection['select_all']
+        recipient_count = selection['recipient_count']
+        
+        if select_all_checkbox:
+            select_all_checkbox.on_change = select_all_users
+            for checkbox in checkbox_by_id.values():
+                checkbox.on_change = on_user_checkbox_change
+        
+        def reset_form():
+            """Clear the message and select all verified users, as on the first show."""
+            subject_field.value = ""
+            message_field.value = ""
+            notification_type_dropdown.value = "info"
+            selected_users.clear()
+            selected_users.update(verified_ids)
             
-            if unverified_users:
-                user_selection_content.append(ft.Container(height=10))
-                user_selection_content.append(
-                    ft.Text("Unverified Users (cannot receive emails):", 
-                           size=12, color=ft.colors.WHITE70 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_600, italic=True)
-                )
-                
-                for user in unverified_users:
-                    user_selection_content.append(
-                        ft.Text(
-                            f"  • {user.get_full_name()} ({user.email})",
-                            size=12, 
-                            color=ft.colors.WHITE60 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_500
-                        )
-                    )
-        else:
-            user_selection_content.append(
-                ft.Text("No users available", color=ft.colors.WHITE70 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_600)
-            )
+            if select_all_checkbox:
+                select_all_checkbox.value = bool(selected_users)
+                for checkbox in checkbox_by_id.values():
+                    checkbox.value = True
+                update_recipient_count()
         
         def send_clicked(e):
             form_data = {
@@ -513,29 +595,19 @@ class AuthManager:
                 self.show_snackbar("Please select at least one user to send to")
                 return
             
-            if on_send:
-                on_send(form_data)
-        
-        # Initialize with all users selected by default
-        if users_list:
-            for user in users_list:
-                if user.email_verified:
-                    selected_users.add(user.id)
-            
-            # Set initial values for checkboxes
-            select_all_checkbox.value = len(selected_users) > 0
-            
-            # Update user checkboxes to reflect initial selection
-            for checkbox in user_checkboxes:
-                if isinstance(checkbox, ft.Checkbox) and hasattr(checkbox, 'data'):
-                    checkbox.value = checkbox.data in selected_users
-            
-            update_recipient_count()
+            if self._notif_callback:
+                self._notif_callback(form_data)
+        
+        user_selection_column = ft.Column(
+            user_selection_content,
+            scroll=ft.ScrollMode.AUTO,
+            spacing=5
+        )
         
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Row([
-                ft.Icon(ft.icons.SEND, color=ft.colors.BLUE_600),
+                ft.Icon(icons.SEND, color=colors.BLUE_600),
                 ft.Text("Send Notification", size=18, weight=ft.FontWeight.BOLD)
             ], spacing=10),
             content=ft.Container(
@@ -544,7 +616,7 @@ class AuthManager:
                     ft.Card(
                         content=ft.Container(
                             content=ft.Column([
-                                ft.Text("Message Details", size=16, weight=ft.FontWeight.BOLD, color=ft.colors.BLUE_700),
+                                ft.Text("Message Details", size=16, weight=ft.FontWeight.BOLD, color=colors.BLUE_700),
                                 ft.Container(height=10),
                                 subject_field,
                                 message_field,
@@ -561,19 +633,15 @@ class AuthManager:
                     ft.Card(
                         content=ft.Container(
                             content=ft.Column([
-                                ft.Text("Select Recipients", size=16, weight=ft.FontWeight.BOLD, color=ft.colors.GREEN_700),
+                                ft.Text("Select Recipients", size=16, weight=ft.FontWeight.BOLD, color=colors.GREEN_700),
                                 ft.Container(height=10),
                                 ft.Container(
-                                    content=ft.Column(
-                                        user_selection_content,
-                                        scroll=ft.ScrollMode.AUTO,
-                                        spacing=5
-                                    ),
+                                    content=user_selection_column,
                                     height=180,
-                                    border=ft.border.all(1, ft.colors.GREY_600 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_200),
+                                    border=ft.border.all(1, colors.GREY_600 if is_dark else colors.GREY_200),
                                     border_radius=8,
                                     padding=10,
-                                    bgcolor=ft.colors.GREY_900 if self.page.theme_mode == ft.ThemeMode.DARK else ft.colors.GREY_50
+                                    bgcolor=colors.GREY_900 if is_dark else colors.GREY_50
                                 )
                             ], spacing=5),
                             padding=15
@@ -594,33 +662,99 @@ class AuthManager:
                     ft.TextButton(
                         "Cancel", 
                         on_click=lambda e: self.close_dialog(dialog),
-                        icon=ft.icons.CANCEL
+                        icon=icons.CANCEL
                     ),
                     ft.ElevatedButton(
                         "Send Notification", 
                         on_click=send_clicked,
-                        icon=ft.icons.SEND,
-                        bgcolor=ft.colors.BLUE_600,
-                        color=ft.colors.WHITE
+                        icon=icons.SEND,
+                        bgcolor=colors.BLUE_600,
+                        color=colors.WHITE
                     ),
                 ], alignment=ft.MainAxisAlignment.END, spacing=10)
             ],
+            data=reset_form,
         )
         
-        self.show_dialog(dialog)
+        return dialog
+    
+    def _build_user_selection(self, verified_users: List[User], unverified_users: List[User],
+                              muted_color: str, is_dark: bool) -> Dict[str, Any]:
+        """
+        Build the recipient selection controls for the notification dialog.
+        
+        Args:
+            verified_users: Users who can receive emails
+            unverified_users: Users shown for reference only
+            muted_color: Color for secondary text
+            is_dark: Whether the dark theme is active
+            
+        Returns:
+            Dictionary with the 'content' controls, the 'select_all' checkbox, the
+            'recipient_count' text and the per-user 'checkboxes' keyed by user ID
+            (None/empty without users)
+        """
+        user_selection_content = []
+        checkbox_by_id: Dict[str, ft.Checkbox] = {}
+        
+        if not verified_users and not unverified_users:
+            user_selection_content.append(
+                ft.Text("No users available", color=muted_color)
+            )
+            return {'content': user_selection_content, 'select_all': None,
+                    'recipient_count': None, 'checkboxes': checkbox_by_id}
+        
+        # Select all checkbox
+        select_all_checkbox = ft.Checkbox(label="Select All Users")
+        user_selection_content.append(select_all_checkbox)
+        
+        recipient_count = ft.Text(size=12, color=muted_color)
+        user_selection_content.append(recipient_count)
+        
+        user_selection_content.append(ft.Divider())
+        
+        # Individual user checkboxes
+        if verified_users:
+            user_selection_content.append(
+                ft.Text("Verified Users:", size=14, weight=ft.FontWeight.BOLD, color=ft.colors.GREEN_700)
+            )
+            
+            Checkbox = ft.Checkbox  # Looked up once rather than per user
+            for user in verified_users:
+                checkbox = Checkbox(
+                    label=f"{user.get_full_name()} ({user.email})",
+                    data=user.id  # Store user ID in data property
+                )
+                user_selection_content.append(checkbox)
+                checkbox_by_id[user.id] = checkbox
+        
+        if unverified_users:
+            user_selection_content.append(ft.Container(height=10))
+            user_selection_content.append(
+                ft.Text("Unverified Users (cannot receive emails):", 
+                       size=12, color=muted_color, italic=True)
+            )
+            
+            unverified_color = ft.colors.WHITE60 if is_dark else ft.colors.GREY_500
+            Text = ft.Text
+            user_selection_content.extend(
+                Text(f"  • {user.get_full_name()} ({user.email})", size=12, color=unverified_color)
+                for user in unverified_users
+            )
+        
+        return {'content': user_selection_content, 'select_all': select_all_checkbox,
+                'recipient_count': recipient_count, 'checkboxes': checkbox_by_id}
     
     def _validate_registration_data(self, data: Dict[str, str]) -> List[str]:
         """Validate registration form data."""
         errors = []
         
-        if not data.get('username') or len(data['username']) < 3:
-            errors.append("Username must be at least 3 characters")
-        
-        if not data.get('email') or '@' not in data['email']:
-            errors.append("Please enter a valid email address")
-        
-        if not data.get('password') or len(data['password']) < 8:
-            errors.append("Password must be at least 8 characters")
+        for field, min_length, length_error, pattern, pattern_error in _REG_RULES:
+            value = data.get(field) or ''
+            if len(value) < min_length:
+                errors.append(length_error)
+            elif pattern is not None and pattern.match(value) is None:
+                errors.append(pattern_error)
         
         if data.get('password') != data.get('confirm_password'):
             errors.append("Passwords do not match")
@@ -629,25 +763,36 @@ class AuthManager:
     
     def create_user_info_display(self, user: User) -> ft.Container:
         """Create user information display for app bar."""
-        return ft.Container(
+        # Reuse the display built for this user; refresh only what can change
+        cached = self._user_info_cache.get(user.id)
+        if cached is not None:
+            cached.data = user
+            cached.content.controls[1].value = user.get_full_name()
+            return cached
+        
+        container = ft.Container(
             content=ft.Row([
                 ft.Icon(ft.icons.PERSON),
                 ft.Text(user.get_full_name()),
                 ft.PopupMenuButton(
                     items=[
-                        ft.PopupMenuItem(text="Profile", on_click=lambda e: self.show_user_profile_dialog(user)),
+                        ft.PopupMenuItem(text="Profile", on_click=lambda e: self.show_user_profile_dialog(container.data)),
                         ft.PopupMenuItem(text="Change Password", on_click=lambda e: self.show_change_password_dialog()),
                         ft.PopupMenuItem(text="Logout", on_click=lambda e: self.logout())
                     ]
                 )
             ]),
-            padding=10
+            padding=10,
+            data=user
         )
+        self._user_info_cache[user.id] = container
+        return container
     
     def logout(self):
         """Logout current user."""
         self.current_user = None
         self.session_token = None
+        self._user_info_cache.clear()
         self.show_snackbar("Logged out successfully")
         # In a real app, you would redirect to login page
     
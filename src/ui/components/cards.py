@@ -3,222 +3,267 @@ Card components for displaying data items.
 """
 
 import flet as ft
-from typing import Dict, Any, Callable
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime
 from ...config import ThemeConfig
 
+# Icons and colors used while building cards, resolved once at import
+_ICON_EDIT = ft.icons.EDIT
+_ICON_DELETE = ft.icons.DELETE
+_ICON_PLAY = ft.icons.PLAY_ARROW
+_ICON_INFO = ft.icons.INFO
+_COL_RED = ft.colors.RED
+_COL_GREEN = ft.colors.GREEN
+_COL_WHITE = ft.colors.WHITE
+
+# Shared keyword arguments for the card action buttons
+_EDIT_BTN_KW = {'icon': _ICON_EDIT}
+_DEL_BTN_KW = {'icon': _ICON_DELETE, 'color': _COL_RED, 'width': 100}
+_RERUN_BTN_KW = {'icon': _ICON_PLAY}
+
+# Components that have a data card, precomputed per batch
+_CARD_COMPONENTS = ('handovers', 'requirements', 'issues', 'test_suites')
+
+# Darker stat card colors for dark mode, matched by name in the requested color (in order)
+_DARK_COLOR_MAP = {
+    'orange': ft.colors.ORANGE_700,
+    'red': ft.colors.RED_700,
+    'purple': ft.colors.PURPLE_700,
+    'blue': ft.colors.BLUE_700,
+}
+
+# Activity type -> (icon, color, label) for recent activity items
+_ACTIVITY_META = {
+    'handover': (ft.icons.TRANSFER_WITHIN_A_STATION, ft.colors.BLUE, "Handover"),
+    'requirement': (ft.icons.ASSIGNMENT, ft.colors.GREEN, "Requirement"),
+    'issue': (ft.icons.BUG_REPORT, ft.colors.RED, "Issue"),
+    'test_suite': (ft.icons.PLAY_ARROW, ft.colors.ORANGE, "Test Suite"),
+}
+
+@lru_cache(maxsize=512)
+def _format_timestamp(iso: str) -> str:
+    """Format an ISO timestamp for the activity list; re-renders hit the cache."""
+    try:
+        return datetime.fromisoformat(iso).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return "Recently"
+
+def _format_subtitle(label: str, description: str) -> str:
+    """Format an activity subtitle, truncating long descriptions to 50 characters."""
+    if len(description) > 50:
+        return f"{label} • {description[:50]}..."
+    return f"{label} • {description}"
+
+@dataclass
+class _BatchCtx:
+    """Theme values resolved once for a batch of cards built together."""
+    theme: str
+    palette: Dict[str, Any]
+    muted: str
+    bg_by_component: Dict[str, str]
+
 class CardManager:
     """Manager for creating data display cards."""
     
+    __slots__ = ('page', 'get_priority_color', '_palette_cache', '_bg_cache',
+                 '_priority_color_cache', '_status_color_cache')
+    
     def __init__(self, page: ft.Page, get_priority_color: Callable[[str], str]):
         self.page = page
         self.get_priority_color = get_priority_color
+        # Resolved colors per theme; ThemeConfig doesn't change at runtime
+        self._palette_cache: Dict[str, Dict[str, Any]] = {}
+        self._bg_cache: Dict[tuple, str] = {}
+        self._priority_color_cache: Dict[tuple, str] = {}
+        self._status_color_cache: Dict[tuple, str] = {}
 
     def _current_theme(self) -> str:
         return 'dark' if (self.page and self.page.theme_mode == ft.ThemeMode.DARK) else 'light'
 
     def _palette(self) -> Dict[str, Any]:
-        from ...config import ThemeConfig
-        return ThemeConfig.COMPONENT_COLORS.get(self._current_theme(), {})
+        theme = self._current_theme()
+        palette = self._palette_cache.get(theme)
+        if palette is None:
+            palette = self._palette_cache[theme] = ThemeConfig.COMPONENT_COLORS.get(theme, {})
+        return palette
 
-    def _component_bg(self, component: str) -> str:
-        p = self._palette()
-        return p.get(component, {}).get('bg') or p.get('appbar', {}).get('bg') or '#ECEFF1'
+    def begin_batch(self) -> _BatchCtx:
+        """
+        Resolve the theme once for a list of cards; the theme can't change mid-render.
+        
+        Returns:
+            Context to pass as ctx to each create_*_card call in the batch
+        """
+        return _BatchCtx(
+            theme=self._current_theme(),
+            palette=self._palette(),
+            muted=self._muted_text_color(),
+            bg_by_component={component: self._component_bg(component) for component in _CARD_COMPONENTS},
+        )
+
+    def _component_bg(self, component: str, ctx: Optional[_BatchCtx] = None) -> str:
+        if ctx is not None and component in ctx.bg_by_component:
+            return ctx.bg_by_component[component]
+        key = (self._current_theme(), component)
+        bg = self._bg_cache.get(key)
+        if bg is None:
+            p = self._palette()
+            bg = self._bg_cache[key] = p.get(component, {}).get('bg') or p.get('appbar', {}).get('bg') or '#ECEFF1'
+        return bg
 
     def _muted_text_color(self) -> str:
         return self._palette().get('muted_text', '#90A4AE')
-    
-    def create_handover_card(self, handover: Dict[str, Any], 
-                           on_edit: Callable[[Dict[str, Any]], None] = None,
-                           on_delete: Callable[[Dict[str, Any]], None] = None) -> ft.Card:
-        """Create a handover display card."""
+
+    def _priority_color(self, priority: str, ctx: Optional[_BatchCtx] = None) -> str:
+        # get_priority_color follows the theme, so cache per (theme, priority)
+        key = (ctx.theme if ctx else self._current_theme(), priority)
+        color = self._priority_color_cache.get(key)
+        if color is None:
+            color = self._priority_color_cache[key] = self.get_priority_color(priority)
+        return color
+
+    def _test_status_color(self, passed: bool, ctx: Optional[_BatchCtx] = None) -> str:
+        key = (ctx.theme if ctx else self._current_theme(), passed)
+        color = self._status_color_cache.get(key)
+        if color is None:
+            palette = ctx.palette if ctx else self._palette()
+            color = self._status_color_cache[key] = (
+                palette.get('test_suites', {}).get('accent', '#FB8C00')
+                if passed
+                else palette.get('issues', {}).get('accent', '#D32F2F')
+            )
+        return color
+
+    def _dispatch(self, handler: Callable[[Dict[str, Any]], None], item: Dict[str, Any], e):
+        """Forward a card button click to its handler, if one was given."""
+        return handler(item) if handler else None
+
+    def _make_action_row(self, item: Dict[str, Any],
+                         on_edit: Callable[[Dict[str, Any]], None] = None,
+                         on_delete: Callable[[Dict[str, Any]], None] = None,
+                         on_rerun: Callable[[Dict[str, Any]], None] = None,
+                         rerunnable: bool = False) -> ft.Row:
+        """Build a card's Edit/Delete button row, led by Re-run for rerunnable items."""
+        buttons = []
+        if rerunnable:
+            buttons.append(ft.ElevatedButton("Re-run", **_RERUN_BTN_KW, on_click=partial(self._dispatch, on_rerun, item)))
+        buttons.append(ft.ElevatedButton("Edit", **_EDIT_BTN_KW, on_click=partial(self._dispatch, on_edit, item)))
+        buttons.append(ft.ElevatedButton("Delete", **_DEL_BTN_KW, on_click=partial(self._dispatch, on_delete, item)))
+        return ft.Row(buttons, spacing=5)
+
+    def _wrap_card(self, controls: List[ft.Control], component: str,
+                   ctx: Optional[_BatchCtx] = None) -> ft.Card:
+        """Wrap a card's rows in the shared Card > Container > Column layout."""
         return ft.Card(
             content=ft.Container(
-                content=ft.Column([
-                    ft.ListTile(
-                        title=ft.Text(f"{handover['from_team']} → {handover['to_team']}"),
-                        subtitle=ft.Text(handover['description']),
-                        trailing=ft.Text(handover['status']),
-                    ),
-                    ft.Row([
-                        ft.Text(f"Date: {handover['date']}", size=12),
-                        ft.Text(f"Documents: {len(handover['documents'])}", size=12),
-                    ], spacing=20),
-                    ft.Row([
-                        ft.ElevatedButton(
-                            "Edit", 
-                            icon=ft.icons.EDIT,
-                            on_click=lambda e: on_edit(handover) if on_edit else None
-                        ),
-                        ft.ElevatedButton(
-                            "Delete", 
-                            icon=ft.icons.DELETE, 
-                            color=ft.colors.RED,
-                            width=100,
-                            on_click=lambda e: on_delete(handover) if on_delete else None
-                        ),
-                    ], spacing=5)
-                ]),
+                content=ft.Column(controls),
                 padding=10,
-                bgcolor=self._component_bg('handovers'),
+                bgcolor=self._component_bg(component, ctx),
                 border_radius=10
             ),
             margin=10
         )
     
+    def create_handover_card(self, handover: Dict[str, Any], 
+                           on_edit: Callable[[Dict[str, Any]], None] = None,
+                           on_delete: Callable[[Dict[str, Any]], None] = None,
+                           ctx: Optional[_BatchCtx] = None) -> ft.Card:
+        """Create a handover display card."""
+        return self._wrap_card([
+            ft.ListTile(
+                title=ft.Text(f"{handover['from_team']} → {handover['to_team']}"),
+                subtitle=ft.Text(handover['description']),
+                trailing=ft.Text(handover['status']),
+            ),
+            ft.Row([
+                ft.Text(f"Date: {handover['date']}", size=12),
+                ft.Text(f"Documents: {len(handover['documents'])}", size=12),
+            ], spacing=20),
+            self._make_action_row(handover, on_edit, on_delete)
+        ], 'handovers', ctx)
+    
     def create_requirement_card(self, requirement: Dict[str, Any],
                               on_edit: Callable[[Dict[str, Any]], None] = None,
-                              on_delete: Callable[[Dict[str, Any]], None] = None) -> ft.Card:
+                              on_delete: Callable[[Dict[str, Any]], None] = None,
+                              ctx: Optional[_BatchCtx] = None) -> ft.Card:
         """Create a requirement display card."""
-        return ft.Card(
-            content=ft.Container(
-                content=ft.Column([
-                    ft.ListTile(
-                        title=ft.Text(requirement['title']),
-                        subtitle=ft.Text(requirement['description']),
-                        trailing=ft.Container(
-                            content=ft.Text(requirement['priority'], color=ft.colors.WHITE),
-                            bgcolor=self.get_priority_color(requirement['priority']),
-                            padding=ft.padding.symmetric(horizontal=10, vertical=5),
-                            border_radius=5
-                        ),
-                    ),
-                    ft.Row([
-                        ft.Text(f"Change Date: {requirement['change_date']}", size=12),
-                        ft.Text(f"Status: {requirement['status']}", size=12),
-                    ], spacing=20),
-                    ft.Row([
-                        ft.ElevatedButton(
-                            "Edit", 
-                            icon=ft.icons.EDIT,
-                            on_click=lambda e: on_edit(requirement) if on_edit else None
-                        ),
-                        ft.ElevatedButton(
-                            "Delete", 
-                            icon=ft.icons.DELETE, 
-                            color=ft.colors.RED,
-                            width=100,
-                            on_click=lambda e: on_delete(requirement) if on_delete else None
-                        ),
-                    ], spacing=5)
-                ]),
-                padding=10,
-                bgcolor=self._component_bg('requirements'),
-                border_radius=10
+        return self._wrap_card([
+            ft.ListTile(
+                title=ft.Text(requirement['title']),
+                subtitle=ft.Text(requirement['description']),
+                trailing=ft.Container(
+                    content=ft.Text(requirement['priority'], color=_COL_WHITE),
+                    bgcolor=self._priority_color(requirement['priority'], ctx),
+                    padding=ft.padding.symmetric(horizontal=10, vertical=5),
+                    border_radius=5
+                ),
             ),
-            margin=10
-        )
+            ft.Row([
+                ft.Text(f"Change Date: {requirement['change_date']}", size=12),
+                ft.Text(f"Status: {requirement['status']}", size=12),
+            ], spacing=20),
+            self._make_action_row(requirement, on_edit, on_delete)
+        ], 'requirements', ctx)
     
     def create_issue_card(self, issue: Dict[str, Any],
                          on_edit: Callable[[Dict[str, Any]], None] = None,
-                         on_delete: Callable[[Dict[str, Any]], None] = None) -> ft.Card:
+                         on_delete: Callable[[Dict[str, Any]], None] = None,
+                         ctx: Optional[_BatchCtx] = None) -> ft.Card:
         """Create an issue display card."""
-        return ft.Card(
-            content=ft.Container(
-                content=ft.Column([
-                    ft.ListTile(
-                        title=ft.Text(issue['title']),
-                        subtitle=ft.Text(issue['description']),
-                        trailing=ft.Column([
-                            ft.Text(issue['status']),
-                            ft.Text(issue['priority'], 
-                                   color=self.get_priority_color(issue['priority']))
-                        ])
-                    ),
-                    ft.Row([
-                        ft.Text(f"Type: {issue['type']}", size=12),
-                        ft.Text(f"Assigned: {issue['assigned_to']}", size=12),
-                    ], spacing=20),
-                    ft.Row([
-                        ft.ElevatedButton(
-                            "Edit", 
-                            icon=ft.icons.EDIT,
-                            on_click=lambda e: on_edit(issue) if on_edit else None
-                        ),
-                        ft.ElevatedButton(
-                            "Delete", 
-                            icon=ft.icons.DELETE, 
-                            color=ft.colors.RED,
-                            width=100,
-                            on_click=lambda e: on_delete(issue) if on_delete else None
-                        ),
-                    ], spacing=5)
-                ]),
-                padding=10,
-                bgcolor=self._component_bg('issues'),
-                border_radius=10
+        return self._wrap_card([
+            ft.ListTile(
+                title=ft.Text(issue['title']),
+                subtitle=ft.Text(issue['description']),
+                trailing=ft.Column([
+                    ft.Text(issue['status']),
+                    ft.Text(issue['priority'], 
+                           color=self._priority_color(issue['priority'], ctx))
+                ])
             ),
-            margin=10
-        )
+            ft.Row([
+                ft.Text(f"Type: {issue['type']}", size=12),
+                ft.Text(f"Assigned: {issue['assigned_to']}", size=12),
+            ], spacing=20),
+            self._make_action_row(issue, on_edit, on_delete)
+        ], 'issues', ctx)
     
     def create_test_suite_card(self, test_suite: Dict[str, Any],
                              on_edit: Callable[[Dict[str, Any]], None] = None,
                              on_delete: Callable[[Dict[str, Any]], None] = None,
-                             on_rerun: Callable[[Dict[str, Any]], None] = None) -> ft.Card:
+                             on_rerun: Callable[[Dict[str, Any]], None] = None,
+                             ctx: Optional[_BatchCtx] = None) -> ft.Card:
         """Create a test suite display card."""
         # Color by status using theme palette
-        from ...config import ThemeConfig
-        theme = self._current_theme()
-        palette = ThemeConfig.COMPONENT_COLORS.get(theme, {})
-        status_color = (
-            palette.get('test_suites', {}).get('accent', '#FB8C00')
-            if test_suite['status'] == 'Passed'
-            else palette.get('issues', {}).get('accent', '#D32F2F')
-        )
+        status_color = self._test_status_color(test_suite['status'] == 'Passed', ctx)
         
-        return ft.Card(
-            content=ft.Container(
-                content=ft.Column([
-                    ft.ListTile(
-                        title=ft.Text(test_suite['name']),
-                        subtitle=ft.Text(f"Last Run: {test_suite['last_run']}"),
-                        trailing=ft.Column([
-                            ft.Text(test_suite['status'], color=status_color),
-                            ft.Text(f"Failures: {test_suite['failures']}", 
-                                   color=ft.colors.RED if test_suite['failures'] > 0 else ft.colors.GREEN)
-                        ])
-                    ),
-                    ft.Text(f"Fix Notes: {test_suite.get('fix_notes', '')}", size=12) if test_suite.get('fix_notes') else ft.Container(),
-                    ft.Row([
-                        ft.ElevatedButton(
-                            "Re-run", 
-                            icon=ft.icons.PLAY_ARROW,
-                            on_click=lambda e: on_rerun(test_suite) if on_rerun else None
-                        ),
-                        ft.ElevatedButton(
-                            "Edit", 
-                            icon=ft.icons.EDIT,
-                            on_click=lambda e: on_edit(test_suite) if on_edit else None
-                        ),
-                        ft.ElevatedButton(
-                            "Delete", 
-                            icon=ft.icons.DELETE, 
-                            color=ft.colors.RED,
-                            width=100,
-                            on_click=lambda e: on_delete(test_suite) if on_delete else None
-                        ),
-                    ], spacing=5)
-                ]),
-                padding=10,
-                bgcolor=self._component_bg('test_suites'),
-                border_radius=10
+        children = [
+            ft.ListTile(
+                title=ft.Text(test_suite['name']),
+                subtitle=ft.Text(f"Last Run: {test_suite['last_run']}"),
+                trailing=ft.Column([
+                    ft.Text(test_suite['status'], color=status_color),
+                    ft.Text(f"Failures: {test_suite['failures']}", 
+                           color=_COL_RED if test_suite['failures'] > 0 else _COL_GREEN)
+                ])
             ),
-            margin=10
-        )
+        ]
+        # No placeholder control when there are no fix notes
+        fix_notes = test_suite.get('fix_notes')
+        if fix_notes:
+            children.append(ft.Text(f"Fix Notes: {fix_notes}", size=12))
+        children.append(self._make_action_row(test_suite, on_edit, on_delete, on_rerun, rerunnable=True))
+        
+        return self._wrap_card(children, 'test_suites', ctx)
     
     def create_stat_card(self, title: str, value: str, color: str) -> ft.Card:
         """Create a statistics card for dashboard."""
         # Adjust colors for dark mode
         if self.page.theme_mode == ft.ThemeMode.DARK:
             # Make colors slightly darker for dark mode
-            if 'orange' in color.lower():
-                color = ft.colors.ORANGE_700
-            elif 'red' in color.lower():
-                color = ft.colors.RED_700
-            elif 'purple' in color.lower():
-                color = ft.colors.PURPLE_700
-            elif 'blue' in color.lower():
-                color = ft.colors.BLUE_700
+            color_lower = color.lower()
+            color = next((dark for name, dark in _DARK_COLOR_MAP.items() if name in color_lower), color)
         
         return ft.Card(
             content=ft.Container(
@@ -237,39 +282,25 @@ class CardManager:
             margin=5
         )
     
-    def create_activity_item(self, activity: Dict[str, Any]) -> ft.ListTile:
+    def create_activity_item(self, activity: Dict[str, Any], ctx: Optional[_BatchCtx] = None) -> ft.ListTile:
         """Create a recent activity list item."""
+        muted = ctx.muted if ctx else self._muted_text_color()
         # Determine icon and color based on activity type
-        if activity['type'] == 'handover':
-            icon = ft.icons.TRANSFER_WITHIN_A_STATION
-            color = ft.colors.BLUE
-            subtitle = f"Handover • {activity.get('description', '')[:50]}..."
-        elif activity['type'] == 'requirement':
-            icon = ft.icons.ASSIGNMENT
-            color = ft.colors.GREEN
-            subtitle = f"Requirement • {activity.get('description', '')[:50]}..."
-        elif activity['type'] == 'issue':
-            icon = ft.icons.BUG_REPORT
-            color = ft.colors.RED
-            subtitle = f"Issue • {activity.get('description', '')[:50]}..."
-        elif activity['type'] == 'test_suite':
-            icon = ft.icons.PLAY_ARROW
-            color = ft.colors.ORANGE
-            subtitle = f"Test Suite • {activity.get('description', '')[:50]}..."
+        meta = _ACTIVITY_META.get(activity['type'])
+        if meta is not None:
+            icon, color, label = meta
+            subtitle = _format_subtitle(label, activity.get('description', ''))
         else:
-            icon = ft.icons.INFO
-            color = self._muted_text_color()
+            icon = _ICON_INFO
+            color = muted
             subtitle = "Activity"
         
         # Format timestamp
-        try:
-            timestamp = datetime.fromisoformat(activity['updated_at']).strftime("%Y-%m-%d %H:%M")
-        except:
-            timestamp = "Recently"
+        timestamp = _format_timestamp(activity['updated_at'])
         
         return ft.ListTile(
             title=ft.Text(activity['title']),
             subtitle=ft.Text(subtitle),
             leading=ft.Icon(icon, color=color),
-            trailing=ft.Text(timestamp, size=12, color=self._muted_text_color()),
+            trailing=ft.Text(timestamp, size=12, color=muted),
         )
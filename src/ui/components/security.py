@@ -2,167 +2,334 @@
 Security settings and management UI components.
 """
 
+import re
 import flet as ft
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Callable, Optional, Dict, Any
 from datetime import datetime
 from ...config import SecurityConfig
-from ...utils.compression import CompressionType
+from ...utils.compression import CompressionType, MAX_COMPRESSION_LEVELS, ZSTD_DEFAULT_LEVEL
+
+# Delay before a burst of slider drag events updates the level label
+_SLIDER_DEBOUNCE_SECONDS = 0.15
+
+# Retention days as typed: ASCII digits only, so int() never raises; compiled once at import
+_RETENTION_RE = re.compile(r"^[0-9]{1,4}$")
+
+# Status labels indexed by the on/off flag
+_STATE = ("Disabled", "Enabled")
+
+# On/off status rows: (title, enabled key, (icon off, on), (color off, on), subtitle suffix)
+_STATUS_SPEC = (
+    ('Encryption', 'encryption_enabled', (ft.icons.LOCK_OPEN, ft.icons.LOCK),
+     (ft.colors.RED, ft.colors.GREEN), None),
+    ('Compression', 'compression_enabled', (ft.icons.EXPAND, ft.icons.COMPRESS),
+     (ft.colors.ORANGE, ft.colors.GREEN), lambda status: f" ({status.get('compression_type', 'none')})"),
+)
+
+def _status_tile(spec: tuple) -> ft.ListTile:
+    """Build the status row for one _STATUS_SPEC entry; _fill_status_tile sets its state."""
+    return ft.ListTile(
+        title=ft.Text(spec[0]),
+        subtitle=ft.Text(),
+        trailing=ft.Icon()
+    )
+
+def _fill_status_tile(tile: ft.ListTile, spec: tuple, security_status: Dict[str, Any]):
+    """Show one _STATUS_SPEC entry's current state in its row."""
+    title, key, icons, colors, suffix = spec
+    enabled = bool(security_status.get(key))
+    tile.subtitle.value = _STATE[enabled] if suffix is None else _STATE[enabled] + suffix(security_status)
+    tile.trailing.name = icons[enabled]
+    tile.trailing.color = colors[enabled]
+
+def _max_level(type_value: Optional[str]) -> int:
+    """Highest compression level the slider offers for a codec name."""
+    return MAX_COMPRESSION_LEVELS.get(CompressionType(type_value), 9) if type_value else 9
+
+# Settings read back on save: (key, default when missing, conversion of the control value)
+_SETTING_FIELDS = (
+    ('encryption_enabled', SecurityConfig.ENABLE_ENCRYPTION, None),
+    ('password', '', None),
+    ('compression_enabled', SecurityConfig.ENABLE_COMPRESSION, None),
+    ('compression_type', SecurityConfig.DEFAULT_COMPRESSION_TYPE, None),
+    ('compression_level', SecurityConfig.COMPRESSION_LEVEL, None),
+    ('backup_encryption', SecurityConfig.BACKUP_ENCRYPTION, None),
+    ('backup_compression', SecurityConfig.BACKUP_COMPRESSION, None),
+    ('retention_days', SecurityConfig.BACKUP_RETENTION_DAYS, lambda value: int(value) if value and _RETENTION_RE.match(value) else 30),
+    ('enable_checksums', SecurityConfig.ENABLE_CHECKSUMS, None),
+    ('verify_integrity_on_read', SecurityConfig.VERIFY_INTEGRITY_ON_READ, None),
+)
+# Defaults by key; each open merges the current settings over them once
+_SETTING_DEFAULTS = {key: default for key, default, _ in _SETTING_FIELDS}
+
+# Password change checks in order: (fails(current, new, confirm), message)
+_PASSWORD_RULES = (
+    (lambda current, new, confirm: not current, "Please enter current password"),
+    (lambda current, new, confirm: not new, "Please enter new password"),
+    (lambda current, new, confirm: new != confirm, "New passwords do not match"),
+    (lambda current, new, confirm: len(new) < 8, "Password must be at least 8 characters long"),
+)
 
 class SecurityManager:
     """Manager for security-related UI components."""
     
+    __slots__ = ('page', 'show_snackbar', '_compression_opts', '_pending_timer', '_suppress_update',
+                 '_settings_dialog', '_settings_fields', '_settings_current', '_settings_callback', '_level_text',
+                 '_backup_dialog', '_backup_callback', '_restore_callback', '_executor',
+                 '_password_dialog', '_password_callback', '_status_dialog')
+    
     def __init__(self, page: ft.Page, show_snackbar: Callable[[str], None]):
         self.page = page
         self.show_snackbar = show_snackbar
+        
+        # Dropdown options built once; the enum is fixed. Dialogs get a shallow copy
+        self._compression_opts = tuple(
+            ft.dropdown.Option(comp_type.value, comp_type.value.title()) for comp_type in CompressionType
+        )
+        
+        # Trailing-edge timer for debounced slider feedback
+        self._pending_timer: Optional[threading.Timer] = None
+        # Set while a _coalesce_update block defers page updates to its exit
+        self._suppress_update = False
+        
+        # Dialogs built on first use and reused; their buttons read the current open's state
+        self._settings_dialog: Optional[ft.AlertDialog] = None
+        self._settings_fields: Dict[str, ft.Control] = {}
+        self._settings_current: Dict[str, Any] = {}
+        self._settings_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._level_text: Optional[ft.Text] = None
+        self._backup_dialog: Optional[ft.AlertDialog] = None
+        self._backup_callback: Optional[Callable[[], None]] = None
+        self._restore_callback: Optional[Callable[[], None]] = None
+        # One worker, created on first use: backup and restore run off the event handler, one at a time
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._password_dialog: Optional[ft.AlertDialog] = None
+        self._password_callback: Optional[Callable[[str], None]] = None
+        self._status_dialog: Optional[ft.AlertDialog] = None
     
     def show_security_settings_dialog(self, current_settings: Dict[str, Any],
                                     on_save: Callable[[Dict[str, Any]], None] = None):
         """Show security settings dialog."""
+        self._settings_current = {**_SETTING_DEFAULTS, **current_settings}
+        self._settings_callback = on_save
+        if self._settings_dialog is None:
+            self._settings_dialog = self._build_security_settings_dialog()
+        else:
+            # Sections built in an earlier open show the new values; the rest load them on expand
+            self._load_settings()
+        self.show_dialog(self._settings_dialog)
+    
+    def _load_settings(self, keys: Optional[set] = None):
+        """
+        Show the current settings in the controls built so far.
+        
+        Args:
+            keys: Only load these settings, e.g. a newly built section's; default all
+        """
+        current = self._settings_current
+        fields = self._settings_fields
+        for key, _, _ in _SETTING_FIELDS:
+            control = fields.get(key)
+            if control is None or (keys is not None and key not in keys):
+                continue
+            value = current[key]
+            if key == 'compression_level':
+                self._set_compression_level(fields['compression_type'].value, value)
+            elif key == 'retention_days':
+                control.value = str(value)
+            else:
+                control.value = value
+    
+    def _set_compression_level(self, type_value: Optional[str], level: float):
+        """Fit the level slider to a codec's range and show level in it."""
+        slider = self._settings_fields['compression_level']
+        slider.max = _max_level(type_value)
+        slider.divisions = slider.max - 1
+        slider.value = min(level, slider.max)
+        # The slider keeps its integer level in data, so save doesn't convert it
+        slider.data = int(slider.value)
+        self._level_text.value = f"Compression Level: {slider.data}"
+    
+    def _build_security_settings_dialog(self) -> ft.AlertDialog:
+        """Build the security settings dialog; it reads the current open's settings and callback."""
+        
+        # Setting controls by key, filled in as their sections are first expanded
+        fields = self._settings_fields
+        
+        def build_encryption():
+            fields['encryption_enabled'] = ft.Checkbox(label="Enable Encryption")
+            fields['password'] = ft.TextField(
+                label="Encryption Password",
+                password=True,
+                can_reveal_password=True,
+                width=400
+            )
+            return [fields['encryption_enabled'], fields['password']]
         
-        # Encryption settings
-        encryption_enabled = ft.Checkbox(
-            label="Enable Encryption",
-            value=current_settings.get('encryption_enabled', SecurityConfig.ENABLE_ENCRYPTION)
-        )
-        
-        password_field = ft.TextField(
-            label="Encryption Password",
-            password=True,
-            can_reveal_password=True,
-            width=400,
-            value=current_settings.get('password', '')
-        )
-        
-        # Compression settings
-        compression_enabled = ft.Checkbox(
-            label="Enable Compression",
-            value=current_settings.get('compression_enabled', SecurityConfig.ENABLE_COMPRESSION)
-        )
-        
-        compression_type_dropdown = ft.Dropdown(
-            label="Compression Type",
-            width=400,
-            options=[
-                ft.dropdown.Option(comp_type.value, comp_type.value.title())
-                for comp_type in CompressionType
-            ],
-            value=current_settings.get('compression_type', SecurityConfig.DEFAULT_COMPRESSION_TYPE)
-        )
-        
-        compression_level_slider = ft.Slider(
-            label="Compression Level",
-            min=1,
-            max=9,
-            divisions=8,
-            value=current_settings.get('compression_level', SecurityConfig.COMPRESSION_LEVEL),
-            width=400
-        )
-        
-        # Backup settings
-        backup_encryption = ft.Checkbox(
-            label="Encrypt Backups",
-            value=current_settings.get('backup_encryption', SecurityConfig.BACKUP_ENCRYPTION)
-        )
-        
-        backup_compression = ft.Checkbox(
-            label="Compress Backups",
-            value=current_settings.get('backup_compression', SecurityConfig.BACKUP_COMPRESSION)
-        )
-        
-        retention_days = ft.TextField(
-            label="Backup Retention (Days)",
-            width=200,
-            value=str(current_settings.get('retention_days', SecurityConfig.BACKUP_RETENTION_DAYS)),
-            keyboard_type=ft.KeyboardType.NUMBER
-        )
+        def build_compression():
+            fields['compression_enabled'] = ft.Checkbox(label="Enable Compression")
+            
+            def type_changed(e):
+                # The level range follows the codec; zstd starts at its speed/ratio sweet spot
+                slider = fields['compression_level']
+                level = ZSTD_DEFAULT_LEVEL if e.control.value == CompressionType.ZSTD.value else slider.value
+                self._set_compression_level(e.control.value, level)
+                slider.update()
+                self._level_text.update()
+            
+            fields['compression_type'] = ft.Dropdown(
+                label="Compression Type",
+                width=400,
+                options=list(self._compression_opts),
+                on_change=type_changed
+            )
+            self._level_text = ft.Text(size=12)
+            
+            def show_level(value):
+                self._level_text.value = f"Compression Level: {int(float(value))}"
+                self._level_text.update()
+            
+            def level_changed(e):
+                e.control.data = int(e.control.value)
+                # Dragging fires per tick; only the last value in a burst is shown
+                self._debounce(_SLIDER_DEBOUNCE_SECONDS, show_level, e.control.value)
+            
+            def level_change_end(e):
+                e.control.data = int(e.control.value)
+                self._cancel_pending()
+                show_level(e.control.value)
+            
+            fields['compression_level'] = ft.Slider(
+                label="Compression Level",
+                min=1,
+                width=400,
+                on_change=level_changed,
+                on_change_end=level_change_end
+            )
+            return [fields['compression_enabled'], fields['compression_type'], self._level_text, fields['compression_level']]
         
-        # Data integrity
-        enable_checksums = ft.Checkbox(
-            label="Enable Data Integrity Checks",
-            value=current_settings.get('enable_checksums', SecurityConfig.ENABLE_CHECKSUMS)
-        )
+        def build_backup():
+            fields['backup_encryption'] = ft.Checkbox(label="Encrypt Backups")
+            fields['backup_compression'] = ft.Checkbox(label="Compress Backups")
+            
+            def retention_changed(e):
+                # Flag bad input as it is typed; only the field itself is re-sent
+                error = None if not e.control.value or _RETENTION_RE.match(e.control.value) else "Enter up to 4 digits"
+                if (e.control.error_text or None) != error:
+                    e.control.error_text = error
+                    e.control.update()
+            
+            fields['retention_days'] = ft.TextField(
+                label="Backup Retention (Days)",
+                width=200,
+                keyboard_type=ft.KeyboardType.NUMBER,
+                on_change=retention_changed
+            )
+            return [fields['backup_encryption'], fields['backup_compression'], fields['retention_days']]
+        
+        def build_integrity():
+            fields['enable_checksums'] = ft.Checkbox(label="Enable Data Integrity Checks")
+            fields['verify_integrity_on_read'] = ft.Checkbox(label="Verify Integrity on Read")
+            return [fields['enable_checksums'], fields['verify_integrity_on_read']]
+        
+        def expand_section(e):
+            # Build a section's controls the first time it is opened; they stay for later toggles
+            tile = e.control
+            if e.data == "true" and not tile.controls:
+                built_before = set(fields)
+                tile.controls = tile.data()
+                # Only the new section is filled; edits in sections opened earlier are kept
+                self._load_settings(set(fields) - built_before)
+                tile.update()
+        
+        def section(title: str, build: Callable[[], list]) -> ft.ExpansionTile:
+            return ft.ExpansionTile(
+                title=ft.Text(title, size=16, weight=ft.FontWeight.BOLD),
+                controls=[],
+                data=build,
+                on_change=expand_section,
+            )
         
-        verify_on_read = ft.Checkbox(
-            label="Verify Integrity on Read",
-            value=current_settings.get('verify_integrity_on_read', SecurityConfig.VERIFY_INTEGRITY_ON_READ)
-        )
+        def read(key: str, convert: Optional[Callable[[Any], Any]] = None) -> Any:
+            # Sections never opened keep their current setting
+            control = fields.get(key)
+            if control is None:
+                return self._settings_current[key]
+            # Controls that keep a parsed value in data (the level slider) are read from it
+            value = control.value if control.data is None else control.data
+            return convert(value) if convert else value
         
         def save_settings(e):
             try:
-                settings = {
-                    'encryption_enabled': encryption_enabled.value,
-                    'password': password_field.value,
-                    'compression_enabled': compression_enabled.value,
-                    'compression_type': compression_type_dropdown.value,
-                    'compression_level': int(compression_level_slider.value),
-                    'backup_encryption': backup_encryption.value,
-                    'backup_compression': backup_compression.value,
-                    'retention_days': int(retention_days.value) if retention_days.value else 30,
-                    'enable_checksums': enable_checksums.value,
-                    'verify_integrity_on_read': verify_on_read.value
-                }
+                # Only changed settings are passed on, so unchanged ones aren't re-applied
+                changes = {}
+                current = self._settings_current
+                for key, _, convert in _SETTING_FIELDS:
+                    value = read(key, convert)
+                    if value != current[key]:
+                        changes[key] = value
+                # An empty password field keeps the current password
+                if not changes.get('password'):
+                    changes.pop('password', None)
                 
-                if on_save:
-                    on_save(settings)
-                self.close_dialog(dialog)
+                with self._coalesce_update():
+                    if changes and self._settings_callback:
+                        self._settings_callback(changes)
+                    self.close_dialog(dialog)
                 self.show_snackbar("Security settings saved successfully!")
                 
             except Exception as ex:
                 self.show_snackbar(f"Error saving settings: {str(ex)}")
         
-        def close_dialog(e):
-            self.close_dialog(dialog)
-        
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Security Settings"),
-            content=ft.Column([
-                ft.Text("Encryption Settings", size=16, weight=ft.FontWeight.BOLD),
-                encryption_enabled,
-                password_field,
-                ft.Divider(),
-                
-                ft.Text("Compression Settings", size=16, weight=ft.FontWeight.BOLD),
-                compression_enabled,
-                compression_type_dropdown,
-                compression_level_slider,
-                ft.Divider(),
-                
-                ft.Text("Backup Settings", size=16, weight=ft.FontWeight.BOLD),
-                backup_encryption,
-                backup_compression,
-                retention_days,
-                ft.Divider(),
-                
-                ft.Text("Data Integrity", size=16, weight=ft.FontWeight.BOLD),
-                enable_checksums,
-                verify_on_read,
-            ], height=600, scroll=ft.ScrollMode.ADAPTIVE),
+            # ListView only lays out the sections in view; dialogs need it sized explicitly
+            content=ft.ListView([
+                section("Encryption Settings", build_encryption),
+                section("Compression Settings", build_compression),
+                section("Backup Settings", build_backup),
+                section("Data Integrity", build_integrity),
+            ], height=600, width=450, spacing=10),
             actions=[
-                ft.TextButton("Cancel", on_click=close_dialog),
+                ft.TextButton("Cancel", on_click=self._on_close),
                 ft.TextButton("Save", on_click=save_settings),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
     def show_backup_dialog(self, on_backup: Callable[[], None] = None,
                           on_restore: Callable[[], None] = None):
         """Show backup management dialog."""
+        self._backup_callback = on_backup
+        self._restore_callback = on_restore
+        if self._backup_dialog is None:
+            self._backup_dialog = self._build_backup_dialog()
+        self.show_dialog(self._backup_dialog)
+    
+    def _build_backup_dialog(self) -> ft.AlertDialog:
+        """Build the backup dialog; its buttons call the current callbacks."""
         
         backup_button = ft.ElevatedButton(
             "Create Backup",
             icon=ft.icons.BACKUP,
-            on_click=lambda e: self._handle_backup(on_backup)
+            on_click=self._handle_backup
         )
         
         restore_button = ft.ElevatedButton(
             "Restore from Backup",
             icon=ft.icons.RESTORE,
-            on_click=lambda e: self._handle_restore(on_restore)
+            on_click=self._handle_restore
         )
         
+        # Shown while a backup or restore runs in the background
+        progress = ft.ProgressRing(width=20, height=20, visible=False)
+        
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Backup Management"),
@@ -172,19 +339,31 @@ class SecurityManager:
                 ft.Container(height=20),
                 ft.Row([
                     backup_button,
-                    restore_button
+                    restore_button,
+                    progress
                 ], alignment=ft.MainAxisAlignment.CENTER)
             ], height=200),
             actions=[
-                ft.TextButton("Close", on_click=lambda e: self.close_dialog(dialog)),
+                ft.TextButton("Close", on_click=self._on_close),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data=(backup_button, restore_button, progress),
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
     def show_password_change_dialog(self, on_change: Callable[[str], None] = None):
         """Show password change dialog."""
+        self._password_callback = on_change
+        if self._password_dialog is None:
+            self._password_dialog = self._build_password_change_dialog()
+        else:
+            for field in self._password_dialog.data:
+                field.value = ""
+        self.show_dialog(self._password_dialog)
+    
+    def _build_password_change_dialog(self) -> ft.AlertDialog:
+        """Build the password change dialog; it calls the current self._password_callback."""
         
         current_password = ft.TextField(
             label="Current Password",
@@ -208,30 +387,18 @@ class SecurityManager:
         )
         
         def change_password(e):
-            if not current_password.value:
-                self.show_snackbar("Please enter current password")
-                return
+            values = (current_password.value, new_password.value, confirm_password.value)
+            for fails, message in _PASSWORD_RULES:
+                if fails(*values):
+                    self.show_snackbar(message)
+                    return
             
-            if not new_password.value:
-                self.show_snackbar("Please enter new password")
-                return
-            
-            if new_password.value != confirm_password.value:
-                self.show_snackbar("New passwords do not match")
-                return
-            
-            if len(new_password.value) < 8:
-                self.show_snackbar("Password must be at least 8 characters long")
-                return
-            
-            if on_change:
-                on_change(new_password.value)
-            self.close_dialog(dialog)
+            with self._coalesce_update():
+                if self._password_callback:
+                    self._password_callback(new_password.value)
+                self.close_dialog(dialog)
             self.show_snackbar("Password changed successfully!")
         
-        def close_dialog(e):
-            self.close_dialog(dialog)
-        
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Change Password"),
@@ -242,94 +409,154 @@ class SecurityManager:
                 ft.Text("Password must be at least 8 characters long", size=12, color=ft.colors.GREY)
             ], height=250),
             actions=[
-                ft.TextButton("Cancel", on_click=close_dialog),
+                ft.TextButton("Cancel", on_click=self._on_close),
                 ft.TextButton("Change", on_click=change_password),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data=[current_password, new_password, confirm_password],
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
     def show_security_status(self, security_status: Dict[str, Any]):
         """Show security status information."""
+        if self._status_dialog is None:
+            self._status_dialog = self._build_security_status_dialog()
         
-        status_items = []
+        status_tiles, last_change_tile = self._status_dialog.data
+        for tile, spec in zip(status_tiles, _STATUS_SPEC):
+            _fill_status_tile(tile, spec, security_status)
+        last_change_tile.subtitle.value = security_status.get('last_password_change', 'Never')
         
-        # Encryption status
-        encryption_status = "Enabled" if security_status.get('encryption_enabled') else "Disabled"
-        encryption_color = ft.colors.GREEN if security_status.get('encryption_enabled') else ft.colors.RED
+        self.show_dialog(self._status_dialog)
+    
+    def _build_security_status_dialog(self) -> ft.AlertDialog:
+        """Build the security status dialog; show_security_status fills in its rows."""
         
-        status_items.append(
-            ft.ListTile(
-                title=ft.Text("Encryption"),
-                subtitle=ft.Text(encryption_status),
-                trailing=ft.Icon(
-                    ft.icons.LOCK if security_status.get('encryption_enabled') else ft.icons.LOCK_OPEN,
-                    color=encryption_color
-                )
-            )
-        )
-        
-        # Compression status
-        compression_status = "Enabled" if security_status.get('compression_enabled') else "Disabled"
-        compression_color = ft.colors.GREEN if security_status.get('compression_enabled') else ft.colors.ORANGE
-        
-        status_items.append(
-            ft.ListTile(
-                title=ft.Text("Compression"),
-                subtitle=ft.Text(f"{compression_status} ({security_status.get('compression_type', 'none')})"),
-                trailing=ft.Icon(
-                    ft.icons.COMPRESS if security_status.get('compression_enabled') else ft.icons.EXPAND,
-                    color=compression_color
-                )
-            )
-        )
+        status_tiles = [_status_tile(spec) for spec in _STATUS_SPEC]
         
         # Last password change
-        last_change = security_status.get('last_password_change', 'Never')
-        status_items.append(
-            ft.ListTile(
-                title=ft.Text("Last Password Change"),
-                subtitle=ft.Text(last_change),
-                trailing=ft.Icon(ft.icons.SECURITY)
-            )
+        last_change_tile = ft.ListTile(
+            title=ft.Text("Last Password Change"),
+            subtitle=ft.Text(),
+            trailing=ft.Icon(ft.icons.SECURITY)
         )
         
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Security Status"),
-            content=ft.Column([
+            content=ft.ListView([
                 ft.Text("Current Security Configuration", size=16, weight=ft.FontWeight.BOLD),
                 ft.Container(height=10),
-                *status_items
-            ], height=300, scroll=ft.ScrollMode.ADAPTIVE),
+                *status_tiles,
+                last_change_tile
+            ], height=300, width=450, spacing=10),
             actions=[
-                ft.TextButton("Close", on_click=lambda e: self.close_dialog(dialog)),
+                ft.TextButton("Close", on_click=self._on_close),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data=(status_tiles, last_change_tile),
         )
         
-        self.show_dialog(dialog)
+        return dialog
     
-    def _handle_backup(self, on_backup: Callable[[], None]):
+    def _handle_backup(self, e=None):
         """Handle backup creation."""
-        if on_backup:
-            on_backup()
-        self.show_snackbar("Backup created successfully!")
+        self._run_backup_task(self._backup_callback, "Backup created successfully!")
     
-    def _handle_restore(self, on_restore: Callable[[], None]):
+    def _handle_restore(self, e=None):
         """Handle backup restore."""
-        if on_restore:
-            on_restore()
-        self.show_snackbar("Restore initiated. Please select backup file.")
+        self._run_backup_task(self._restore_callback, "Restore initiated. Please select backup file.")
+    
+    def _run_backup_task(self, callback: Optional[Callable[[], None]], done_message: str):
+        """
+        Run a backup dialog callback on the worker thread, showing progress until it finishes.
+        
+        Args:
+            callback: Backup or restore callback; may be None
+            done_message: Snackbar message once the callback has returned
+        """
+        if callback is None:
+            self.show_snackbar(done_message)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bms-backup")
+        
+        self._set_backup_busy(True)
+        
+        def finished(future: Future):
+            self._set_backup_busy(False)
+            error = future.exception()
+            self.show_snackbar(f"Backup operation failed: {str(error)}" if error else done_message)
+        
+        self._executor.submit(callback).add_done_callback(finished)
+    
+    def _set_backup_busy(self, busy: bool):
+        """Show the progress ring and lock the backup buttons while a task runs."""
+        backup_button, restore_button, progress = self._backup_dialog.data
+        backup_button.disabled = restore_button.disabled = busy
+        progress.visible = busy
+        # The user may have closed the dialog while the task ran
+        if self._backup_dialog.page is not None:
+            self._backup_dialog.update()
+    
+    def _debounce(self, delay: float, fn: Callable[..., None], *args):
+        """
+        Run fn after delay seconds unless another call replaces it first.
+        
+        Args:
+            delay: Seconds to wait for the burst to settle
+            fn: Function to run with args once it does
+        """
+        self._cancel_pending()
+        self._pending_timer = threading.Timer(delay, fn, args)
+        self._pending_timer.daemon = True
+        self._pending_timer.start()
+    
+    def _cancel_pending(self):
+        """Drop any debounced call that has not run yet."""
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+    
+    @contextmanager
+    def _coalesce_update(self):
+        """Defer this manager's page updates in the block to a single update on exit."""
+        if self._suppress_update:
+            # Nested block: the outermost one sends the update
+            yield
+            return
+        self._suppress_update = True
+        try:
+            yield
+        finally:
+            self._suppress_update = False
+            self.page.update()
     
     def show_dialog(self, dialog: ft.AlertDialog):
         """Show a dialog."""
-        self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        if self._suppress_update:
+            self.page.dialog = dialog
+        # A dialog already mounted as page.dialog only needs its own diff sent
+        elif self.page.dialog is dialog and dialog.page is not None:
+            dialog.update()
+        else:
+            self.page.dialog = dialog
+            self.page.update()
+    
+    def _on_close(self, e):
+        """Close the dialog whose Cancel/Close button was clicked, i.e. the one shown."""
+        self.close_dialog(self.page.dialog)
     
     def close_dialog(self, dialog: ft.AlertDialog):
         """Close a dialog."""
+        self._cancel_pending()
         dialog.open = False
-        self.page.update()
+        if self._suppress_update:
+            return
+        # Only the dialog changed; a page update would diff the whole control tree
+        if dialog.page is not None:
+            dialog.update()
+        else:
+            self.page.update()
@@ -3,7 +3,8 @@ Main BMS application class.
 """
 
 import flet as ft
-from typing import Dict, Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime
 
 from ..services.bms_service import BMSService
@@ -13,7 +14,7 @@ from ..services.auth_service import AuthService
 from ..services.email_service import EmailService
 from ..utils.export import ExportManager
 from ..utils.backup import BackupManager
-from ..utils.compression import CompressionType
+from ..utils.compression import FAST_COMPRESSION_TYPE
 from ..config import UIConfig, ThemeConfig, SecurityConfig
 from .components.dialogs import DialogManager
 from .components.cards import CardManager
@@ -31,7 +32,7 @@ class BMSApp:
         self.secure_storage = SecureStorageManager(
             enable_encryption=SecurityConfig.ENABLE_ENCRYPTION,
             enable_compression=SecurityConfig.ENABLE_COMPRESSION,
-            compression_type=CompressionType.GZIP
+            compression_type=FAST_COMPRESSION_TYPE
         )
         self.email_service = EmailService()
         self.auth_service = AuthService(email_service=self.email_service)
@@ -48,6 +49,15 @@ class BMSApp:
         self.dashboard_view = None
         self.handovers_view = None
         
+        # Tab contents are built when a tab is first shown; indices whose content is current
+        self.tabs = None
+        self._tab_builders: List[Callable[[], ft.Control]] = []
+        self._tab_loaded: Dict[int, bool] = {}
+        
+        # One worker, created on first use: database reads and exports run off the event
+        # handlers, in the order they were started
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # Authentication state
         self.current_user = None
         self.session_token = None
@@ -128,18 +138,25 @@ class BMSApp:
             on_export=self._export_data
         )
     
-    def _load_data_from_db(self):
-        """Load all data from database including dashboard data."""
-        # Load filtered data for tabs
-        self.handovers = [h.to_dict() for h in self.bms_service.get_handovers(self.handover_status_filter)]
-        self.requirements = [r.to_dict() for r in self.bms_service.get_requirements(
-            self.requirement_status_filter, self.requirement_priority_filter)]
-        self.issues = [i.to_dict() for i in self.bms_service.get_issues(
-            self.issue_type_filter, self.issue_status_filter, self.issue_priority_filter)]
-        self.test_suites = [ts.to_dict() for ts in self.bms_service.get_test_suites(self.test_suite_status_filter)]
-        
-        # Load dashboard data
-        self.dashboard_data = self.bms_service.get_dashboard_data()
+    def _fetch_data(self) -> Dict[str, Any]:
+        """Load all data from database including dashboard data, in one database read."""
+        return self.bms_service.fetch_all({
+            'handover_status': self.handover_status_filter,
+            'requirement_status': self.requirement_status_filter,
+            'requirement_priority': self.requirement_priority_filter,
+            'issue_type': self.issue_type_filter,
+            'issue_status': self.issue_status_filter,
+            'issue_priority': self.issue_priority_filter,
+            'test_suite_status': self.test_suite_status_filter,
+        })
+    
+    def _apply_data(self, data: Dict[str, Any]):
+        """Store data read by _fetch_data."""
+        self.handovers = data['handovers']
+        self.requirements = data['requirements']
+        self.issues = data['issues']
+        self.test_suites = data['test_suites']
+        self.dashboard_data = data['dashboard']
     
     def _create_main_ui(self, page: ft.Page):
         """Create main UI layout."""
@@ -165,6 +182,16 @@ class BMSApp:
             ]
         )
         
+        # Tab content builders, in tab order
+        self._tab_builders = [
+            lambda: self.dashboard_view.create_dashboard_content(self.dashboard_data),
+            self._create_handovers_tab_content,
+            self._create_requirements_content,
+            self._create_issues_content,
+            self._create_test_suites_content,
+        ]
+        self._tab_loaded = {}
+        
         # Create tabs for navigation
         self.tabs = ft.Tabs(
             selected_index=0,
@@ -173,36 +200,67 @@ class BMSApp:
                 ft.Tab(
                     text="Dashboard",
                     icon=ft.icons.DASHBOARD,
-                    content=self.dashboard_view.create_dashboard_content(self.dashboard_data)
+                    content=self._tab_placeholder()
                 ),
                 ft.Tab(
                     text="Handovers",
                     icon=ft.icons.TRANSFER_WITHIN_A_STATION,
-                    content=self.handovers_view.create_handovers_content()
+                    content=self._tab_placeholder()
                 ),
                 ft.Tab(
                     text="Requirements",
                     icon=ft.icons.ASSIGNMENT,
-                    content=self._create_requirements_content()
+                    content=self._tab_placeholder()
                 ),
                 ft.Tab(
                     text="Issues",
                     icon=ft.icons.BUG_REPORT,
-                    content=self._create_issues_content()
+                    content=self._tab_placeholder()
                 ),
                 ft.Tab(
                     text="Test Suites",
                     icon=ft.icons.PLAY_ARROW,
-                    content=self._create_test_suites_content()
+                    content=self._tab_placeholder()
                 ),
             ],
             expand=1,
+            on_change=self._on_tab_changed,
         )
         
+        # Only the tab that is shown is built up front
+        self._load_tab(self.tabs.selected_index)
         page.add(self.tabs)
+    
+    def _tab_placeholder(self) -> ft.Control:
+        """Create the content a tab shows until it is first selected."""
+        return ft.Container(content=ft.ProgressRing(), alignment=ft.alignment.center, padding=20)
+    
+    def _load_tab(self, index: int) -> bool:
+        """
+        Build a tab's content if it isn't current.
         
-        # Update handovers list
+        Args:
+            index: Tab index
+            
+        Returns:
+            True if the content was (re)built and the page needs an update
+        """
+        if self._tab_loaded.get(index):
+            return False
+        self.tabs.tabs[index].content = self._tab_builders[index]()
+        self._tab_loaded[index] = True
+        return True
+    
+    def _on_tab_changed(self, e):
+        """Build the selected tab's content on first show or after a refresh."""
+        if self._load_tab(self.tabs.selected_index):
+            self.page.update()
+    
+    def _create_handovers_tab_content(self):
+        """Create handovers tab content with the loaded handovers listed."""
+        content = self.handovers_view.create_handovers_content()
         self.handovers_view.update_handovers_list(self.handovers)
+        return content
     
     def _create_requirements_content(self):
         """Create requirements tab content (placeholder)."""
@@ -257,8 +315,9 @@ class BMSApp:
             else ft.icons.BRIGHTNESS_4
         )
         
+        # Colors are resolved when widgets are built; the loaded data is still current
+        self._rebuild_tabs()
         self.page.update()
-        self._refresh_all_data()  # Refresh to update all colors
 
     def _current_theme(self) -> str:
         return 'dark' if (self.page and self.page.theme_mode == ft.ThemeMode.DARK) else 'light'
@@ -280,27 +339,53 @@ class BMSApp:
     
     def _export_data(self, export_type: str):
         """Export data to CSV."""
-        try:
-            if export_type == "handovers":
-                csv_content = self.export_manager.export_handovers_to_csv(self.handovers)
-            elif export_type == "requirements":
-                csv_content = self.export_manager.export_requirements_to_csv(self.requirements)
-            elif export_type == "issues":
-                csv_content = self.export_manager.export_issues_to_csv(self.issues)
-            elif export_type == "test_suites":
-                csv_content = self.export_manager.export_test_suites_to_csv(self.test_suites)
-            elif export_type == "dashboard":
-                csv_content = self.export_manager.export_dashboard_to_csv(self.dashboard_data)
-            else:
-                self._show_snackbar("Invalid export type")
-                return
-            
+        if export_type == "handovers":
+            export, data = self.export_manager.export_handovers_to_csv, self.handovers
+        elif export_type == "requirements":
+            export, data = self.export_manager.export_requirements_to_csv, self.requirements
+        elif export_type == "issues":
+            export, data = self.export_manager.export_issues_to_csv, self.issues
+        elif export_type == "test_suites":
+            export, data = self.export_manager.export_test_suites_to_csv, self.test_suites
+        elif export_type == "dashboard":
+            export, data = self.export_manager.export_dashboard_to_csv, self.dashboard_data
+        else:
+            self._show_snackbar("Invalid export type")
+            return
+        
+        def exported(csv_content: str):
             filename = self.export_manager.generate_filename(export_type)
             self._download_file(csv_content.encode('utf-8'), filename)
             self._show_snackbar(f"Exported {export_type} data successfully!")
         
-        except Exception as e:
-            self._show_snackbar(f"Export failed: {str(e)}")
+        self._run_in_background(export, exported, "Export failed", data)
+    
+    def _run_in_background(self, work: Callable[..., Any], on_done: Callable[[Any], None],
+                           error_prefix: str, *args):
+        """
+        Run blocking work on the worker thread, showing a progress bar until it finishes.
+        
+        Args:
+            work: Function doing the database, file or CPU work
+            on_done: Called with work's result once it returns
+            error_prefix: Snackbar prefix if work or on_done raises
+            *args: Arguments for work
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bms-io")
+        
+        self.page.splash = ft.ProgressBar()
+        self.page.update()
+        
+        def finished(future: Future):
+            self.page.splash = None
+            try:
+                on_done(future.result())
+            except Exception as e:
+                self._show_snackbar(f"{error_prefix}: {str(e)}")
+            self.page.update()
+        
+        self._executor.submit(work, *args).add_done_callback(finished)
     
     def _download_file(self, file_content: bytes, filename: str):
         """Trigger file download."""
@@ -327,21 +412,10 @@ class BMSApp:
         else:
             self._show_snackbar("Download cancelled")
     
-    def _refresh_all_data(self):
-        """Completely refresh all data and update all tabs."""
-        self._load_data_from_db()
-        
-        # Update all tab contents
-        self.tabs.tabs[0].content = self.dashboard_view.create_dashboard_content(self.dashboard_data)
-        self.tabs.tabs[1].content = self.handovers_view.create_handovers_content()
-        self.tabs.tabs[2].content = self._create_requirements_content()
-        self.tabs.tabs[3].content = self._create_issues_content()
-        self.tabs.tabs[4].content = self._create_test_suites_content()
-        
-        # Update handovers list
-        self.handovers_view.update_handovers_list(self.handovers)
-        
-        self.page.update()
+    def _rebuild_tabs(self):
+        """Rebuild the shown tab now and the others when next selected; the caller updates the page."""
+        self._tab_loaded = {}
+        self._load_tab(self.tabs.selected_index)
     
     def _show_snackbar(self, message: str):
         """Show snackbar message."""
@@ -376,15 +450,15 @@ class BMSApp:
         )
     
     def _update_security_settings(self, settings: Dict[str, Any]):
-        """Update security settings."""
+        """Update security settings; settings holds only the values that changed."""
         try:
             # Update compression settings
-            if settings.get('compression_enabled') != self.secure_storage.enable_compression:
-                self.secure_storage.enable_compression = settings.get('compression_enabled', True)
+            if 'compression_enabled' in settings and settings['compression_enabled'] != self.secure_storage.enable_compression:
+                self.secure_storage.enable_compression = settings['compression_enabled']
             
             # Update encryption settings
-            if settings.get('encryption_enabled') != self.secure_storage.enable_encryption:
-                self.secure_storage.enable_encryption = settings.get('encryption_enabled', True)
+            if 'encryption_enabled' in settings and settings['encryption_enabled'] != self.secure_storage.enable_encryption:
+                self.secure_storage.enable_encryption = settings['encryption_enabled']
             
             # Change password if provided
             if settings.get('password'):
@@ -701,8 +775,14 @@ class BMSApp:
             self.current_user = user
             self.is_authenticated = True
             self._show_snackbar(f"Welcome, {user.get_full_name()}!")
-            self._load_data_from_db()
-            self._create_main_ui(self.page)
+            # Another user's session may have changed the data
+            self.bms_service.invalidate_cache()
+            
+            def loaded(data: Dict[str, Any]):
+                self._apply_data(data)
+                self._create_main_ui(self.page)
+            
+            self._run_in_background(self._fetch_data, loaded, "Error loading data")
         else:
             self._show_snackbar(f"Login failed: {message}")
     
@@ -60,12 +60,15 @@ class HandoversView:
         """Update the handovers list display."""
         self.handovers_list.controls.clear()
         
+        # One theme lookup for the whole list
+        ctx = self.card_manager.begin_batch()
         for handover in handovers:
             self.handovers_list.controls.append(
                 self.card_manager.create_handover_card(
                     handover,
                     on_edit=self._show_edit_handover_dialog,
-                    on_delete=self._show_delete_handover_dialog
+                    on_delete=self._show_delete_handover_dialog,
+                    ctx=ctx
                 )
             )
         
@@ -74,7 +77,9 @@ class HandoversView:
                 ft.Text("No handovers found", style="bodyMedium", color=ft.colors.GREY)
             )
         
-        self.handovers_list.update()
+        # The list may not be on the page yet when its tab is being built
+        if self.handovers_list.page is not None:
+            self.handovers_list.update()
     
     def _create_export_button(self) -> ft.ElevatedButton:
         """Create export button."""
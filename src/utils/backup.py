@@ -6,12 +6,13 @@ import os
 import shutil
 import json
 import gzip
+import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from .encryption import EncryptionManager
-from .compression import CompressionManager, CompressionType
+from .encryption import EncryptionManager, DataIntegrityManager
+from .compression import CompressionManager, CompressionType, BEST_COMPRESSION_TYPE, COMPRESSED_SUFFIXES
 from ..config import SecurityConfig
 
 class BackupManager:
@@ -19,7 +20,7 @@ class BackupManager:
     
     def __init__(self, backup_dir: str = "backups", 
                  encryption_password: Optional[str] = None,
-                 compression_type: CompressionType = CompressionType.GZIP):
+                 compression_type: CompressionType = BEST_COMPRESSION_TYPE):
         """
         Initialize backup manager.
         
@@ -66,8 +67,9 @@ class BackupManager:
             backup_path = self.unencrypted_backups_dir / f"{base_name}.db"
         
         shutil.copy2(source_db_path, backup_path)
+        metadata_path = self._metadata_path(backup_path)
         
-        # Create metadata file
+        # Collect metadata; it is written once the final file's checksum is known
         if include_metadata:
             metadata = {
                 'backup_timestamp': datetime.now().isoformat(),
@@ -78,10 +80,6 @@ class BackupManager:
                 'file_size': os.path.getsize(backup_path),
                 'version': '1.0'
             }
-            
-            metadata_path = backup_path.with_suffix('.json')
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
         
         # Compress if requested
         if compress:
@@ -95,6 +93,12 @@ class BackupManager:
             os.remove(backup_path)  # Remove unencrypted file
             backup_path = Path(encrypted_path)
         
+        # Create metadata file
+        if include_metadata:
+            metadata['checksum'] = DataIntegrityManager.calculate_file_hash(str(backup_path))
+            with open(metadata_path, 'w') as f:
+                json.dump(metadata, f, indent=2)
+        
         return str(backup_path)
     
     def restore_backup(self, backup_path: str, 
@@ -113,7 +117,8 @@ class BackupManager:
         """
         try:
             backup_path = Path(backup_path)
-            temp_path = backup_path.with_suffix('.temp')
+            # The prefix keeps the .gz/.enc suffixes that pick the decrypt and decompress steps
+            temp_path = backup_path.with_name(f"temp_{backup_path.name}")
             
             # Copy backup to temp location
             shutil.copy2(backup_path, temp_path)
@@ -131,7 +136,7 @@ class BackupManager:
                     temp_path = Path(decrypted_path)
             
             # Decompress if needed
-            if temp_path.suffix in ['.gz', '.bz2', '.xz', '.zlib']:
+            if temp_path.suffix in COMPRESSED_SUFFIXES:
                 decompressed_path = self.compression_manager.decompress_file(str(temp_path))
                 os.remove(temp_path)
                 temp_path = Path(decompressed_path)
@@ -180,11 +185,16 @@ class BackupManager:
         backups.sort(key=lambda x: x['timestamp'], reverse=True)
         return backups
     
+    @staticmethod
+    def _metadata_path(backup_file: Path) -> Path:
+        """Get the metadata file for a backup, whatever compression/encryption suffixes it has."""
+        return backup_file.parent / f"{backup_file.name.split('.', 1)[0]}.json"
+    
     def _get_backup_info(self, backup_file: Path, encrypted: bool) -> Optional[Dict[str, Any]]:
         """Get information about a backup file."""
         try:
             # Check for metadata file
-            metadata_file = backup_file.with_suffix('.json')
+            metadata_file = self._metadata_path(backup_file)
             if metadata_file.exists():
                 with open(metadata_file, 'r') as f:
                     metadata = json.load(f)
@@ -200,7 +210,7 @@ class BackupManager:
                 'size': stat.st_size,
                 'timestamp': datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 'encrypted': encrypted,
-                'compressed': backup_file.suffix in ['.gz', '.bz2', '.xz', '.zlib'],
+                'compressed': backup_file.suffix in COMPRESSED_SUFFIXES,
                 'metadata': metadata
             }
             
@@ -223,7 +233,7 @@ class BackupManager:
             if datetime.fromtimestamp(backup_file.stat().st_mtime) < cutoff_date:
                 backup_file.unlink()
                 # Also delete metadata file
-                metadata_file = backup_file.with_suffix('.json')
+                metadata_file = self._metadata_path(backup_file)
                 if metadata_file.exists():
                     metadata_file.unlink()
                 deleted_count += 1
@@ -233,7 +243,7 @@ class BackupManager:
             if datetime.fromtimestamp(backup_file.stat().st_mtime) < cutoff_date:
                 backup_file.unlink()
                 # Also delete metadata file
-                metadata_file = backup_file.with_suffix('.json')
+                metadata_file = self._metadata_path(backup_file)
                 if metadata_file.exists():
                     metadata_file.unlink()
                 deleted_count += 1
@@ -253,7 +263,18 @@ class BackupManager:
         """
         try:
             backup_path = Path(backup_path)
-            temp_path = backup_path.with_suffix('.temp')
+            
+            # A recorded checksum rejects a damaged file before decrypting and decompressing it
+            metadata_file = self._metadata_path(backup_path)
+            if metadata_file.exists():
+                with open(metadata_file, 'r') as f:
+                    expected_checksum = json.load(f).get('checksum')
+                if expected_checksum and DataIntegrityManager.calculate_file_hash(str(backup_path)) != expected_checksum:
+                    print(f"Backup verification failed: checksum mismatch for {backup_path}")
+                    return False
+            
+            # The prefix keeps the .gz/.enc suffixes that pick the decrypt and decompress steps
+            temp_path = backup_path.with_name(f"temp_{backup_path.name}")
             
             # Copy backup to temp location
             shutil.copy2(backup_path, temp_path)
@@ -271,13 +292,12 @@ class BackupManager:
                     temp_path = Path(decrypted_path)
             
             # Decompress if needed
-            if temp_path.suffix in ['.gz', '.bz2', '.xz', '.zlib']:
+            if temp_path.suffix in COMPRESSED_SUFFIXES:
                 decompressed_path = self.compression_manager.decompress_file(str(temp_path))
                 os.remove(temp_path)
                 temp_path = Path(decompressed_path)
             
             # Verify it's a valid SQLite database
-            import sqlite3
             conn = sqlite3.connect(str(temp_path))
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
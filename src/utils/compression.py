@@ -7,17 +7,57 @@ import bz2
 import lzma
 import zlib
 import json
-from typing import Union, Optional, Dict, Any
+from typing import Union, Optional, Dict, Any, BinaryIO
 from enum import Enum
 
+try:
+    import lz4.block as lz4_block
+except ImportError:  # lz4 is optional; LZ4 is unavailable without it
+    lz4_block = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; ZSTD is unavailable without it
+    zstandard = None
+
 class CompressionType(Enum):
     """Available compression types."""
     GZIP = "gzip"
     BZIP2 = "bzip2"
     LZMA = "lzma"
     ZLIB = "zlib"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
     NONE = "none"
 
+# Fastest codec installed, for hot paths that favour speed over ratio
+FAST_COMPRESSION_TYPE = CompressionType.LZ4 if lz4_block else CompressionType.GZIP
+
+# Best ratio for the time spent among installed codecs, for cold data such as backups
+BEST_COMPRESSION_TYPE = CompressionType.ZSTD if zstandard else CompressionType.GZIP
+
+# Codec for each file extension written by compress_file
+CODEC_BY_SUFFIX = {
+    '.gz': CompressionType.GZIP,
+    '.bz2': CompressionType.BZIP2,
+    '.xz': CompressionType.LZMA,
+    '.zlib': CompressionType.ZLIB,
+    '.lz4': CompressionType.LZ4,
+    '.zst': CompressionType.ZSTD,
+}
+
+# File extensions written by compress_file
+COMPRESSED_SUFFIXES = tuple(CODEC_BY_SUFFIX)
+
+# Highest level per codec; codecs not listed accept 1-9
+MAX_COMPRESSION_LEVELS = {CompressionType.ZSTD: 22}
+
+# zstd level close to gzip -9's ratio at a fraction of its time
+ZSTD_DEFAULT_LEVEL = 8
+
+# Bytes read per step by compress_stream and decompress_stream
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
 class CompressionManager:
     """Manager for data compression and decompression operations."""
     
@@ -36,7 +76,7 @@ class CompressionManager:
         
         Args:
             data: String to compress
-            compression_level: Compression level (1-9, higher = better compression)
+            compression_level: Compression level (1-9, up to 22 for zstd; higher = better compression)
             
         Returns:
             Compressed bytes
@@ -53,7 +93,7 @@ class CompressionManager:
         
         Args:
             data: Bytes to compress
-            compression_level: Compression level (1-9, higher = better compression)
+            compression_level: Compression level (1-9, up to 22 for zstd; higher = better compression)
             
         Returns:
             Compressed bytes
@@ -64,8 +104,8 @@ class CompressionManager:
         if self.compression_type == CompressionType.NONE:
             return data
         
-        # Clamp compression level to valid range
-        compression_level = max(1, min(9, compression_level))
+        # Clamp compression level to the codec's valid range
+        compression_level = max(1, min(MAX_COMPRESSION_LEVELS.get(self.compression_type, 9), compression_level))
         
         try:
             if self.compression_type == CompressionType.GZIP:
@@ -76,6 +116,15 @@ class CompressionManager:
                 return lzma.compress(data, preset=compression_level)
             elif self.compression_type == CompressionType.ZLIB:
                 return zlib.compress(data, level=compression_level)
+            elif self.compression_type == CompressionType.LZ4:
+                if lz4_block is None:
+                    raise ValueError("lz4 is not installed")
+                return lz4_block.compress(data, mode='fast')
+            elif self.compression_type == CompressionType.ZSTD:
+                if zstandard is None:
+                    raise ValueError("zstandard is not installed")
+                # threads=-1 uses one worker per core
+                return zstandard.ZstdCompressor(level=compression_level, threads=-1).compress(data)
             else:
                 raise ValueError(f"Unsupported compression type: {self.compression_type}")
         except Exception as e:
@@ -122,11 +171,92 @@ class CompressionManager:
                 return lzma.decompress(compressed_data)
             elif self.compression_type == CompressionType.ZLIB:
                 return zlib.decompress(compressed_data)
+            elif self.compression_type == CompressionType.LZ4:
+                if lz4_block is None:
+                    raise ValueError("lz4 is not installed")
+                return lz4_block.decompress(compressed_data)
+            elif self.compression_type == CompressionType.ZSTD:
+                if zstandard is None:
+                    raise ValueError("zstandard is not installed")
+                return zstandard.ZstdDecompressor().decompressobj().decompress(compressed_data)
             else:
                 raise ValueError(f"Unsupported compression type: {self.compression_type}")
         except Exception as e:
             raise ValueError(f"Decompression failed: {str(e)}")
     
+    def compress_stream(self, source: BinaryIO, sink: BinaryIO, compression_level: int = 6,
+                        chunk_size: int = _STREAM_CHUNK_SIZE):
+        """
+        Compress a binary stream chunk by chunk, in the format compress_bytes writes.
+        
+        Args:
+            source: Readable binary stream
+            sink: Writable binary stream
+            compression_level: Compression level (1-9, up to 22 for zstd; higher = better compression)
+            chunk_size: Bytes read per step
+        """
+        try:
+            if self.compression_type == CompressionType.GZIP:
+                compressor = zlib.compressobj(compression_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            elif self.compression_type == CompressionType.BZIP2:
+                compressor = bz2.BZ2Compressor(compression_level)
+            elif self.compression_type == CompressionType.LZMA:
+                compressor = lzma.LZMACompressor(preset=compression_level)
+            elif self.compression_type == CompressionType.ZLIB:
+                compressor = zlib.compressobj(compression_level)
+            elif self.compression_type == CompressionType.ZSTD:
+                if zstandard is None:
+                    raise ValueError("zstandard is not installed")
+                compressor = zstandard.ZstdCompressor(level=compression_level, threads=-1).compressobj()
+            else:
+                # No incremental API for the lz4 block format; NONE is a plain copy
+                sink.write(self.compress_bytes(source.read(), compression_level))
+                return
+            
+            chunk = source.read(chunk_size)
+            while chunk:
+                sink.write(compressor.compress(chunk))
+                chunk = source.read(chunk_size)
+            sink.write(compressor.flush())
+        except Exception as e:
+            raise ValueError(f"Compression failed: {str(e)}")
+    
+    def decompress_stream(self, source: BinaryIO, sink: BinaryIO, chunk_size: int = _STREAM_CHUNK_SIZE):
+        """
+        Decompress a stream written by compress_stream or compress_bytes chunk by chunk.
+        
+        Args:
+            source: Readable binary stream
+            sink: Writable binary stream
+            chunk_size: Compressed bytes read per step
+        """
+        try:
+            if self.compression_type == CompressionType.GZIP:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            elif self.compression_type == CompressionType.BZIP2:
+                decompressor = bz2.BZ2Decompressor()
+            elif self.compression_type == CompressionType.LZMA:
+                decompressor = lzma.LZMADecompressor()
+            elif self.compression_type == CompressionType.ZLIB:
+                decompressor = zlib.decompressobj()
+            elif self.compression_type == CompressionType.ZSTD:
+                if zstandard is None:
+                    raise ValueError("zstandard is not installed")
+                decompressor = zstandard.ZstdDecompressor().decompressobj()
+            else:
+                sink.write(self.decompress_bytes(source.read()))
+                return
+            
+            chunk = source.read(chunk_size)
+            while chunk:
+                sink.write(decompressor.decompress(chunk))
+                chunk = source.read(chunk_size)
+            # zlib may hold back output until flushed; bz2 and lzma decompressors have no flush
+            if hasattr(decompressor, 'flush'):
+                sink.write(decompressor.flush())
+        except Exception as e:
+            raise ValueError(f"Decompression failed: {str(e)}")
+    
     def compress_dict(self, data: dict, compression_level: int = 6) -> bytes:
         """
         Compress a dictionary by converting to JSON first.
@@ -191,6 +321,9 @@ class CompressionManager:
         """
         Decompress a file.
         
+        The codec is taken from the file's extension, so files written with
+        another codec still decompress; the configured codec is the fallback.
+        
         Args:
             compressed_file_path: Path to compressed file
             output_path: Path for decompressed file (default: remove compression extension)
@@ -204,7 +337,10 @@ class CompressionManager:
         with open(compressed_file_path, 'rb') as file:
             compressed_data = file.read()
         
-        decompressed_data = self.decompress_bytes(compressed_data)
+        codec = next((codec for suffix, codec in CODEC_BY_SUFFIX.items()
+                      if compressed_file_path.endswith(suffix)), self.compression_type)
+        manager = self if codec == self.compression_type else CompressionManager(codec)
+        decompressed_data = manager.decompress_bytes(compressed_data)
         
         with open(output_path, 'wb') as file:
             file.write(decompressed_data)
@@ -218,14 +354,15 @@ class CompressionManager:
             CompressionType.BZIP2: '.bz2',
             CompressionType.LZMA: '.xz',
             CompressionType.ZLIB: '.zlib',
+            CompressionType.LZ4: '.lz4',
+            CompressionType.ZSTD: '.zst',
             CompressionType.NONE: ''
         }
         return extensions.get(self.compression_type, '.gz')
     
     def _remove_compression_extension(self, file_path: str) -> str:
         """Remove compression extension from file path."""
-        extensions = ['.gz', '.bz2', '.xz', '.zlib']
-        for ext in extensions:
+        for ext in COMPRESSED_SUFFIXES:
             if file_path.endswith(ext):
                 return file_path[:-len(ext)]
         return file_path
@@ -264,7 +401,11 @@ class CompressionManager:
         
         # Test different compression types
         results = {}
-        for comp_type in [CompressionType.GZIP, CompressionType.BZIP2, CompressionType.LZMA, CompressionType.ZLIB]:
+        comp_types = [CompressionType.GZIP, CompressionType.BZIP2, CompressionType.LZMA, CompressionType.ZLIB]
+        if lz4_block is not None:
+            comp_types.append(CompressionType.LZ4)
+        
+        for comp_type in comp_types:
             try:
                 temp_manager = CompressionManager(comp_type)
                 compressed = temp_manager.compress_bytes(data)
@@ -0,0 +1,66 @@
+"""
+Password hashing helpers with an optional argon2 backend.
+"""
+
+import hashlib
+import hmac
+import secrets
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi is optional; fall back to PBKDF2 from hashlib
+    PasswordHasher = None
+
+_PBKDF2_ITERATIONS = 100000
+_ARGON2_PREFIX = '$argon2'
+
+_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=4) if PasswordHasher else None
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password for storage.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        An argon2 hash string when argon2-cffi is installed, otherwise "salt:hash" PBKDF2
+    """
+    if _hasher is not None:
+        return _hasher.hash(password)
+    salt = secrets.token_hex(16)
+    pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'),
+                                   salt.encode('utf-8'), _PBKDF2_ITERATIONS)
+    return f"{salt}:{pwd_hash.hex()}"
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    """
+    Check a password against a stored hash in either format, in constant time.
+
+    Args:
+        stored_hash: Hash produced by hash_password
+        password: Plain text password to check
+
+    Returns:
+        True if the password matches
+    """
+    if not stored_hash:
+        return False
+
+    if stored_hash.startswith(_ARGON2_PREFIX):
+        if _hasher is None:
+            print("Cannot verify argon2 password hash: argon2-cffi is not installed")
+            return False
+        try:
+            return _hasher.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    try:
+        salt, expected = stored_hash.split(':')
+    except ValueError:
+        return False
+    pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'),
+                                   salt.encode('utf-8'), _PBKDF2_ITERATIONS)
+    return hmac.compare_digest(pwd_hash.hex(), expected)
@@ -5,12 +5,72 @@ Encryption and decryption utilities for secure data storage.
 import base64
 import hashlib
 import os
+import struct
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Union, Optional
+from functools import lru_cache
+from typing import BinaryIO, Tuple, Union, Optional
 import json
 
+from .parallel import parallel_map
+
+# First byte of payloads produced by encrypt_bytes. Fernet tokens always start with 0x80.
+_AEAD_VERSION = b'\x01'
+_NONCE_SIZE = 12
+
+# Files written by encrypt_stream: version byte, chunk size, then an 8-byte nonce prefix.
+# Each chunk is sealed with nonce = prefix || counter and AAD marking the final chunk.
+_STREAM_VERSION = b'\x02'
+_STREAM_HEADER = struct.Struct('>I8s')
+_STREAM_CHUNK_SIZE = 1024 * 1024
+_TAG_SIZE = 16
+
+# Checksums written before BLAKE2b were SHA-256 hex digests
+_SHA256_HEX_LENGTH = 64
+
+# File checksums hash fixed-size chunks independently, then hash the chunk digests
+_FILE_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+@lru_cache(maxsize=8)
+def _derive_ciphers(password: str) -> Tuple[bytes, Fernet, AESGCM]:
+    """
+    Derive the Fernet key and create both cipher objects for a password.
+    
+    PBKDF2 dominates construction time, and the services each build their own
+    EncryptionManager, so results are cached. The cipher objects are stateless
+    and safe to share.
+    
+    Args:
+        password: Encryption password
+        
+    Returns:
+        Tuple of (urlsafe base64 Fernet key, Fernet cipher, AES-GCM cipher)
+    """
+    # Use a fixed salt for consistency (in production, store salt separately)
+    salt = b'bms_salt_2024'  # In production, generate and store unique salt
+    
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    raw_key = kdf.derive(password.encode())
+    
+    # Separate key for the AEAD cipher so it never shares key material with Fernet
+    aead_key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b'bms-aesgcm',
+    ).derive(raw_key)
+    
+    key = base64.urlsafe_b64encode(raw_key)
+    return key, Fernet(key), AESGCM(aead_key)
+
 class EncryptionManager:
     """Manager for data encryption and decryption operations."""
     
@@ -22,8 +82,11 @@ class EncryptionManager:
             password: Password for encryption. If None, will use default or generate key.
         """
         self.password = password or self._get_default_password()
-        self.key = self._derive_key(self.password)
-        self.cipher = Fernet(self.key)
+        self._init_ciphers()
+    
+    def _init_ciphers(self):
+        """Get the keys and cipher objects for the current password, derived once per password."""
+        self.key, self.cipher, self.aead = _derive_ciphers(self.password)
     
     def _get_default_password(self) -> str:
         """Get default password from environment or generate one."""
@@ -40,17 +103,7 @@ class EncryptionManager:
     
     def _derive_key(self, password: str) -> bytes:
         """Derive encryption key from password using PBKDF2."""
-        # Use a fixed salt for consistency (in production, store salt separately)
-        salt = b'bms_salt_2024'  # In production, generate and store unique salt
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+        return _derive_ciphers(password)[0]
     
     def encrypt_string(self, plaintext: str) -> str:
         """
@@ -65,7 +118,7 @@ class EncryptionManager:
         if not plaintext:
             return ""
         
-        encrypted_bytes = self.cipher.encrypt(plaintext.encode('utf-8'))
+        encrypted_bytes = self.encrypt_bytes(plaintext.encode('utf-8'))
         return base64.urlsafe_b64encode(encrypted_bytes).decode('utf-8')
     
     def decrypt_string(self, encrypted_text: str) -> str:
@@ -83,11 +136,95 @@ class EncryptionManager:
         
         try:
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_text.encode('utf-8'))
-            decrypted_bytes = self.cipher.decrypt(encrypted_bytes)
+            decrypted_bytes = self.decrypt_bytes(encrypted_bytes)
             return decrypted_bytes.decode('utf-8')
         except Exception as e:
             raise ValueError(f"Failed to decrypt string: {str(e)}")
     
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt bytes with AES-GCM.
+        
+        Args:
+            data: Bytes to encrypt
+            
+        Returns:
+            Version byte, nonce and ciphertext with authentication tag
+        """
+        nonce = os.urandom(_NONCE_SIZE)
+        return _AEAD_VERSION + nonce + self.aead.encrypt(nonce, data, None)
+    
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt bytes produced by encrypt_bytes, or a raw Fernet token.
+        
+        Args:
+            encrypted_data: Encrypted bytes
+            
+        Returns:
+            Decrypted bytes
+        """
+        try:
+            if encrypted_data[:1] == _AEAD_VERSION:
+                nonce = encrypted_data[1:1 + _NONCE_SIZE]
+                return self.aead.decrypt(nonce, encrypted_data[1 + _NONCE_SIZE:], None)
+            return self.cipher.decrypt(encrypted_data)
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt bytes: {str(e)}")
+    
+    def encrypt_stream(self, source: BinaryIO, sink: BinaryIO, chunk_size: int = _STREAM_CHUNK_SIZE):
+        """
+        Encrypt a binary stream chunk by chunk with AES-GCM, using constant memory.
+        
+        Args:
+            source: Readable binary stream
+            sink: Writable binary stream
+            chunk_size: Plaintext bytes per chunk
+        """
+        nonce_prefix = os.urandom(8)
+        sink.write(_STREAM_VERSION + _STREAM_HEADER.pack(chunk_size, nonce_prefix))
+        
+        counter = 0
+        chunk = source.read(chunk_size)
+        while True:
+            next_chunk = source.read(chunk_size)
+            final = not next_chunk
+            nonce = nonce_prefix + struct.pack('>I', counter)
+            sink.write(self.aead.encrypt(nonce, chunk, b'\x01' if final else b'\x00'))
+            if final:
+                return
+            chunk = next_chunk
+            counter += 1
+    
+    def decrypt_stream(self, source: BinaryIO, sink: BinaryIO):
+        """
+        Decrypt a stream written by encrypt_stream, using constant memory.
+        
+        Args:
+            source: Readable binary stream positioned at the version byte
+            sink: Writable binary stream
+        """
+        if source.read(1) != _STREAM_VERSION:
+            raise ValueError("Not an encrypted stream")
+        
+        chunk_size, nonce_prefix = _STREAM_HEADER.unpack(source.read(_STREAM_HEADER.size))
+        sealed_size = chunk_size + _TAG_SIZE
+        
+        try:
+            counter = 0
+            sealed = source.read(sealed_size)
+            while True:
+                next_sealed = source.read(sealed_size)
+                final = not next_sealed
+                nonce = nonce_prefix + struct.pack('>I', counter)
+                sink.write(self.aead.decrypt(nonce, sealed, b'\x01' if final else b'\x00'))
+                if final:
+                    return
+                sealed = next_sealed
+                counter += 1
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt stream: {str(e)}")
+    
     def encrypt_dict(self, data: dict) -> str:
         """
         Encrypt a dictionary by converting to JSON first.
@@ -137,13 +274,8 @@ class EncryptionManager:
         if not output_path:
             output_path = f"{file_path}.enc"
         
-        with open(file_path, 'rb') as file:
-            file_data = file.read()
-        
-        encrypted_data = self.cipher.encrypt(file_data)
-        
-        with open(output_path, 'wb') as file:
-            file.write(encrypted_data)
+        with open(file_path, 'rb') as source, open(output_path, 'wb') as sink:
+            self.encrypt_stream(source, sink)
         
         return output_path
     
@@ -164,13 +296,14 @@ class EncryptionManager:
             else:
                 output_path = f"{encrypted_file_path}.dec"
         
-        with open(encrypted_file_path, 'rb') as file:
-            encrypted_data = file.read()
-        
-        decrypted_data = self.cipher.decrypt(encrypted_data)
-        
-        with open(output_path, 'wb') as file:
-            file.write(decrypted_data)
+        with open(encrypted_file_path, 'rb') as source, open(output_path, 'wb') as sink:
+            if source.read(1) == _STREAM_VERSION:
+                source.seek(0)
+                self.decrypt_stream(source, sink)
+            else:
+                # Files encrypted whole, before streaming was introduced
+                source.seek(0)
+                sink.write(self.decrypt_bytes(source.read()))
         
         return output_path
     
@@ -181,8 +314,7 @@ class EncryptionManager:
     def change_password(self, new_password: str):
         """Change encryption password."""
         self.password = new_password
-        self.key = self._derive_key(self.password)
-        self.cipher = Fernet(self.key)
+        self._init_ciphers()
     
     def verify_encryption(self, plaintext: str) -> bool:
         """Verify that encryption/decryption works correctly."""
@@ -198,14 +330,47 @@ class DataIntegrityManager:
     
     @staticmethod
     def calculate_hash(data: Union[str, bytes]) -> str:
-        """Calculate SHA-256 hash of data."""
+        """Calculate 128-bit BLAKE2b hash of data."""
         if isinstance(data, str):
             data = data.encode('utf-8')
-        return hashlib.sha256(data).hexdigest()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def calculate_file_hash(file_path: str, max_workers: Optional[int] = None) -> str:
+        """
+        Calculate a 128-bit BLAKE2b checksum of a file, hashing its chunks concurrently.
+        
+        Each worker reads and hashes its own chunk, so disk reads overlap with
+        hashing (hashlib releases the GIL). The result is the hash of the
+        ordered chunk digests, so it is only comparable with other values from
+        this method.
+        
+        Args:
+            file_path: Path to the file
+            max_workers: Maximum number of worker threads (default: CPU count)
+            
+        Returns:
+            Hex digest of the file
+        """
+        size = os.path.getsize(file_path)
+        
+        def hash_chunk(offset: int) -> bytes:
+            with open(file_path, 'rb') as f:
+                f.seek(offset)
+                return hashlib.blake2b(f.read(_FILE_HASH_CHUNK_SIZE), digest_size=16).digest()
+        
+        digests = parallel_map(hash_chunk, range(0, size or 1, _FILE_HASH_CHUNK_SIZE),
+                               max_workers=max_workers)
+        return hashlib.blake2b(b''.join(digests), digest_size=16).hexdigest()
     
     @staticmethod
     def verify_hash(data: Union[str, bytes], expected_hash: str) -> bool:
-        """Verify data integrity using hash."""
+        """Verify data integrity using hash (SHA-256 hashes from older records are still accepted)."""
+        if len(expected_hash) == _SHA256_HEX_LENGTH:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            return hashlib.sha256(data).hexdigest() == expected_hash
+        
         calculated_hash = DataIntegrityManager.calculate_hash(data)
         return calculated_hash == expected_hash
     
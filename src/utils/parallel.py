@@ -0,0 +1,37 @@
+"""
+Parallel execution helpers for CPU-bound work that releases the GIL.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+def parallel_map(func: Callable[[T], R], items: Iterable[T],
+                 min_items: int = 4, max_workers: Optional[int] = None) -> List[R]:
+    """
+    Apply a function to every item using a thread pool, preserving order.
+
+    Compression (zlib, bz2, lzma) and encryption (OpenSSL) release the GIL, so
+    threads give real parallelism for them. Small batches run serially because
+    starting a pool costs more than it saves.
+
+    Args:
+        func: Function to apply to each item
+        items: Items to process
+        min_items: Minimum number of items before a thread pool is used
+        max_workers: Maximum number of worker threads (default: CPU count)
+
+    Returns:
+        List of results in the same order as the items
+    """
+    items = list(items)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+
+    if len(items) < min_items or workers < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
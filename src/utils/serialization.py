@@ -0,0 +1,49 @@
+"""
+JSON serialization helpers with an optional fast backend.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+def dumps(data: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Args:
+        data: Data to serialize
+        sort_keys: Sort object keys, so equal dicts always give the same bytes
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # Types orjson rejects (e.g. integers wider than 64 bits) go through json below
+            pass
+    return json.dumps(data, ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON text or UTF-8 bytes.
+
+    Args:
+        data: JSON string or bytes
+
+    Returns:
+        Deserialized data
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,57 @@
+"""
+Test script to verify backups restore when the backup manager uses another codec.
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.utils.backup import BackupManager
+from src.utils.compression import CompressionType
+
+def _make_database(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        for table in ('handovers', 'requirements', 'issues', 'test_suites'):
+            conn.execute(f'CREATE TABLE {table} (id INTEGER PRIMARY KEY, title TEXT)')
+        conn.execute("INSERT INTO handovers (title) VALUES ('Shift notes')")
+        conn.commit()
+    finally:
+        conn.close()
+
+def test_restore_gzip_backup_with_other_codec():
+    """Test that a .gz backup verifies and restores from a manager configured for bzip2."""
+    print("🧪 Testing Cross-Codec Backup Restore")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_db = os.path.join(tmp_dir, "source.db")
+        _make_database(source_db)
+
+        for password in (None, "test-password"):
+            backup_dir = os.path.join(tmp_dir, f"backups_{bool(password)}")
+            writer = BackupManager(backup_dir, encryption_password=password,
+                                   compression_type=CompressionType.GZIP)
+            backup_path = writer.create_backup(source_db, encrypt=bool(password))
+            assert '.gz' in backup_path
+
+            reader = BackupManager(backup_dir, encryption_password=password,
+                                   compression_type=CompressionType.BZIP2)
+            assert reader.verify_backup(backup_path)
+
+            target_db = os.path.join(tmp_dir, f"restored_{bool(password)}.db")
+            assert reader.restore_backup(backup_path, target_db)
+            conn = sqlite3.connect(target_db)
+            try:
+                assert conn.execute('SELECT title FROM handovers').fetchall() == [('Shift notes',)]
+            finally:
+                conn.close()
+
+            # Restoring leaves no temp copies behind to be listed as backups
+            assert [b['file_path'] for b in reader.list_backups()] == [backup_path]
+            print(f"   ✅ {'Encrypted' if password else 'Plain'} .gz backup restored with bzip2 configured")
+
+if __name__ == "__main__":
+    test_restore_gzip_backup_with_other_codec()
@@ -0,0 +1,64 @@
+"""
+Test script to verify the notification dialog is reused and reset between opens.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.ui.components.auth import AuthManager
+from src.models.user import User
+
+class _FakePage:
+    """Page stand-in: dialogs are never mounted, so only page.update() is called."""
+    dialog = None
+    theme_mode = None
+
+    def update(self):
+        pass
+
+class _ChangeEvent:
+    def __init__(self, control):
+        self.control = control
+
+def _toggle(checkbox):
+    checkbox.value = not checkbox.value
+    checkbox.on_change(_ChangeEvent(checkbox))
+
+def test_reopened_dialog_keeps_its_controls():
+    """Test that reopening for the same users shows the same dialog with a fresh selection."""
+    print("🧪 Testing Notification Dialog Reuse")
+    print("=" * 50)
+
+    users = [User("alice", "alice@example.com", email_verified=True),
+             User("bob", "bob@example.com", email_verified=True)]
+    sent = []
+    page = _FakePage()
+    manager = AuthManager(page, lambda message: None)
+
+    manager.show_notification_dialog(on_send=sent.append, users_list=users)
+    dialog = page.dialog
+    subject_field = dialog.content.content.controls[0].content.content.controls[2]
+    select_all, recipient_count, _, _, first_user, _ = dialog.content.content.controls[2] \
+        .content.content.controls[2].content.controls
+    # Unmounted controls can't update themselves
+    select_all.update = recipient_count.update = lambda: None
+
+    _toggle(first_user)
+    subject_field.value = "Draft"
+    manager.close_dialog(dialog)
+
+    manager.show_notification_dialog(on_send=sent.append, users_list=users)
+    assert page.dialog is dialog
+    assert first_user.value is True and select_all.value is True
+    assert recipient_count.value == "Recipients: 2 users selected"
+    assert subject_field.value == ""
+    print("   ✅ Same dialog, with the form reset")
+
+    _toggle(first_user)
+    assert select_all.value is False
+    assert recipient_count.value == "Recipients: 1 user selected"
+    print("   ✅ Checkboxes still respond after reopening")
+
+if __name__ == "__main__":
+    test_reopened_dialog_keeps_its_controls()
@@ -0,0 +1,169 @@
+"""
+Test script to verify the secure database storage format.
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.services.secure_database import SecureDatabaseManager
+from src.utils.encryption import DataIntegrityManager
+from src.config import SecurityConfig
+
+def _make_secure_db(tmp_dir):
+    return SecureDatabaseManager(os.path.join(tmp_dir, "secure_test.db"), "test-password")
+
+def test_header_round_trip():
+    """Test that every security combination round-trips through the header byte."""
+    print("🧪 Testing Secure Data Header Format")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        secure_db = _make_secure_db(tmp_dir)
+        sample = {"handovers": [{"id": 1, "description": "Überprüfung"}]}
+
+        for encryption in (False, True):
+            for compression in (False, True):
+                secure_db.enable_encryption = encryption
+                secure_db.enable_compression = compression
+                secured, checksum = secure_db._secure_data(sample)
+
+                assert isinstance(secured, bytes)
+                assert not secure_db._is_legacy_value(secured)
+                assert secure_db._unsecure_data(secured) == sample
+                assert checksum == DataIntegrityManager.calculate_hash(secured)
+                if encryption:
+                    # AES-GCM payloads carry their own version byte after the header
+                    assert secured[1:2] == b"\x01"
+                print(f"   ✅ encryption={encryption}, compression={compression}")
+
+        assert secure_db._unsecure_data(secure_db._secure_data("light")[0]) == "light"
+
+        # Records encrypted with Fernet before AES-GCM still decrypt
+        fernet_value = bytes([0x01]) + secure_db.encryption_manager.cipher.encrypt(b'"dark"')
+        assert secure_db._unsecure_data(fernet_value) == "dark"
+
+def test_legacy_values_are_upgraded():
+    """Test that values written before the header byte are read and re-written."""
+    print("🧪 Testing Legacy Value Upgrade")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        secure_db = _make_secure_db(tmp_dir)
+        secure_db.save_app_data({"issues": []})
+
+        # Legacy format: JSON text encrypted with Fernet and base64 encoded
+        legacy_value = secure_db.encryption_manager.encrypt_string('[{"id": 7}]')
+        with secure_db._get_connection_with_retry() as conn:
+            conn.execute('UPDATE app_data SET value = ? WHERE key = ?', (legacy_value, "issues"))
+
+        assert secure_db.load_app_data()["issues"] == [{"id": 7}]
+
+        with secure_db._get_connection_with_retry() as conn:
+            stored = conn.execute('SELECT value FROM app_data WHERE key = ?', ("issues",)).fetchone()[0]
+
+        assert not secure_db._is_legacy_value(stored)
+        assert secure_db.load_app_data()["issues"] == [{"id": 7}]
+        print("   ✅ Legacy value upgraded to header format")
+
+def test_integrity_uses_stored_bytes():
+    """Test that metadata checksums are verified against the stored bytes."""
+    print("🧪 Testing Stored-Bytes Integrity Check")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        secure_db = _make_secure_db(tmp_dir)
+        secure_db.save_app_data({"requirements": [{"id": 1, "title": "Checksum"}]})
+
+        with secure_db._get_connection_with_retry() as conn:
+            stored = conn.execute('SELECT value FROM app_data WHERE key = ?', ("requirements",)).fetchone()[0]
+
+        assert secure_db._verify_data_integrity("app_data_requirements", stored)
+        assert not secure_db._verify_data_integrity("app_data_requirements", stored + b"tampered")
+        print("   ✅ Checksum matches stored bytes and detects tampering")
+
+        # Cached checksums follow later saves
+        secure_db.save_app_data({"requirements": [{"id": 2, "title": "Updated"}]})
+        with secure_db._get_connection_with_retry() as conn:
+            stored = conn.execute('SELECT value FROM app_data WHERE key = ?', ("requirements",)).fetchone()[0]
+
+        assert secure_db._verify_data_integrity("app_data_requirements", stored)
+        print("   ✅ Cached checksum updated on save")
+
+def test_binary_backup_round_trip():
+    """Test that backups are binary database snapshots that restore in place."""
+    print("🧪 Testing Binary Backup Format")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        secure_db = _make_secure_db(tmp_dir)
+        app_data = {"handovers": [{"id": 1, "title": "Shift"}], "theme_mode": "dark"}
+        secure_db.save_app_data(app_data)
+
+        settings = (SecurityConfig.BACKUP_COMPRESSION, SecurityConfig.BACKUP_ENCRYPTION)
+        try:
+            for compression in (False, True):
+                for encryption in (False, True):
+                    SecurityConfig.BACKUP_COMPRESSION = compression
+                    SecurityConfig.BACKUP_ENCRYPTION = encryption
+                    backup_path = secure_db.backup_database(os.path.join(tmp_dir, "backup.bms"))
+                    with open(backup_path, 'rb') as f:
+                        assert f.read(4) == b"BMSB"
+
+                    secure_db.clear_all_data()
+                    assert secure_db.restore_database(backup_path)
+                    assert secure_db.load_app_data()["handovers"] == app_data["handovers"]
+        finally:
+            SecurityConfig.BACKUP_COMPRESSION, SecurityConfig.BACKUP_ENCRYPTION = settings
+        print("   ✅ Streamed backups restored for every setting")
+
+        # Version 2 backups hold one compressed and encrypted buffer
+        snapshot_path = os.path.join(tmp_dir, "snapshot.sqlite")
+        snapshot = sqlite3.connect(snapshot_path)
+        with secure_db._get_connection_with_retry() as conn:
+            conn.backup(snapshot)
+        snapshot.close()
+        with open(snapshot_path, 'rb') as f:
+            payload = secure_db.encryption_manager.encrypt_bytes(
+                secure_db.compression_manager.compress_bytes(f.read()))
+        with open(backup_path, 'wb') as f:
+            f.write(b"BMSB" + bytes([2, 0x03]) + payload)
+
+        secure_db.clear_all_data()
+        assert secure_db.restore_database(backup_path)
+        assert secure_db.load_app_data()["handovers"] == app_data["handovers"]
+        print("   ✅ Older in-memory backups still restore")
+
+def test_security_settings_rewrite_only_changed_rows():
+    """Test that changing security settings re-secures only mismatched rows."""
+    print("🧪 Testing Security Settings Update")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        secure_db = _make_secure_db(tmp_dir)
+        app_data = {"issues": [{"id": 3}], "theme_mode": "dark"}
+        secure_db.save_app_data(app_data)
+
+        def stored_values():
+            with secure_db._get_connection_with_retry() as conn:
+                return dict(conn.execute('SELECT key, value FROM app_data').fetchall())
+
+        before = stored_values()
+        assert secure_db.update_security_settings(encryption=secure_db.enable_encryption)
+        assert stored_values() == before
+        print("   ✅ Unchanged settings leave rows untouched")
+
+        assert secure_db.update_security_settings(encryption=not secure_db.enable_encryption)
+        after = stored_values()
+        assert all(after[key] != before[key] for key in before)
+        assert secure_db.load_app_data() == app_data
+        print("   ✅ Changed settings re-secure every row")
+
+if __name__ == "__main__":
+    test_header_round_trip()
+    test_legacy_values_are_upgraded()
+    test_integrity_uses_stored_bytes()
+    test_binary_backup_round_trip()
+    test_security_settings_rewrite_only_changed_rows()